@@ -322,6 +322,21 @@ export class FoundationStack extends cdk.Stack {
       projectionType: dynamodb.ProjectionType.ALL,
     });
 
+    // Time-based GSI (same layout as the usage table's `date-index`): lets
+    // time-range violation queries Query day partitions instead of Scanning.
+    this.guardrailTable.addGlobalSecondaryIndex({
+      indexName: 'date-index',
+      partitionKey: {
+        name: 'date_partition',
+        type: dynamodb.AttributeType.STRING,
+      },
+      sortKey: {
+        name: 'timestamp',
+        type: dynamodb.AttributeType.STRING,
+      },
+      projectionType: dynamodb.ProjectionType.ALL,
+    });
+
     // Prompt templates table
     this.promptTemplatesTable = new dynamodb.Table(this, 'PromptTemplatesTable', {
       tableName: config.promptTemplatesTableName,
@@ -10,11 +10,10 @@ import os
 from datetime import datetime
 from typing import List, Optional
 
-import boto3
-from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from app.models.feedback import FeedbackRecord, FeedbackStats
+from app.storage._client import default_region, get_ddb_client
 
 logger = logging.getLogger(__name__)
 
@@ -36,20 +35,15 @@ class FeedbackRepository:
         
         Args:
             table_name: DynamoDB table name (defaults to FEEDBACK_TABLE_NAME env var)
-            region: AWS region (defaults to AWS_REGION env var)
+            region: AWS region (defaults to default_region())
         """
         self.table_name = table_name or os.environ.get(
             "FEEDBACK_TABLE_NAME", "agentcore-feedback"
         )
-        self.region = region or os.environ.get("AWS_REGION", "us-east-1")
+        self.region = region or default_region()
         
-        # Configure boto3 client with retry settings
-        boto_config = Config(
-            region_name=self.region,
-            retries={"max_attempts": 3, "mode": "adaptive"},
-        )
-        
-        self._client = boto3.client("dynamodb", config=boto_config)
+        # Shared client (one connection pool per region)
+        self._client = get_ddb_client(self.region)
 
     async def get_all_feedback(
         self,
@@ -71,9 +65,7 @@ class FeedbackRepository:
             List of feedback records within the time range, sorted by timestamp descending
         """
         try:
-            loop = asyncio.get_event_loop()
-            items = await loop.run_in_executor(
-                None,
+            items = await asyncio.to_thread(
                 self._scan_with_filters,
                 start_time.isoformat(),
                 end_time.isoformat(),
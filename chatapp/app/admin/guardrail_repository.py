@@ -12,11 +12,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Optional
 
-import boto3
-from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from app.models.guardrail import GuardrailRecord
+from app.storage._client import default_region, get_ddb_client
 
 logger = logging.getLogger(__name__)
 
@@ -74,20 +73,15 @@ class GuardrailRepository:
         
         Args:
             table_name: DynamoDB table name (defaults to GUARDRAIL_TABLE_NAME env var)
-            region: AWS region (defaults to AWS_REGION env var)
+            region: AWS region (defaults to default_region())
         """
         self.table_name = table_name or os.environ.get(
             "GUARDRAIL_TABLE_NAME", "agentcore-guardrail-violations"
         )
-        self.region = region or os.environ.get("AWS_REGION", "us-east-1")
+        self.region = region or default_region()
         
-        # Configure boto3 client with retry settings
-        boto_config = Config(
-            region_name=self.region,
-            retries={"max_attempts": 3, "mode": "adaptive"},
-        )
-        
-        self._client = boto3.client("dynamodb", config=boto_config)
+        # Shared client (one connection pool per region)
+        self._client = get_ddb_client(self.region)
 
     async def get_all_records(
         self,
@@ -106,9 +100,7 @@ class GuardrailRepository:
             List of guardrail records within the time range
         """
         try:
-            loop = asyncio.get_event_loop()
-            items = await loop.run_in_executor(
-                None,
+            items = await asyncio.to_thread(
                 self._scan_by_time_range,
                 start_time.isoformat(),
                 end_time.isoformat(),
@@ -11,8 +11,6 @@ from collections import defaultdict
 from datetime import datetime
 from typing import Dict, List, Optional
 
-import boto3
-from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from app.models.usage import (
@@ -23,6 +21,7 @@ from app.models.usage import (
     ToolAnalytics,
 )
 from app.admin.cost_calculator import CostCalculator
+from app.storage._client import default_region, get_ddb_client
 
 logger = logging.getLogger(__name__)
 
@@ -61,22 +60,17 @@ class UsageRepository:
         
         Args:
             table_name: DynamoDB table name (defaults to USAGE_TABLE_NAME env var)
-            region: AWS region (defaults to AWS_REGION env var)
+            region: AWS region (defaults to default_region())
             cost_calculator: Optional CostCalculator instance
         """
         self.table_name = table_name or os.environ.get(
             "USAGE_TABLE_NAME", "agentcore-usage-records"
         )
-        self.region = region or os.environ.get("AWS_REGION", "us-east-1")
+        self.region = region or default_region()
         self.cost_calculator = cost_calculator or CostCalculator()
         
-        # Configure boto3 client with retry settings
-        boto_config = Config(
-            region_name=self.region,
-            retries={"max_attempts": 3, "mode": "adaptive"},
-        )
-        
-        self._client = boto3.client("dynamodb", config=boto_config)
+        # Shared client (one connection pool per region)
+        self._client = get_ddb_client(self.region)
 
 
     async def get_all_records(
@@ -103,13 +97,11 @@ class UsageRepository:
             return cached[1]
 
         try:
-            loop = asyncio.get_event_loop()
             # Prefer the time-based `date-index` GSI: Query a small set of day
             # partitions for the range instead of scanning the whole table.
             items: List[dict] = []
             try:
-                items = await loop.run_in_executor(
-                    None,
+                items = await asyncio.to_thread(
                     self._query_by_date_range,
                     start_time,
                     end_time,
@@ -128,8 +120,7 @@ class UsageRepository:
             # also covers legacy records written before `date_partition`
             # existed (a no-op extra call when the table is simply empty).
             if not items:
-                items = await loop.run_in_executor(
-                    None,
+                items = await asyncio.to_thread(
                     self._scan_by_time_range,
                     start_time.isoformat(),
                     end_time.isoformat(),
@@ -621,9 +612,7 @@ class UsageRepository:
             List of usage records for the user within the range
         """
         try:
-            loop = asyncio.get_event_loop()
-            items = await loop.run_in_executor(
-                None,
+            items = await asyncio.to_thread(
                 self._query_by_user_sync,
                 user_id,
                 start_time.isoformat(),
@@ -684,9 +673,7 @@ class UsageRepository:
             List of usage records for the session
         """
         try:
-            loop = asyncio.get_event_loop()
-            items = await loop.run_in_executor(
-                None,
+            items = await asyncio.to_thread(
                 self._query_by_session_sync,
                 session_id,
             )
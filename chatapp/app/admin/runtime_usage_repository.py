@@ -13,10 +13,10 @@ from decimal import Decimal
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 
-import boto3
-from botocore.config import Config
 from botocore.exceptions import ClientError
 
+from app.storage._client import default_region, get_ddb_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,7 +25,8 @@ VCPU_HOUR_RATE = Decimal("0.0895")  # per vCPU-hour
 MEMORY_GB_HOUR_RATE = Decimal("0.00945")  # per GB-hour
 
 # Number of parallel segments used when scanning the (potentially large)
-# runtime usage table. Keep <= the boto3 connection pool size below.
+# runtime usage table. Keep <= the shared client's connection pool
+# (BOTO_MAX_POOL_CONNECTIONS).
 _SCAN_SEGMENTS = 16
 
 # Short-TTL cache for range scans of the runtime table. The admin pages
@@ -133,7 +134,7 @@ class RuntimeUsageRepository:
         
         Args:
             table_name: DynamoDB table name (defaults to config or env var)
-            region: AWS region (defaults to AWS_REGION env var)
+            region: AWS region (defaults to default_region())
         """
         if table_name:
             self.table_name = table_name
@@ -148,16 +149,10 @@ class RuntimeUsageRepository:
                     "RUNTIME_USAGE_TABLE_NAME", "agentcore-runtime-usage"
                 )
         
-        self.region = region or os.environ.get("AWS_REGION", "us-east-1")
-        
-        boto_config = Config(
-            region_name=self.region,
-            retries={"max_attempts": 3, "mode": "adaptive"},
-            # Allow enough pooled connections for the parallel segmented scan.
-            max_pool_connections=_SCAN_SEGMENTS + 2,
-        )
+        self.region = region or default_region()
         
-        self._client = boto3.client("dynamodb", config=boto_config)
+        # Shared client (one connection pool per region)
+        self._client = get_ddb_client(self.region)
     
     def calculate_runtime_cost(
         self,
@@ -207,11 +202,9 @@ class RuntimeUsageRepository:
         try:
             start_ms = int(start_time.timestamp() * 1000)
             end_ms = int(end_time.timestamp() * 1000)
-            loop = asyncio.get_event_loop()
             segment_results = await asyncio.gather(
                 *[
-                    loop.run_in_executor(
-                        None,
+                    asyncio.to_thread(
                         self._scan_segment,
                         start_ms,
                         end_ms,
@@ -419,9 +412,7 @@ class RuntimeUsageRepository:
             SessionRuntimeStats or None if no records found
         """
         try:
-            loop = asyncio.get_event_loop()
-            items = await loop.run_in_executor(
-                None,
+            items = await asyncio.to_thread(
                 self._query_by_session_sync,
                 session_id,
             )
@@ -6,8 +6,11 @@ from the AgentCore Runtime and converting them to typed SSE events.
 
 import asyncio
 import json
+import os
 import re
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import AsyncGenerator, Generator, Optional, Dict, Any
 
 import boto3
@@ -27,6 +30,20 @@ from app.models.events import (
 )
 
 
+@lru_cache(maxsize=1)
+def _stream_executor() -> ThreadPoolExecutor:
+    """Return the thread pool that drives AgentCore response streams.
+    
+    Each stream pins a thread for the whole response, so streams get their
+    own pool rather than the default executor. Short DynamoDB and AWS calls
+    (asyncio.to_thread) then never queue behind long-running chats.
+    """
+    return ThreadPoolExecutor(
+        max_workers=int(os.environ.get("STREAM_THREAD_POOL_SIZE", "64")),
+        thread_name_prefix="agentcore-stream",
+    )
+
+
 class ThinkingFilter:
     """Stateful filter for removing <thinking> tags and tool XML from streamed content.
     
@@ -402,7 +419,7 @@ class AgentCoreClient:
                 loop.call_soon_threadsafe(queue.put_nowait, _DONE)
 
         # Keep a reference so the executor future isn't GC'd mid-flight.
-        pump_future = loop.run_in_executor(None, _pump)
+        pump_future = loop.run_in_executor(_stream_executor(), _pump)
         try:
             while True:
                 item = await queue.get()
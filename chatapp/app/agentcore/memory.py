@@ -4,6 +4,7 @@ This module provides the MemoryClient class for fetching event and semantic
 memory from AgentCore Memory service.
 """
 
+import asyncio
 import json
 import logging
 from dataclasses import dataclass
@@ -54,6 +55,10 @@ def _format_event_content(raw_text, default_role):
 
 logger = logging.getLogger(__name__)
 
+# Semantic memory types with a known namespace layout (also the types the
+# /api/memory/semantic route accepts)
+SEMANTIC_MEMORY_TYPES = frozenset({"facts", "summaries", "preferences"})
+
 
 def _format_event_content(raw_text, default_role):
     """Unwrap a stored Strands message envelope into (role, display_text).
@@ -92,7 +97,7 @@ def _format_event_content(raw_text, default_role):
     return role, "\n\n".join(texts).strip()
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryEvent:
     """Event memory record from conversation history.
     
@@ -106,9 +111,21 @@ class MemoryEvent:
     role: str
     content: str
     timestamp: str
+    
+    def to_dict(self) -> dict:
+        """Convert to the API response shape.
+        
+        Returns:
+            Dictionary with role, content, and timestamp
+        """
+        return {
+            "role": self.role,
+            "content": self.content,
+            "timestamp": self.timestamp,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class SemanticFact:
     """Semantic memory fact extracted from conversations.
     
@@ -122,9 +139,22 @@ class SemanticFact:
     content: str
     confidence: Optional[float]
     timestamp: str
+    
+    def to_dict(self) -> dict:
+        """Convert to the API response shape.
+        
+        Returns:
+            Dictionary with id, content, confidence, and createdAt
+        """
+        return {
+            "id": self.fact_id,
+            "content": self.content,
+            "confidence": self.confidence,
+            "createdAt": self.timestamp,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class EpisodicMemory:
     """Episodic memory record capturing a structured interaction episode.
 
@@ -137,6 +167,18 @@ class EpisodicMemory:
     content: str
     timestamp: str
 
+    def to_dict(self) -> dict:
+        """Convert to the API response shape.
+
+        Returns:
+            Dictionary with id, content, and createdAt
+        """
+        return {
+            "id": self.episode_id,
+            "content": self.content,
+            "createdAt": self.timestamp,
+        }
+
 
 class MemoryError(Exception):
     """Raised when a memory operation fails."""
@@ -174,6 +216,9 @@ class MemoryClient:
         boto_config = Config(
             region_name=self.region,
             retries={'max_attempts': 3, 'mode': 'adaptive'},
+            # Sized for concurrent calls: the client is shared per worker and
+            # the debug endpoint probes many namespaces at once
+            max_pool_connections=32,
         )
         
         self._client = boto3.client(
@@ -318,8 +363,7 @@ class MemoryClient:
             return []
         
         # Validate memory type
-        valid_types = {"facts", "summaries", "preferences"}
-        if memory_type not in valid_types:
+        if memory_type not in SEMANTIC_MEMORY_TYPES:
             memory_type = "facts"
         
         try:
@@ -350,7 +394,10 @@ class MemoryClient:
                 }
             )
             
-            response = self._client.list_memory_records(
+            # Run the blocking boto3 call in the thread pool so several
+            # memory types can be fetched concurrently
+            response = await asyncio.to_thread(
+                self._client.list_memory_records,
                 memoryId=self.memory_id,
                 namespace=namespace,
                 maxResults=max_results,
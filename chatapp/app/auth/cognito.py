@@ -391,11 +391,44 @@ class CognitoAuth:
             raise TokenValidationError(f"Invalid token: {str(e)}")
 
 
+# Module-level cache for verified token -> user ID. Memory/chat API calls
+# arrive with the same ID token for its whole lifetime, so re-verifying the
+# RSA signature on every request is wasted work. Entries expire with the
+# token's own 'exp' claim, so expired tokens are still rejected.
+_USER_ID_CACHE: dict[str, tuple[float, str]] = {}
+_USER_ID_CACHE_MAX_ENTRIES = 4096
+
+
+def _user_id_cache_get(token: str) -> Optional[str]:
+    """Return a cached user ID if the token is cached and not expired."""
+    entry = _USER_ID_CACHE.get(token)
+    if entry is None:
+        return None
+    expires, user_id = entry
+    if expires > time.time():
+        return user_id
+    _USER_ID_CACHE.pop(token, None)
+    return None
+
+
+def _user_id_cache_put(token: str, user_id: str) -> None:
+    """Cache a verified user ID until the token's 'exp' claim."""
+    try:
+        expires = float(jwt.get_unverified_claims(token)["exp"])
+    except Exception:
+        return  # No usable expiry - don't cache
+    if len(_USER_ID_CACHE) >= _USER_ID_CACHE_MAX_ENTRIES:
+        # Evict the oldest entry (dicts preserve insertion order)
+        _USER_ID_CACHE.pop(next(iter(_USER_ID_CACHE)), None)
+    _USER_ID_CACHE[token] = (expires, user_id)
+
+
 def extract_user_id(token: str) -> str:
     """Extract user ID from JWT token with signature verification.
     
     Uses sub (UUID) for memory operations - required by AgentCore Memory API.
-    Verifies the token signature against Cognito's JWKS.
+    Verifies the token signature against Cognito's JWKS. Successfully
+    verified tokens are cached until they expire.
     
     Args:
         token: JWT token (access or ID token)
@@ -406,15 +439,21 @@ def extract_user_id(token: str) -> str:
     Raises:
         TokenValidationError: If token is invalid, signature fails, or missing required claims
     """
+    cached = _user_id_cache_get(token)
+    if cached is not None:
+        return cached
+    
     try:
         # Use CognitoAuth to verify the token properly
         auth = CognitoAuth()
         user_info = auth.validate_token(token, verify_exp=True)
-        return user_info.user_id
     except (TokenExpiredError, TokenValidationError):
         raise
     except Exception as e:
         raise TokenValidationError(f"Invalid token: {str(e)}")
+    
+    _user_id_cache_put(token, user_info.user_id)
+    return user_info.user_id
 
 
 def is_admin(groups: list[str]) -> bool:
@@ -507,9 +546,8 @@ async def get_user_emails_by_ids(user_ids: list[str]) -> dict[str, str]:
         return user_id, None
 
     # Run the blocking boto3 lookups concurrently in the default executor.
-    loop = asyncio.get_event_loop()
     results = await asyncio.gather(
-        *[loop.run_in_executor(None, _lookup_one, uid) for uid in to_fetch]
+        *[asyncio.to_thread(_lookup_one, uid) for uid in to_fetch]
     )
 
     for user_id, email in results:
@@ -17,7 +17,6 @@ import asyncio
 import logging
 import random
 import time
-from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional
 
 from app.evaluations.config import EvalConfig
@@ -27,6 +26,7 @@ from app.evaluations.evaluators import (
     ToolSelectionEvaluator,
 )
 from app.models.evaluation import EvaluationRecord
+from app.storage._client import utc_now_iso
 from app.storage.evaluation import EvaluationStorageService
 
 logger = logging.getLogger(__name__)
@@ -271,9 +271,8 @@ async def run_evaluations(
         logger.debug("Empty agent output, skipping evaluations")
         return
 
-    base_timestamp = datetime.now(timezone.utc).isoformat()
+    base_timestamp = utc_now_iso()
     records: List[EvaluationRecord] = []
-    loop = asyncio.get_event_loop()
 
     # --- Programmatic evaluators (fast, in-process, every turn) ---
 
@@ -313,8 +312,8 @@ async def run_evaluations(
                 f"{history_block}"
                 f"User's latest message:\n{user_input}"
             )
-            llm_tasks.append(("answer_quality", loop.run_in_executor(
-                None, _run_binary_judge,
+            llm_tasks.append(("answer_quality", asyncio.to_thread(
+                _run_binary_judge,
                 ANSWER_QUALITY_RUBRIC, answer_quality_input, agent_output, config,
             )))
 
@@ -340,8 +339,8 @@ async def run_evaluations(
                 f"{AGENT_CAPABILITIES_MANIFEST}\n\n"
                 f"{grounded_context}"
             )
-            llm_tasks.append(("faithfulness", loop.run_in_executor(
-                None, _run_binary_judge,
+            llm_tasks.append(("faithfulness", asyncio.to_thread(
+                _run_binary_judge,
                 FAITHFULNESS_RUBRIC, faithfulness_input, agent_output, config,
             )))
 
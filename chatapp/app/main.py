@@ -1,10 +1,11 @@
 """Main FastAPI application entry point for HTMX ChatApp."""
 
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 from fastapi.responses import RedirectResponse, HTMLResponse
 from pathlib import Path
 from dotenv import load_dotenv
@@ -60,9 +61,21 @@ async def lifespan(app: FastAPI):
         print(f"Configuration error: {e}")
         raise
     
-    # Initialize template globals with app settings
+    # Size the default executor for blocking boto3 calls (asyncio.to_thread).
+    # The stock pool is min(32, cpu + 4) threads, which a few concurrent
+    # chats with DynamoDB writes and AgentCore calls can exhaust. Long-lived
+    # AgentCore response streams use their own pool (app.agentcore.client).
+    io_executor = ThreadPoolExecutor(
+        max_workers=int(os.environ.get("IO_THREAD_POOL_SIZE", "64")),
+        thread_name_prefix="io",
+    )
+    asyncio.get_running_loop().set_default_executor(io_executor)
+    
+    # Initialize template globals with app settings, and load the prompt
+    # template list so the first chat page doesn't wait on a table scan
+    from app.routes.prompt_templates import warm_templates_cache
     from app.templates_config import init_template_globals
-    await init_template_globals()
+    await asyncio.gather(init_template_globals(), warm_templates_cache())
     
     # Start hot reload if enabled
     if hot_reload:
@@ -71,8 +84,17 @@ async def lifespan(app: FastAPI):
     yield
     
     # Shutdown
+    # Let post-response storage/evaluation tasks finish, then write any
+    # guardrail/usage records still buffered for BatchWriteItem
+    from app.routes.chat import drain_background_tasks
+    from app.storage.batch_writer import flush_all
+    await drain_background_tasks()
+    await flush_all()
+    
     if hot_reload:
         await hot_reload.shutdown()
+    
+    io_executor.shutdown(wait=False)
 
 
 # Initialize FastAPI app
@@ -7,7 +7,11 @@ partition key and timestamp as sort key.
 
 import json
 from dataclasses import dataclass, field, asdict
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterable, Optional, List, Sequence
+
+
+# FeedbackRecord attributes stored as JSON strings
+_JSON_ATTRIBUTES = frozenset({"tools_used"})
 
 
 @dataclass
@@ -45,7 +49,7 @@ class FeedbackRecord:
             Dictionary suitable for DynamoDB put_item operation
         """
         # Serialize tools_used to JSON string
-        tools_used_json = json.dumps(self.tools_used)
+        tools_used_json = json.dumps(self.tools_used, separators=(",", ":"))
         
         item = {
             "user_id": {"S": self.user_id},
@@ -92,6 +96,37 @@ class FeedbackRecord:
             user_comment=user_comment,
         )
     
+    @classmethod
+    def columns_from_dynamodb_items(
+        cls,
+        items: Iterable[Dict[str, Any]],
+        attributes: Sequence[str],
+    ) -> Dict[str, List[Any]]:
+        """Decode selected attributes of many items into parallel lists.
+        
+        For aggregation paths that only need a few fields: no record
+        instances are built and unrequested attributes (e.g. the JSON
+        tools_used) are never decoded. Defaults match from_dynamodb_item.
+        
+        Args:
+            items: DynamoDB items with typed attribute values
+            attributes: Attribute names to decode
+            
+        Returns:
+            Dictionary mapping each attribute to a list with one value per item
+        """
+        columns: Dict[str, List[Any]] = {name: [] for name in attributes}
+        for item in items:
+            for name, column in columns.items():
+                value = item.get(name, {}).get("S")
+                if name in _JSON_ATTRIBUTES:
+                    column.append(json.loads(value or "[]"))
+                elif value is None and name != "user_comment":
+                    column.append("")
+                else:
+                    column.append(value)
+        return columns
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to plain dictionary.
         
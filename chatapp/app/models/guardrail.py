@@ -7,7 +7,11 @@ timestamp as sort key.
 
 import json
 from dataclasses import dataclass, asdict
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List, Sequence
+
+
+# GuardrailRecord attributes stored as JSON strings
+_JSON_ATTRIBUTES = frozenset({"assessments"})
 
 
 @dataclass
@@ -41,7 +45,7 @@ class GuardrailRecord:
             Dictionary suitable for DynamoDB put_item operation
         """
         # Serialize assessments to JSON string
-        assessments_json = json.dumps(self.assessments)
+        assessments_json = json.dumps(self.assessments, separators=(",", ":"))
         
         item = {
             "user_id": {"S": self.user_id},
@@ -51,6 +55,8 @@ class GuardrailRecord:
             "action": {"S": self.action},
             "assessments": {"S": assessments_json},
             "content_preview": {"S": self.content_preview},
+            # Partition key for the `date-index` GSI (UTC day, "YYYY-MM-DD")
+            "date_partition": {"S": (self.timestamp or "")[:10]},
         }
         
         return item
@@ -79,6 +85,35 @@ class GuardrailRecord:
             content_preview=item.get("content_preview", {}).get("S", ""),
         )
     
+    @classmethod
+    def columns_from_dynamodb_items(
+        cls,
+        items: Iterable[Dict[str, Any]],
+        attributes: Sequence[str],
+    ) -> Dict[str, List[Any]]:
+        """Decode selected attributes of many items into parallel lists.
+        
+        For aggregation paths that only need a few fields: no record
+        instances are built and unrequested attributes (e.g. the JSON
+        assessments) are never decoded. Defaults match from_dynamodb_item.
+        
+        Args:
+            items: DynamoDB items with typed attribute values
+            attributes: Attribute names to decode
+            
+        Returns:
+            Dictionary mapping each attribute to a list with one value per item
+        """
+        columns: Dict[str, List[Any]] = {name: [] for name in attributes}
+        for item in items:
+            for name, column in columns.items():
+                value = item.get(name, {}).get("S", "")
+                if name in _JSON_ATTRIBUTES:
+                    column.append(json.loads(value or "[]"))
+                else:
+                    column.append(value)
+        return columns
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to plain dictionary.
         
@@ -5,7 +5,7 @@ Records are stored in DynamoDB with template_id as partition key.
 """
 
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Any, ClassVar, Dict, Tuple
 
 
 @dataclass
@@ -82,3 +82,67 @@ class PromptTemplate:
             "created_at": self.created_at,
             "updated_at": self.updated_at,
         }
+
+
+@dataclass
+class PromptTemplateSummary:
+    """A prompt template without its prompt text, for listings.
+    
+    Attributes:
+        template_id: Unique identifier (UUID)
+        title: Display title for the template
+        description: Brief description shown in the list
+        sort_order: Integer for display ordering (lower = first)
+        created_at: ISO 8601 timestamp
+        updated_at: ISO 8601 timestamp
+    """
+    # Attributes to project when scanning for summaries
+    ATTRIBUTES: ClassVar[Tuple[str, ...]] = (
+        "template_id",
+        "title",
+        "description",
+        "sort_order",
+        "created_at",
+        "updated_at",
+    )
+    
+    template_id: str
+    title: str
+    description: str
+    sort_order: int = 0
+    created_at: str = ""
+    updated_at: str = ""
+    
+    @classmethod
+    def from_dynamodb_item(cls, item: Dict[str, Any]) -> "PromptTemplateSummary":
+        """Create instance from a (projected) DynamoDB item.
+        
+        Args:
+            item: DynamoDB item with typed attribute values
+            
+        Returns:
+            PromptTemplateSummary instance
+        """
+        return cls(
+            template_id=item.get("template_id", {}).get("S", ""),
+            title=item.get("title", {}).get("S", ""),
+            description=item.get("description", {}).get("S", ""),
+            sort_order=int(item.get("sort_order", {}).get("N", "0")),
+            created_at=item.get("created_at", {}).get("S", ""),
+            updated_at=item.get("updated_at", {}).get("S", ""),
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to plain dictionary.
+        
+        Returns:
+            Dictionary representation of the summary
+        """
+        return {
+            "template_id": self.template_id,
+            "title": self.title,
+            "description": self.description,
+            "sort_order": self.sort_order,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
@@ -75,10 +75,10 @@ class UsageRecord:
             Dictionary suitable for DynamoDB put_item operation
         """
         # Serialize tool_usage to JSON string
-        tool_usage_json = json.dumps({
-            name: record.to_dict() 
-            for name, record in self.tool_usage.items()
-        })
+        tool_usage_json = json.dumps(
+            {name: record.to_dict() for name, record in self.tool_usage.items()},
+            separators=(",", ":"),
+        )
         
         item = {
             "user_id": {"S": self.user_id},
@@ -11,8 +11,6 @@ from typing import Optional, Dict, Any
 
 from fastapi import APIRouter, Request, Query
 from fastapi.responses import HTMLResponse, JSONResponse
-from fastapi.templating import Jinja2Templates
-from pathlib import Path
 
 from app.admin.repository import UsageRepository
 from app.admin.cost_calculator import CostCalculator
@@ -7,7 +7,7 @@ with AgentCore Runtime and streams responses back to the client.
 import asyncio
 import json
 import logging
-from typing import Optional, Dict, Any
+from typing import Any, Coroutine, Dict, Optional, Set
 from fastapi import APIRouter, Request, HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
@@ -19,6 +19,7 @@ from app.helpers.model_catalog import get_model_api
 from app.models.events import MessageEvent, MetadataEvent, ToolUseEvent, ToolResultEvent, GuardrailEvent, ReasoningEvent, DoneEvent
 from app.models.guardrail import GuardrailRecord
 from app.models.usage import UsageRecord, ToolUsageRecord
+from app.storage._client import utc_now_iso
 from app.storage.guardrail import GuardrailStorageService
 from app.storage.usage import UsageStorageService
 from app.evaluations.engine import run_evaluations
@@ -28,6 +29,55 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["chat"])
 
+# Post-response work (usage, guardrail and evaluation storage) runs as
+# background tasks. The event loop only keeps weak references to tasks, so
+# they are held here until done; drain_background_tasks awaits them on
+# shutdown. Past the cap new work is dropped rather than piling up.
+_BACKGROUND_TASKS: Set[asyncio.Task] = set()
+_MAX_BACKGROUND_TASKS = 1000
+# Seconds shutdown waits for background tasks before cancelling the rest
+_DRAIN_TIMEOUT_SECONDS = 10.0
+
+
+def _spawn_background(coro: Coroutine[Any, Any, None]) -> None:
+    """Run a coroutine as a tracked fire-and-forget task.
+    
+    Args:
+        coro: Coroutine to schedule (closed unrun if the task set is full)
+    """
+    if len(_BACKGROUND_TASKS) >= _MAX_BACKGROUND_TASKS:
+        coro.close()
+        logger.warning(
+            "Background task limit reached, dropping task",
+            extra={"pending": len(_BACKGROUND_TASKS)},
+        )
+        return
+    task = asyncio.create_task(coro)
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+
+
+async def drain_background_tasks(timeout: float = _DRAIN_TIMEOUT_SECONDS) -> None:
+    """Wait for pending background tasks (call on application shutdown).
+    
+    Tasks still running after ``timeout`` seconds (e.g. an evaluation stuck
+    on a slow model call) are cancelled so shutdown is not held up.
+    
+    Args:
+        timeout: Maximum seconds to wait
+    """
+    if not _BACKGROUND_TASKS:
+        return
+    _, pending = await asyncio.wait(set(_BACKGROUND_TASKS), timeout=timeout)
+    if pending:
+        logger.warning(
+            "Cancelling background tasks still running at shutdown",
+            extra={"pending": len(pending)},
+        )
+        for task in pending:
+            task.cancel()
+        await asyncio.wait(pending)
+
 
 class ChatRequest(BaseModel):
     """Request body for chat endpoint.
@@ -287,7 +337,7 @@ async def _stream_chat_response(
         # Store guardrail violations asynchronously (fire-and-forget) so
         # violation capture never blocks the streamed response.
         if isinstance(event, GuardrailEvent) and event.action == "GUARDRAIL_INTERVENED":
-            asyncio.create_task(
+            _spawn_background(
                 _store_guardrail_violation(event, session_id, user_id)
             )
 
@@ -334,7 +384,7 @@ async def _stream_chat_response(
     # Store usage asynchronously after stream completes (fire-and-forget)
     # Requirements 2.1, 8.1: Store usage record without blocking response
     if accumulated_metrics:
-        asyncio.create_task(
+        _spawn_background(
             _store_usage_record(accumulated_metrics, session_id, user_id, model_id, user_email)
         )
 
@@ -344,7 +394,7 @@ async def _stream_chat_response(
     # can interpret follow-up turns (e.g. "yes") in context.
     full_output = "".join(accumulated_output)
     if full_output.strip():
-        asyncio.create_task(
+        _spawn_background(
             _evaluate_turn_with_history(
                 prompt=prompt,
                 full_output=full_output,
@@ -452,8 +502,6 @@ async def _store_usage_record(
         user_id: User ID who made the request
         model_id: Model used for the invocation
     """
-    from datetime import datetime, timezone
-    
     try:
         logger.info(
             "Processing metrics for storage",
@@ -477,7 +525,7 @@ async def _store_usage_record(
                 )
         
         # Generate timestamp if not provided
-        timestamp = metrics.get('timestamp') or datetime.now(timezone.utc).isoformat()
+        timestamp = metrics.get('timestamp') or utc_now_iso()
         
         # Calculate total_tokens if not provided
         input_tokens = metrics.get('inputTokens', 0) or 0
@@ -503,7 +551,7 @@ async def _store_usage_record(
         await storage_service.store_usage(record)
         
         logger.info(
-            "Usage record stored",
+            "Usage record queued",
             extra={
                 "user_id": record.user_id,
                 "session_id": record.session_id,
@@ -538,13 +586,11 @@ async def _store_guardrail_violation(
         session_id: Session ID for the conversation
         user_id: User ID who triggered the violation
     """
-    from datetime import datetime, timezone
-    
     try:
         # Create GuardrailRecord from event
         record = GuardrailRecord(
             user_id=user_id,
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=utc_now_iso(),
             session_id=session_id,
             source=event.source,
             action=event.action,
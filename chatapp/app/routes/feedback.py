@@ -6,7 +6,7 @@ It also provides admin routes for viewing and filtering feedback records.
 """
 
 import logging
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
 
 from fastapi import APIRouter, Request, HTTPException, Query
@@ -14,6 +14,7 @@ from fastapi.responses import JSONResponse, HTMLResponse
 from pydantic import BaseModel, Field, field_validator
 
 from app.models.feedback import FeedbackRecord, FeedbackSubmission, FeedbackStats
+from app.storage._client import utc_now_iso
 from app.storage.feedback import FeedbackStorageService
 from app.admin.feedback_repository import FeedbackRepository
 from app.auth.cognito import get_user_emails_by_ids
@@ -91,7 +92,7 @@ async def submit_feedback(request: Request, body: FeedbackRequest) -> JSONRespon
     user_id = user.user_id
     
     # Create timestamp
-    timestamp = datetime.now(timezone.utc).isoformat()
+    timestamp = utc_now_iso()
     
     # Create feedback record
     record = FeedbackRecord(
@@ -4,20 +4,67 @@ This module provides endpoints for fetching event and semantic memory
 from AgentCore Memory service.
 """
 
+import asyncio
 import json
-from dataclasses import asdict
+import re
+from functools import lru_cache
 from typing import List
 from fastapi import APIRouter, Request, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from app.auth.cognito import extract_user_id, TokenValidationError
 from app.auth.middleware import SESSION_COOKIE_NAME
-from app.agentcore.memory import MemoryClient, MemoryEvent, SemanticFact, EpisodicMemory
+from app.agentcore.memory import (
+    SEMANTIC_MEMORY_TYPES,
+    EpisodicMemory,
+    MemoryClient,
+    MemoryEvent,
+    SemanticFact,
+)
 
 
 router = APIRouter(prefix="/api/memory", tags=["memory"])
 
 
+# Session IDs are UUIDs generated by the chat UI; anything outside this
+# character set would only fail later inside the AgentCore call.
+_SESSION_ID_RE = re.compile(r"\A[A-Za-z0-9_-]{1,128}\Z")
+
+# Namespace formats probed by the debug endpoint, formatted per request
+_DEBUG_NAMESPACE_TEMPLATES = (
+    # Current format (matching frontend)
+    ("facts_v1", "/users/{user_id}/facts"),
+    ("summaries_v1", "/summaries/{user_id}/{session_id}"),
+    ("preferences_v1", "/users/{user_id}/preferences"),
+    # Alternative formats
+    ("facts_v2", "users/{user_id}/facts"),
+    ("summaries_v2", "summaries/{user_id}/{session_id}"),
+    ("preferences_v2", "users/{user_id}/preferences"),
+    # Session-scoped formats
+    ("facts_session", "/sessions/{session_id}/facts"),
+    ("summaries_session", "/sessions/{session_id}/summaries"),
+    ("preferences_session", "/sessions/{session_id}/preferences"),
+    # User-only formats
+    ("facts_user", "/{user_id}/facts"),
+    ("summaries_user", "/{user_id}/summaries"),
+    ("preferences_user", "/{user_id}/preferences"),
+    # Root namespace
+    ("root", "/"),
+)
+
+# Headers returned by the CORS preflight handlers
+_CORS_PREFLIGHT_HEADERS = {
+    "Access-Control-Allow-Methods": "GET, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type, Authorization",
+}
+
+
+@lru_cache(maxsize=1)
+def _memory_client() -> MemoryClient:
+    """Return the shared MemoryClient (built once per worker)."""
+    return MemoryClient()
+
+
 def _get_user_id_from_session(request: Request) -> str:
     """Extract user ID from session cookie or dev mode.
     
@@ -54,19 +101,34 @@ def _get_user_id_from_session(request: Request) -> str:
         raise HTTPException(status_code=401, detail=f"Invalid token: {e}")
 
 
-@router.get("/events")
-async def get_event_memory(
-    request: Request,
-    session_id: str = Query(..., description="Session ID for the conversation"),
-):
+def _validate_session_id(session_id: str) -> None:
+    """Reject a missing or malformed session_id before calling AgentCore.
+    
+    Args:
+        session_id: Session ID from the query string
+        
+    Raises:
+        HTTPException: If the session ID is empty or malformed
+    """
+    if not session_id or not session_id.strip():
+        raise HTTPException(status_code=400, detail="session_id is required")
+    if not _SESSION_ID_RE.match(session_id):
+        raise HTTPException(status_code=400, detail="Invalid session_id")
+
+
+async def get_event_memory(request: Request) -> JSONResponse:
     """Get event memory (conversation history) for a session.
     
     Fetches the conversation history from AgentCore Memory for the specified
     session. Returns messages with role, content, and timestamp.
     
+    This is the chat UI's polling endpoint, so it is registered as a plain
+    Starlette route (see below) and reads ``session_id`` straight from the
+    query string instead of going through FastAPI parameter resolution.
+    
     Args:
-        request: Incoming request with session cookie
-        session_id: Session ID for the conversation
+        request: Incoming request with session cookie and a ``session_id``
+            query parameter
         
     Returns:
         JSON response with messages array
@@ -75,25 +137,18 @@ async def get_event_memory(
     user_id = _get_user_id_from_session(request)
     
     # Validate session_id
-    if not session_id or not session_id.strip():
-        raise HTTPException(status_code=400, detail="session_id is required")
+    session_id = request.query_params.get("session_id", "")
+    _validate_session_id(session_id)
     
     # Fetch event memory
-    client = MemoryClient()
+    client = _memory_client()
     events: List[MemoryEvent] = await client.get_events(
         session_id=session_id,
         user_id=user_id,
     )
     
     # Convert to response format
-    messages = [
-        {
-            "role": event.role,
-            "content": event.content,
-            "timestamp": event.timestamp,
-        }
-        for event in events
-    ]
+    messages = [event.to_dict() for event in events]
     
     return JSONResponse(
         content={
@@ -104,6 +159,16 @@ async def get_event_memory(
     )
 
 
+# Registered without FastAPI's dependency/validation layer (hot polling path).
+# Plain routes don't inherit the router prefix, so the full path is given.
+router.add_route(
+    f"{router.prefix}/events",
+    get_event_memory,
+    methods=["GET"],
+    include_in_schema=False,
+)
+
+
 @router.get("/semantic")
 async def get_semantic_memory(
     request: Request,
@@ -127,17 +192,15 @@ async def get_semantic_memory(
     user_id = _get_user_id_from_session(request)
     
     # Validate session_id
-    if not session_id or not session_id.strip():
-        raise HTTPException(status_code=400, detail="session_id is required")
+    _validate_session_id(session_id)
     
     # Validate and normalize type
-    valid_types = {"facts", "summaries", "preferences"}
     memory_type = type.lower() if type else "facts"
-    if memory_type not in valid_types:
+    if memory_type not in SEMANTIC_MEMORY_TYPES:
         memory_type = "facts"
     
     # Fetch semantic memory for the specified type
-    client = MemoryClient()
+    client = _memory_client()
     items: List[SemanticFact] = await client.get_semantic(
         session_id=session_id,
         user_id=user_id,
@@ -145,15 +208,7 @@ async def get_semantic_memory(
     )
     
     # Convert to response format
-    item_list = [
-        {
-            "id": item.fact_id,
-            "content": item.content,
-            "confidence": item.confidence,
-            "createdAt": item.timestamp,
-        }
-        for item in items
-    ]
+    item_list = [item.to_dict() for item in items]
     
     # Return with the appropriate key based on type
     # Include the items under both the type-specific key and a generic key for frontend compatibility
@@ -168,6 +223,47 @@ async def get_semantic_memory(
     )
 
 
+@router.get("/semantic/all")
+async def get_all_semantic_memory(
+    request: Request,
+    session_id: str = Query(..., description="Session ID for the conversation"),
+):
+    """Get facts, summaries, and preferences for a session in one call.
+    
+    Fetches the three semantic memory types concurrently so the sidebar
+    needs a single round-trip instead of one request per type.
+    
+    Args:
+        request: Incoming request with session cookie
+        session_id: Session ID for the conversation
+        
+    Returns:
+        JSON response with facts, summaries, and preferences arrays
+    """
+    user_id = _get_user_id_from_session(request)
+    _validate_session_id(session_id)
+    
+    client = _memory_client()
+    memory_types = ("facts", "summaries", "preferences")
+    results: List[List[SemanticFact]] = await asyncio.gather(
+        *[
+            client.get_semantic(
+                session_id=session_id,
+                user_id=user_id,
+                memory_type=memory_type,
+            )
+            for memory_type in memory_types
+        ]
+    )
+    
+    content = {
+        memory_type: [item.to_dict() for item in items]
+        for memory_type, items in zip(memory_types, results)
+    }
+    content["sessionId"] = session_id
+    return JSONResponse(content=content)
+
+
 @router.get("/episodic")
 async def get_episodic_memory(
     request: Request,
@@ -188,23 +284,15 @@ async def get_episodic_memory(
     """
     user_id = _get_user_id_from_session(request)
 
-    if not session_id or not session_id.strip():
-        raise HTTPException(status_code=400, detail="session_id is required")
+    _validate_session_id(session_id)
 
-    client = MemoryClient()
+    client = _memory_client()
     episodes: List[EpisodicMemory] = await client.get_episodic(
         session_id=session_id,
         user_id=user_id,
     )
 
-    episode_list = [
-        {
-            "id": ep.episode_id,
-            "content": ep.content,
-            "createdAt": ep.timestamp,
-        }
-        for ep in episodes
-    ]
+    episode_list = [ep.to_dict() for ep in episodes]
 
     return JSONResponse(
         content={
@@ -232,68 +320,67 @@ async def debug_memory(
     Returns:
         JSON response with debug information about memory contents
     """
-    import logging
-    logger = logging.getLogger(__name__)
-    
     # Extract user ID from session
     user_id = _get_user_id_from_session(request)
+    _validate_session_id(session_id)
     
-    client = MemoryClient()
+    client = _memory_client()
     results = {}
     
     # Try various namespace formats to find where data is stored
     namespace_formats = {
-        # Current format (matching frontend)
-        "facts_v1": f"/users/{user_id}/facts",
-        "summaries_v1": f"/summaries/{user_id}/{session_id}",
-        "preferences_v1": f"/users/{user_id}/preferences",
-        # Alternative formats
-        "facts_v2": f"users/{user_id}/facts",
-        "summaries_v2": f"summaries/{user_id}/{session_id}",
-        "preferences_v2": f"users/{user_id}/preferences",
-        # Session-scoped formats
-        "facts_session": f"/sessions/{session_id}/facts",
-        "summaries_session": f"/sessions/{session_id}/summaries",
-        "preferences_session": f"/sessions/{session_id}/preferences",
-        # User-only formats
-        "facts_user": f"/{user_id}/facts",
-        "summaries_user": f"/{user_id}/summaries",
-        "preferences_user": f"/{user_id}/preferences",
-        # Root namespace
-        "root": "/",
+        name: template.format(user_id=user_id, session_id=session_id)
+        for name, template in _DEBUG_NAMESPACE_TEMPLATES
     }
     
-    for name, namespace in namespace_formats.items():
+    list_memory_records = client._client.list_memory_records
+    memory_id = client.memory_id
+    
+    def _probe(name: str, namespace: str):
         try:
-            response = client._client.list_memory_records(
-                memoryId=client.memory_id,
+            return name, namespace, list_memory_records(
+                memoryId=memory_id,
                 namespace=namespace,
                 maxResults=10,
             )
-            record_count = len(response.get('memoryRecordSummaries', []))
-            records = []
-            for record in response.get('memoryRecordSummaries', [])[:3]:
-                content = record.get('content', {}).get('text', '')[:100]
-                records.append({
-                    "id": record.get('memoryRecordId', '')[:20],
-                    "content_preview": content,
-                })
-            results[name] = {
-                "namespace": namespace,
-                "count": record_count,
-                "sample_records": records,
-            }
         except Exception as e:
+            return name, namespace, e
+    
+    # Probe all namespaces concurrently; each call is a blocking boto3
+    # round-trip, so running them in the thread pool overlaps the latency.
+    probes = await asyncio.gather(
+        *[
+            asyncio.to_thread(_probe, name, namespace)
+            for name, namespace in namespace_formats.items()
+        ]
+    )
+    
+    for name, namespace, response in probes:
+        if isinstance(response, Exception):
             results[name] = {
                 "namespace": namespace,
-                "error": str(e)[:100],
+                "error": str(response)[:100],
             }
+            continue
+        summaries = response.get('memoryRecordSummaries') or []
+        records = []
+        for record in summaries[:3]:
+            content = record.get('content', {}).get('text', '')[:100]
+            records.append({
+                "id": record.get('memoryRecordId', '')[:20],
+                "content_preview": content,
+            })
+        results[name] = {
+            "namespace": namespace,
+            "count": len(summaries),
+            "sample_records": records,
+        }
     
     return JSONResponse(
         content={
             "user_id": user_id,
             "session_id": session_id,
-            "memory_id": client.memory_id,
+            "memory_id": memory_id,
             "namespaces": results,
         }
     )
@@ -306,14 +393,7 @@ async def events_options():
     Returns:
         Empty response with CORS headers
     """
-    return JSONResponse(
-        content=None,
-        status_code=204,
-        headers={
-            "Access-Control-Allow-Methods": "GET, OPTIONS",
-            "Access-Control-Allow-Headers": "Content-Type, Authorization",
-        },
-    )
+    return Response(status_code=204, headers=_CORS_PREFLIGHT_HEADERS)
 
 
 @router.options("/semantic")
@@ -323,11 +403,4 @@ async def semantic_options():
     Returns:
         Empty response with CORS headers
     """
-    return JSONResponse(
-        content=None,
-        status_code=204,
-        headers={
-            "Access-Control-Allow-Methods": "GET, OPTIONS",
-            "Access-Control-Allow-Headers": "Content-Type, Authorization",
-        },
-    )
+    return Response(status_code=204, headers=_CORS_PREFLIGHT_HEADERS)
@@ -4,14 +4,17 @@ This module provides API endpoints for listing prompt templates (for chat UI)
 and admin routes for CRUD operations on templates stored in DynamoDB.
 """
 
+import json
 import logging
-from typing import Optional
+import time
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, Optional
 
 from fastapi import APIRouter, Request, HTTPException, Form
-from fastapi.responses import JSONResponse, HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
-from pathlib import Path
+from fastapi.responses import JSONResponse, HTMLResponse, RedirectResponse, Response
 
+from app.models.prompt_template import PromptTemplate
 from app.storage.prompt_template import PromptTemplateStorageService
 from app.templates_config import templates
 
@@ -24,13 +27,72 @@ router = APIRouter(prefix="/api", tags=["templates"])
 admin_router = APIRouter(prefix="/admin", tags=["admin-templates"])
 
 
+@lru_cache(maxsize=1)
+def _template_storage() -> PromptTemplateStorageService:
+    """Return the shared template storage service (built once per worker)."""
+    return PromptTemplateStorageService()
+
+
+# Short-TTL cache for the template list. Templates change a few times a day
+# at most, but /api/templates is fetched on every chat page load; this keeps
+# the table scan off the hot path. Every admin mutation below calls
+# invalidate_templates_cache() so edits show up immediately in this worker.
+# The serialized /api/templates body is cached alongside the list so cache
+# hits skip the to_dict() + JSON encode as well.
+_TEMPLATES_CACHE: Optional[List[PromptTemplate]] = None
+_TEMPLATES_JSON_CACHE: Optional[bytes] = None
+_TEMPLATES_CACHE_EXPIRES: float = 0.0
+_TEMPLATES_CACHE_TTL_SECONDS = 60
+
+
+def invalidate_templates_cache() -> None:
+    """Clear the cached template list (call after any template mutation)."""
+    global _TEMPLATES_CACHE, _TEMPLATES_JSON_CACHE, _TEMPLATES_CACHE_EXPIRES
+    _TEMPLATES_CACHE = None
+    _TEMPLATES_JSON_CACHE = None
+    _TEMPLATES_CACHE_EXPIRES = 0.0
+
+
+async def _get_all_templates_cached() -> Optional[List[PromptTemplate]]:
+    """Return all templates sorted by sort_order, cached for a short TTL.
+    
+    The list is sorted once per cache fill rather than on every request.
+    A failed load is not cached, so the next request scans again.
+    
+    Returns:
+        List of all prompt templates (callers must not mutate it), or None
+        if the table could not be read
+    """
+    global _TEMPLATES_CACHE, _TEMPLATES_JSON_CACHE, _TEMPLATES_CACHE_EXPIRES
+    if _TEMPLATES_CACHE is not None and _TEMPLATES_CACHE_EXPIRES > time.monotonic():
+        return _TEMPLATES_CACHE
+
+    templates_list = await _template_storage().get_all_templates()
+    if templates_list is None:
+        return None
+    templates_list.sort(key=attrgetter("sort_order"))
+    _TEMPLATES_CACHE = templates_list
+    _TEMPLATES_JSON_CACHE = None
+    _TEMPLATES_CACHE_EXPIRES = time.monotonic() + _TEMPLATES_CACHE_TTL_SECONDS
+    return templates_list
+
+
+async def warm_templates_cache() -> None:
+    """Load the template list into the cache (called on application startup).
+    
+    A failed load leaves the cache empty, so the first request retries it.
+    """
+    if await _get_all_templates_cached() is None:
+        logger.warning("Prompt template cache warm-up failed; will load on first request")
+
+
 # ============================================================================
 # API Routes (for Chat UI)
 # ============================================================================
 
 
 @router.get("/templates")
-async def list_templates() -> JSONResponse:
+async def list_templates() -> Response:
     """List all prompt templates for the chat UI.
     
     Returns all templates with their title, description, and prompt_detail
@@ -41,21 +103,24 @@ async def list_templates() -> JSONResponse:
         
     Requirements: 1.2
     """
-    storage = PromptTemplateStorageService()
-    templates_list = await storage.get_all_templates()
+    global _TEMPLATES_JSON_CACHE
+    templates_list = await _get_all_templates_cached()
+    if templates_list is None:
+        # Load failed (already logged); nothing is cached
+        return Response(content=b"[]", media_type="application/json")
     
-    # Sort by sort_order so the chat UI reflects the admin-defined ordering
-    templates_list.sort(key=lambda t: t.sort_order)
-    
-    # Convert to list of dicts for JSON response
-    result = [t.to_dict() for t in templates_list]
-    
-    logger.info(
-        "Listed templates for chat UI",
-        extra={"count": len(result)},
-    )
+    if _TEMPLATES_JSON_CACHE is None:
+        # Serialize once per cache fill (same encoding as JSONResponse).
+        # The list is already in sort_order, matching the admin ordering.
+        _TEMPLATES_JSON_CACHE = json.dumps(
+            [t.to_dict() for t in templates_list],
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        
+        logger.info("Listed templates for chat UI (count=%d)", len(templates_list))
     
-    return JSONResponse(content=result)
+    return Response(content=_TEMPLATES_JSON_CACHE, media_type="application/json")
 
 
 # ============================================================================
@@ -74,11 +139,8 @@ async def admin_templates_page(request: Request):
     
     Requirements: 2.1, 2.2
     """
-    storage = PromptTemplateStorageService()
-    templates_list = await storage.get_all_templates()
-    
-    # Sort by sort_order for consistent, drag-and-drop-defined display
-    templates_list.sort(key=lambda t: t.sort_order)
+    # Already sorted by sort_order (drag-and-drop-defined display order)
+    templates_list = await _get_all_templates_cached() or []
     
     return templates.TemplateResponse(
         "admin/templates.html",
@@ -128,24 +190,28 @@ async def create_template(
         # Redirect back with error (could enhance with flash messages)
         return RedirectResponse(url="/admin/templates", status_code=303)
     
-    storage = PromptTemplateStorageService()
+    # create_template places it last from a fresh read (not the cached
+    # list, which can be stale across workers)
+    storage = _template_storage()
     template = await storage.create_template(
         title=title,
         description=description,
         prompt_detail=prompt_detail,
     )
+    invalidate_templates_cache()
     
     if template:
         logger.info(
-            "Admin created template",
-            extra={"template_id": template.template_id, "title": title},
+            "Admin created template (template_id=%s, title=%s)",
+            template.template_id,
+            title,
         )
         if is_ajax:
             return JSONResponse(
                 content={"success": True, "template": template.to_dict()}
             )
     else:
-        logger.error("Failed to create template", extra={"title": title})
+        logger.error("Failed to create template (title=%s)", title)
         if is_ajax:
             return JSONResponse(
                 content={"success": False, "error": "Failed to create template"},
@@ -184,29 +250,28 @@ async def edit_template(
     
     if not title or not description or not prompt_detail:
         logger.warning(
-            "Edit template failed: missing required fields",
-            extra={"template_id": template_id},
+            "Edit template failed: missing required fields (template_id=%s)",
+            template_id,
         )
         return RedirectResponse(url="/admin/templates", status_code=303)
     
-    storage = PromptTemplateStorageService()
+    storage = _template_storage()
     template = await storage.update_template(
         template_id=template_id,
         title=title,
         description=description,
         prompt_detail=prompt_detail,
     )
+    invalidate_templates_cache()
     
     if template:
         logger.info(
-            "Admin updated template",
-            extra={"template_id": template_id, "title": title},
+            "Admin updated template (template_id=%s, title=%s)",
+            template_id,
+            title,
         )
     else:
-        logger.warning(
-            "Template not found for update",
-            extra={"template_id": template_id},
-        )
+        logger.warning("Template not found for update (template_id=%s)", template_id)
     
     return RedirectResponse(url="/admin/templates", status_code=303)
 
@@ -231,11 +296,12 @@ async def reorder_templates(request: Request) -> JSONResponse:
             content={"success": False, "error": "No order provided"}, status_code=400
         )
 
-    storage = PromptTemplateStorageService()
+    storage = _template_storage()
     for idx, template_id in enumerate(order):
         await storage.update_sort_order(str(template_id), idx)
+    invalidate_templates_cache()
 
-    logger.info("Admin reordered templates", extra={"count": len(order)})
+    logger.info("Admin reordered templates (count=%d)", len(order))
     return JSONResponse(content={"success": True, "count": len(order)})
 
 
@@ -262,15 +328,15 @@ async def bulk_delete_templates(request: Request) -> JSONResponse:
             status_code=400,
         )
 
-    storage = PromptTemplateStorageService()
+    storage = _template_storage()
     deleted = 0
     for tid in ids:
         if await storage.delete_template(str(tid)):
             deleted += 1
+    invalidate_templates_cache()
 
     logger.info(
-        "Bulk deleted templates",
-        extra={"requested": len(ids), "deleted": deleted},
+        "Bulk deleted templates (requested=%d, deleted=%d)", len(ids), deleted
     )
     return JSONResponse(content={"success": True, "deleted": deleted})
 
@@ -328,9 +394,14 @@ async def bulk_upload_templates(request: Request) -> JSONResponse:
             status_code=400,
         )
 
-    storage = PromptTemplateStorageService()
-    existing = await storage.get_all_templates()
-    max_order = max((t.sort_order for t in existing), default=-1)
+    storage = _template_storage()
+    first_order = await storage.next_sort_order()
+    if first_order is None:
+        # Without a fresh read the new templates can't be placed last
+        return JSONResponse(
+            content={"success": False, "error": "Could not load existing templates"},
+            status_code=503,
+        )
 
     created = []
     for idx, item in enumerate(templates_data):
@@ -339,12 +410,13 @@ async def bulk_upload_templates(request: Request) -> JSONResponse:
             title=item["title"].strip(),
             description=item["description"].strip(),
             prompt_detail=item["prompt_detail"].strip(),
-            sort_order=max_order + 1 + idx,
+            sort_order=first_order + idx,
         )
         if template:
             created.append(template.to_dict())
+    invalidate_templates_cache()
 
-    logger.info("Bulk uploaded templates", extra={"count": len(created)})
+    logger.info("Bulk uploaded templates (count=%d)", len(created))
     return JSONResponse(
         content={"success": True, "created": len(created), "templates": created}
     )
@@ -366,18 +438,13 @@ async def delete_template(
         
     Requirements: 2.5
     """
-    storage = PromptTemplateStorageService()
+    storage = _template_storage()
     success = await storage.delete_template(template_id)
+    invalidate_templates_cache()
     
     if success:
-        logger.info(
-            "Admin deleted template",
-            extra={"template_id": template_id},
-        )
+        logger.info("Admin deleted template (template_id=%s)", template_id)
     else:
-        logger.warning(
-            "Failed to delete template",
-            extra={"template_id": template_id},
-        )
+        logger.warning("Failed to delete template (template_id=%s)", template_id)
     
     return RedirectResponse(url="/admin/templates", status_code=303)
@@ -7,25 +7,79 @@ and session lifecycle management.
 Requirements: 3.1, 3.2
 """
 
-import json
+import base64
+import binascii
+import hashlib
+import hmac
+import logging
+import os
+import secrets
+import struct
 import uuid
 from dataclasses import dataclass, asdict
 from datetime import datetime, UTC
+from functools import lru_cache
 from typing import Optional
 
 from fastapi import Request, Response
 
 
+logger = logging.getLogger(__name__)
+
 # Cookie name for chat session (separate from auth session)
 CHAT_SESSION_COOKIE_NAME = "chatapp_chat_session"
 
+# Cookie payload layout: created_at and last_activity as big-endian epoch
+# seconds, followed by the UTF-8 session ID. The payload is base64url-encoded
+# and followed by a truncated HMAC-SHA256 tag, which keeps the cookie well
+# under half the size of the previous JSON encoding and tamper-evident.
+_COOKIE_HEADER = struct.Struct("!QQ")
+_COOKIE_MAC_BYTES = 16
+
+
+@lru_cache(maxsize=1)
+def _default_signing_key() -> bytes:
+    """Return the key used to sign chat session cookies.
+    
+    Uses the CHAT_SESSION_SECRET environment variable when set. Otherwise a
+    random per-process key is generated, which means cookies do not survive
+    a restart and are not shared between workers, so a warning is logged.
+    """
+    secret = os.environ.get("CHAT_SESSION_SECRET", "").strip()
+    if secret:
+        return secret.encode("utf-8")
+    logger.warning(
+        "CHAT_SESSION_SECRET is not set; using a random per-process key "
+        "(chat sessions reset on restart and are not shared between workers)"
+    )
+    return secrets.token_bytes(32)
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _iso_to_epoch(value: str) -> int:
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return int(dt.timestamp())
+
+
+def _epoch_to_iso(value: int) -> str:
+    return datetime.fromtimestamp(value, UTC).isoformat()
+
 
 @dataclass
 class ChatSession:
     """Represents a chat session state.
     
     Attributes:
-        session_id: Unique identifier for the chat session (UUID)
+        session_id: Unique identifier for the chat session (hex UUID)
         created_at: ISO timestamp when session was created
         last_activity: ISO timestamp of last activity
     """
@@ -78,6 +132,7 @@ class SessionManager:
         cookie_max_age: int = 86400 * 7,  # 7 days
         cookie_secure: bool = True,
         cookie_samesite: str = "lax",
+        signing_key: Optional[bytes] = None,
     ):
         """Initialize SessionManager.
         
@@ -85,18 +140,21 @@ class SessionManager:
             cookie_max_age: Maximum age of session cookie in seconds
             cookie_secure: Whether to set Secure flag on cookie
             cookie_samesite: SameSite policy for cookie
+            signing_key: HMAC key for the session cookie (defaults to
+                CHAT_SESSION_SECRET or a random per-process key)
         """
         self.cookie_max_age = cookie_max_age
         self.cookie_secure = cookie_secure
         self.cookie_samesite = cookie_samesite
+        self._signing_key = signing_key or _default_signing_key()
     
     def generate_session_id(self) -> str:
         """Generate a new unique session ID.
         
         Returns:
-            UUID string for session identification
+            32-character hex UUID (no hyphens) for session identification
         """
-        return str(uuid.uuid4())
+        return uuid.uuid4().hex
     
     def create_session(self, response: Response) -> ChatSession:
         """Create a new chat session and set cookie.
@@ -130,11 +188,7 @@ class SessionManager:
         if not cookie_value:
             return None
         
-        try:
-            data = json.loads(cookie_value)
-            return ChatSession.from_dict(data)
-        except (json.JSONDecodeError, KeyError, ValueError):
-            return None
+        return self.decode_cookie(cookie_value)
     
     def get_or_create_session(
         self, request: Request, response: Response
@@ -188,6 +242,56 @@ class SessionManager:
         self._set_session_cookie(response, session)
         return session
     
+    def _sign(self, payload: bytes) -> bytes:
+        """Compute the truncated HMAC tag for a cookie payload."""
+        return hmac.new(
+            self._signing_key, payload, hashlib.sha256
+        ).digest()[:_COOKIE_MAC_BYTES]
+    
+    def encode_cookie(self, session: ChatSession) -> str:
+        """Encode a session as a compact, signed cookie value.
+        
+        Timestamps are stored with second precision.
+        
+        Args:
+            session: ChatSession to encode
+            
+        Returns:
+            Cookie value string
+        """
+        payload = _COOKIE_HEADER.pack(
+            _iso_to_epoch(session.created_at),
+            _iso_to_epoch(session.last_activity),
+        ) + session.session_id.encode("utf-8")
+        return f"{_b64encode(payload)}.{_b64encode(self._sign(payload))}"
+    
+    def decode_cookie(self, cookie_value: str) -> Optional[ChatSession]:
+        """Decode and verify a cookie value produced by encode_cookie.
+        
+        Args:
+            cookie_value: Raw cookie value
+            
+        Returns:
+            ChatSession if the cookie is well-formed and its signature is
+            valid, None otherwise
+        """
+        try:
+            payload_b64, _, mac_b64 = cookie_value.partition(".")
+            payload = _b64decode(payload_b64)
+            if not hmac.compare_digest(_b64decode(mac_b64), self._sign(payload)):
+                return None
+            created_at, last_activity = _COOKIE_HEADER.unpack_from(payload)
+            session_id = payload[_COOKIE_HEADER.size:].decode("utf-8")
+        except (binascii.Error, struct.error, UnicodeDecodeError, ValueError):
+            return None
+        if not session_id:
+            return None
+        return ChatSession(
+            session_id=session_id,
+            created_at=_epoch_to_iso(created_at),
+            last_activity=_epoch_to_iso(last_activity),
+        )
+    
     def _set_session_cookie(
         self, response: Response, session: ChatSession
     ) -> None:
@@ -199,7 +303,7 @@ class SessionManager:
         """
         response.set_cookie(
             key=CHAT_SESSION_COOKIE_NAME,
-            value=json.dumps(session.to_dict()),
+            value=self.encode_cookie(session),
             httponly=True,
             secure=self.cookie_secure,
             samesite=self.cookie_samesite,
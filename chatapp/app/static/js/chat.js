@@ -3094,7 +3094,9 @@ async function refreshMemory(forceRefresh = false) {
             promises.push(loadEventMemory(forceRefresh));
         }
         
-        if (typeof loadSemanticMemoryByType === 'function') {
+        if (typeof loadAllSemanticMemory === 'function') {
+            promises.push(loadAllSemanticMemory(forceRefresh));
+        } else if (typeof loadSemanticMemoryByType === 'function') {
             promises.push(loadSemanticMemoryByType('facts', forceRefresh));
             promises.push(loadSemanticMemoryByType('summaries', forceRefresh));
             promises.push(loadSemanticMemoryByType('preferences', forceRefresh));
@@ -1,4 +1,16 @@
-"""Storage services for persistent data."""
+"""Storage services for persistent data.
+
+All services use the synchronous boto3 DynamoDB client and run each call in
+a worker thread via ``asyncio.to_thread``, so the event loop is never
+blocked on network I/O. This is deliberate rather than a native async
+client (aioboto3): aiobotocore pins
+exact botocore versions, which would conflict with the boto3 used by the
+rest of the app and the agent. The thread-pool model also works unchanged
+under the Lambda Web Adapter deployment. Every blocking helper is a
+``_*_sync`` method that holds no event-loop state; query
+methods that stream results build lazy ``_*_pages`` iterators and fetch one
+page per thread hop via ``aiter_items``.
+"""
 
 from app.storage.usage import UsageStorageService
 from app.storage.feedback import FeedbackStorageService
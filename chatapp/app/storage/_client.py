@@ -0,0 +1,188 @@
+"""Shared DynamoDB client and helpers for the storage services.
+
+botocore clients are thread-safe and each one owns its own HTTPS connection
+pool, so the storage services share one client per region instead of
+building a new one (and a new pool) per service instance.
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Sequence
+
+import boto3
+from botocore.config import Config
+
+# Upper bound on parallel scan segments (one worker thread each)
+MAX_SCAN_SEGMENTS = 8
+
+
+@lru_cache(maxsize=1)
+def default_region() -> str:
+    """Resolve the AWS region once per process.
+    
+    Checks AWS_REGION, then AWS_DEFAULT_REGION, then the region of the
+    default boto3 session (shared config/profile), and finally falls back
+    to us-east-1. None of these touch the network.
+    
+    Returns:
+        AWS region name
+    """
+    return (
+        os.environ.get("AWS_REGION")
+        or os.environ.get("AWS_DEFAULT_REGION")
+        or boto3.session.Session().region_name
+        or "us-east-1"
+    )
+
+
+@lru_cache(maxsize=None)
+def get_ddb_client(region: str):
+    """Return the shared DynamoDB client for a region.
+    
+    Args:
+        region: AWS region for DynamoDB
+        
+    Returns:
+        boto3 DynamoDB client (created on first use, then reused)
+    """
+    boto_config = Config(
+        region_name=region,
+        retries={"max_attempts": 3, "mode": "adaptive"},
+        # Size the urllib3 pool for the worker threads sharing this client;
+        # threads beyond it would open (and TLS-handshake) new connections
+        max_pool_connections=int(os.environ.get("BOTO_MAX_POOL_CONNECTIONS", "50")),
+        # Keep idle pooled connections alive between bursts of requests
+        tcp_keepalive=True,
+        # Fail fast on a stalled connection instead of pinning a worker
+        # thread for the 60 s botocore default; retries cover transient drops
+        connect_timeout=1,
+        read_timeout=3,
+    )
+    return boto3.client("dynamodb", config=boto_config)
+
+
+async def aiter_items(
+    pages: Iterable[dict],
+    prefetch: bool = False,
+) -> AsyncIterator[dict]:
+    """Yield items from DynamoDB response pages as each page arrives.
+    
+    Each page is fetched in a worker thread, so only one page is held in
+    memory at a time and the caller sees the first items after one round
+    trip rather than after the last page.
+    
+    Args:
+        pages: Lazy page iterable (e.g. from ``paginator.paginate(...)``)
+        prefetch: Request the next page while the caller consumes the
+            current one, overlapping the round trip with item processing
+            (at most one extra page is fetched if the caller stops early)
+        
+    Yields:
+        DynamoDB items in page order
+    """
+    page_iter = iter(pages)
+    if not prefetch:
+        while True:
+            page = await asyncio.to_thread(next, page_iter, None)
+            if page is None:
+                return
+            for item in page.get("Items", []):
+                yield item
+    
+    pending = asyncio.ensure_future(asyncio.to_thread(next, page_iter, None))
+    try:
+        while True:
+            page = await pending
+            if page is None:
+                return
+            pending = asyncio.ensure_future(asyncio.to_thread(next, page_iter, None))
+            for item in page.get("Items", []):
+                yield item
+    finally:
+        if not pending.done():
+            pending.cancel()
+
+
+def scan_items(client, params: Dict[str, Any], total_segments: int = 1) -> list:
+    """Scan a table synchronously, optionally as a parallel scan.
+    
+    With more than one segment each Segment is paginated in its own worker
+    thread (sharing ``client`` and its connection pool) and the results are
+    concatenated in segment order.
+    
+    Args:
+        client: boto3 DynamoDB client
+        params: Scan parameters (TableName, projection, filters, ...)
+        total_segments: Number of segments, capped at MAX_SCAN_SEGMENTS
+        
+    Returns:
+        List of DynamoDB items
+    """
+    total_segments = min(MAX_SCAN_SEGMENTS, max(1, total_segments))
+    paginator = client.get_paginator("scan")
+    
+    def scan_segment(segment: Optional[int]) -> list:
+        segment_params = params
+        if segment is not None:
+            segment_params = {
+                **params,
+                "Segment": segment,
+                "TotalSegments": total_segments,
+            }
+        pages = paginator.paginate(**segment_params)
+        return list(chain.from_iterable(page.get("Items", []) for page in pages))
+    
+    if total_segments == 1:
+        return scan_segment(None)
+    with ThreadPoolExecutor(max_workers=total_segments) as executor:
+        return list(
+            chain.from_iterable(executor.map(scan_segment, range(total_segments)))
+        )
+
+
+def projection_kwargs(
+    attributes: Optional[Sequence[str]],
+    names: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """Build ProjectionExpression request parameters for a read.
+    
+    Attribute names are always aliased (``#p0``, ``#p1``, ...) so reserved
+    words such as ``timestamp`` are safe. Any placeholders the request
+    already uses are merged into ExpressionAttributeNames.
+    
+    Args:
+        attributes: Attributes to return, or None for all attributes
+        names: Existing ExpressionAttributeNames for the request
+        
+    Returns:
+        Keyword arguments to pass to scan/query (empty names are omitted)
+    """
+    if not attributes:
+        return {"ExpressionAttributeNames": names} if names else {}
+    aliases = {f"#p{i}": attribute for i, attribute in enumerate(attributes)}
+    return {
+        "ProjectionExpression": ",".join(aliases),
+        "ExpressionAttributeNames": {**(names or {}), **aliases},
+    }
+
+
+def utc_now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string.
+    
+    Same format as ``datetime.now(timezone.utc).isoformat()``, except that
+    the microsecond field is always present. Every value therefore has the
+    same width and sorts correctly as a string. It also avoids building a
+    datetime object.
+    
+    Returns:
+        Timestamp such as ``2025-01-31T12:00:00.000123+00:00``
+    """
+    seconds, remainder = divmod(time.time_ns(), 1_000_000_000)
+    return (
+        time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        + f".{remainder // 1000:06d}+00:00"
+    )
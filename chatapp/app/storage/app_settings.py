@@ -7,26 +7,78 @@ storing and querying application settings.
 import asyncio
 import logging
 import os
-from datetime import datetime
-from typing import Dict, Optional
+import time
+from typing import Any, Dict, Optional, Sequence, Set, Tuple
 
-import boto3
-from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from app.models.app_settings import AppSetting
+from app.storage._client import (
+    MAX_SCAN_SEGMENTS,
+    default_region,
+    get_ddb_client,
+    projection_kwargs,
+    scan_items,
+    utc_now_iso,
+)
 
 logger = logging.getLogger(__name__)
 
+# Short-TTL read cache shared by all service instances (the service is
+# constructed per request). Keyed by (table_name, setting_key), with the
+# full scan result stored under _ALL_SETTINGS_KEY. update_setting keeps the
+# entries current in this worker; other workers see changes within the TTL.
+_SETTINGS_READ_CACHE: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+_SETTINGS_READ_CACHE_TTL_SECONDS = 30
+_ALL_SETTINGS_KEY = "__all__"
+
+# In-flight "all settings" refreshes by table (single-flight), and a per-table
+# write counter so a refresh that overlaps update_setting doesn't cache a
+# pre-write scan
+_REFRESH_TASKS: Dict[str, "asyncio.Task"] = {}
+_SETTINGS_GENERATION: Dict[str, int] = {}
+# Tables written since their last full scan; the next scan uses
+# ConsistentRead so it can't miss the write
+_CONSISTENT_REFRESH: Set[str] = set()
+
+
+def _cache_get(table_name: str, key: str) -> Tuple[bool, Any]:
+    """Return (hit, value) for a cached read, dropping expired entries."""
+    entry = _SETTINGS_READ_CACHE.get((table_name, key))
+    if entry is None:
+        return False, None
+    if entry[0] <= time.monotonic():
+        _SETTINGS_READ_CACHE.pop((table_name, key), None)
+        return False, None
+    return True, entry[1]
+
+
+def _cache_put(table_name: str, key: str, value: Any) -> None:
+    """Cache a read result for the TTL window."""
+    _SETTINGS_READ_CACHE[(table_name, key)] = (
+        time.monotonic() + _SETTINGS_READ_CACHE_TTL_SECONDS,
+        value,
+    )
+
 
 class AppSettingsStorageService:
     """Async service for storing app settings in DynamoDB.
     
+    Reads are eventually consistent (READ_CONSISTENCY = False), which costs
+    half the read capacity of a strongly consistent read. Settings change
+    rarely and reads already go through a short-TTL cache, so a read that
+    lags a write by a moment is acceptable; update_setting refreshes this
+    worker's cache itself rather than relying on a consistent re-read.
+    
     Attributes:
         table_name: Name of the DynamoDB table
         region: AWS region for DynamoDB
+        scan_segments: Parallel scan segments (APP_SETTINGS_SCAN_SEGMENTS env var)
     """
     
+    # ConsistentRead flag for get_item/scan (override in a subclass if needed)
+    READ_CONSISTENCY = False
+    
     def __init__(
         self,
         table_name: Optional[str] = None,
@@ -36,30 +88,119 @@ class AppSettingsStorageService:
         
         Args:
             table_name: DynamoDB table name (defaults to APP_SETTINGS_TABLE_NAME env var)
-            region: AWS region (defaults to AWS_REGION env var)
+            region: AWS region (defaults to default_region())
         """
         self.table_name = table_name or os.environ.get(
             "APP_SETTINGS_TABLE_NAME", "agentcore-app-settings"
         )
-        self.region = region or os.environ.get("AWS_REGION", "us-east-1")
-        
-        # Configure boto3 client with retry settings
-        boto_config = Config(
-            region_name=self.region,
-            retries={"max_attempts": 3, "mode": "adaptive"},
+        self.region = region or default_region()
+        # Parallel scan segments (the settings table is normally tiny, so a
+        # serial scan is the default; raise this for large tables)
+        self.scan_segments = min(
+            MAX_SCAN_SEGMENTS,
+            max(1, int(os.environ.get("APP_SETTINGS_SCAN_SEGMENTS", "1"))),
         )
         
-        self._client = boto3.client("dynamodb", config=boto_config)
+        # Shared client (one connection pool per region)
+        self._client = get_ddb_client(self.region)
 
-    async def get_all_settings(self) -> Dict[str, AppSetting]:
+    async def get_all_settings(
+        self,
+        attributes: Optional[Sequence[str]] = None,
+    ) -> Dict[str, AppSetting]:
         """Get all app settings.
         
+        Full reads are served from a short-TTL in-process cache. Once the
+        entry expires the stale value is still returned while a single
+        background task rescans the table (stale-while-revalidate), so
+        concurrent readers never queue behind the scan. Projected reads
+        always go to DynamoDB.
+        
+        Args:
+            attributes: Attributes to return (ProjectionExpression), or None
+                for all. setting_key is always included.
+        
+        Returns:
+            Dictionary mapping setting_key to AppSetting (missing attributes
+            take their defaults)
+        """
+        if attributes:
+            if "setting_key" not in attributes:
+                attributes = ["setting_key", *attributes]
+            return await self._load_all_settings(attributes) or {}
+        
+        entry = _SETTINGS_READ_CACHE.get((self.table_name, _ALL_SETTINGS_KEY))
+        if entry is not None:
+            if entry[0] <= time.monotonic():
+                self._refresh_all_settings()
+            return dict(entry[1])
+        
+        # Cold cache: wait for the (shared) refresh. A refresh overlapped by
+        # update_setting returns None; scan again so the write is visible.
+        while True:
+            generation = _SETTINGS_GENERATION.get(self.table_name, 0)
+            settings = await asyncio.shield(self._refresh_all_settings())
+            if settings is not None or (
+                generation == _SETTINGS_GENERATION.get(self.table_name, 0)
+            ):
+                return dict(settings or {})
+
+    def _refresh_all_settings(self) -> "asyncio.Task":
+        """Start a cache refresh for this table, or join the one in flight.
+        
+        Returns:
+            Task resolving to the scanned settings (None on error)
+        """
+        task = _REFRESH_TASKS.get(self.table_name)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(
+                self._refresh_all_settings_task()
+            )
+            _REFRESH_TASKS[self.table_name] = task
+        return task
+
+    async def _refresh_all_settings_task(self) -> Optional[Dict[str, AppSetting]]:
+        """Scan the table and repopulate the cache (single-flight body).
+        
+        The first scan after update_setting is strongly consistent.
+        
         Returns:
-            Dictionary mapping setting_key to AppSetting
+            The scanned settings, or None on error or if update_setting ran
+            mid-scan (the scan may predate that write)
         """
+        generation = _SETTINGS_GENERATION.get(self.table_name, 0)
+        consistent = self.table_name in _CONSISTENT_REFRESH
         try:
-            loop = asyncio.get_event_loop()
-            items = await loop.run_in_executor(None, self._scan_all_sync)
+            settings = await self._load_all_settings(None, consistent=consistent)
+            if generation != _SETTINGS_GENERATION.get(self.table_name, 0):
+                return None
+            if settings is not None:
+                _cache_put(self.table_name, _ALL_SETTINGS_KEY, settings)
+                _CONSISTENT_REFRESH.discard(self.table_name)
+            return settings
+        finally:
+            # update_setting may already have replaced this task
+            if _REFRESH_TASKS.get(self.table_name) is asyncio.current_task():
+                del _REFRESH_TASKS[self.table_name]
+
+    async def _load_all_settings(
+        self,
+        attributes: Optional[Sequence[str]],
+        consistent: bool = False,
+    ) -> Optional[Dict[str, AppSetting]]:
+        """Scan all settings from DynamoDB.
+        
+        Args:
+            attributes: Attributes to return, or None for all
+            consistent: Force a strongly consistent scan
+            
+        Returns:
+            Dictionary mapping setting_key to AppSetting, or None on error
+        """
+        try:
+            items = await asyncio.to_thread(
+                self._scan_all_sync, attributes, consistent
+            )
             return {
                 item.setting_key: item
                 for item in [AppSetting.from_dynamodb_item(i) for i in items]
@@ -72,27 +213,37 @@ class AppSettingsStorageService:
                     "error_message": str(e),
                 },
             )
-            return {}
+            return None
         except Exception as e:
             logger.error(
                 "Failed to get all settings (unexpected error)",
                 extra={"error": str(e)},
             )
-            return {}
+            return None
 
-    def _scan_all_sync(self) -> list:
+    def _scan_all_sync(
+        self,
+        attributes: Optional[Sequence[str]] = None,
+        consistent: bool = False,
+    ) -> list:
         """Synchronous helper to scan all items.
         
+        With more than one segment the table is read as a parallel scan
+        (see scan_items).
+        
+        Args:
+            attributes: Attributes to return, or None for all
+            consistent: Force a strongly consistent scan
+        
         Returns:
             List of DynamoDB items
         """
-        items = []
-        paginator = self._client.get_paginator("scan")
-        
-        for page in paginator.paginate(TableName=self.table_name):
-            items.extend(page.get("Items", []))
-        
-        return items
+        params = {
+            "TableName": self.table_name,
+            "ConsistentRead": self.READ_CONSISTENCY or consistent,
+            **projection_kwargs(attributes),
+        }
+        return scan_items(self._client, params, self.scan_segments)
 
     async def get_setting(self, setting_key: str) -> Optional[AppSetting]:
         """Get a specific setting by key.
@@ -100,17 +251,23 @@ class AppSettingsStorageService:
         Args:
             setting_key: The setting key to retrieve
             
+        Served from a short-TTL in-process cache when possible (misses are
+        cached too).
+        
         Returns:
             AppSetting if found, None otherwise
         """
+        hit, cached = _cache_get(self.table_name, setting_key)
+        if hit:
+            return cached
+        
         try:
-            loop = asyncio.get_event_loop()
-            item = await loop.run_in_executor(
-                None, self._get_item_sync, setting_key
+            item = await asyncio.to_thread(
+                self._get_item_sync, setting_key
             )
-            if item:
-                return AppSetting.from_dynamodb_item(item)
-            return None
+            setting = AppSetting.from_dynamodb_item(item) if item else None
+            _cache_put(self.table_name, setting_key, setting)
+            return setting
         except ClientError as e:
             logger.error(
                 "Failed to get setting (DynamoDB error)",
@@ -140,6 +297,7 @@ class AppSettingsStorageService:
         response = self._client.get_item(
             TableName=self.table_name,
             Key={"setting_key": {"S": setting_key}},
+            ConsistentRead=self.READ_CONSISTENCY,
         )
         return response.get("Item")
 
@@ -152,6 +310,12 @@ class AppSettingsStorageService:
     ) -> Optional[AppSetting]:
         """Update or create a setting.
         
+        On success the new value is written through to this worker's read
+        cache (both the single-key entry and the cached "all settings"
+        dict), and the next full scan is strongly consistent, so reads here
+        never see the pre-update value even though they are normally
+        eventually consistent. Other workers converge within the cache TTL.
+        
         Args:
             setting_key: The setting key
             setting_value: The new value
@@ -162,7 +326,7 @@ class AppSettingsStorageService:
             Updated AppSetting if successful, None otherwise
         """
         try:
-            now = datetime.utcnow().isoformat()
+            now = utc_now_iso()
             
             setting = AppSetting(
                 setting_key=setting_key,
@@ -172,8 +336,22 @@ class AppSettingsStorageService:
                 updated_at=now,
             )
             
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self._put_item_sync, setting)
+            await asyncio.to_thread(self._put_item_sync, setting)
+            
+            # Keep this worker's read cache consistent with the write
+            _SETTINGS_GENERATION[self.table_name] = (
+                _SETTINGS_GENERATION.get(self.table_name, 0) + 1
+            )
+            _CONSISTENT_REFRESH.add(self.table_name)
+            entry = _SETTINGS_READ_CACHE.get((self.table_name, _ALL_SETTINGS_KEY))
+            if entry is not None:
+                _SETTINGS_READ_CACHE[(self.table_name, _ALL_SETTINGS_KEY)] = (
+                    entry[0],
+                    {**entry[1], setting_key: setting},
+                )
+            # Readers arriving now must not join a refresh that predates the write
+            _REFRESH_TASKS.pop(self.table_name, None)
+            _cache_put(self.table_name, setting_key, setting)
             
             logger.info(
                 "Updated app setting",
@@ -0,0 +1,330 @@
+"""Coalescing DynamoDB writer for fire-and-forget storage operations.
+
+This module provides the BatchWriter class, which buffers PutRequests for a
+table and flushes them with BatchWriteItem (up to 25 items per request)
+instead of issuing one PutItem per record. Writers are shared per table so
+every service instance feeds the same buffer.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Dict, List, Optional, Sequence
+
+from botocore.exceptions import ClientError
+
+logger = logging.getLogger(__name__)
+
+# DynamoDB BatchWriteItem accepts at most 25 put/delete requests per call
+MAX_BATCH_SIZE = 25
+
+# Errors that mean "slow down" rather than "this batch is bad"
+_THROTTLING_ERROR_CODES = frozenset({
+    "ProvisionedThroughputExceededException",
+    "ThrottlingException",
+    "RequestLimitExceeded",
+})
+
+# Writers keyed by table name (shared across service instances)
+_WRITERS: Dict[str, "BatchWriter"] = {}
+
+
+class BatchWriter:
+    """Buffers DynamoDB items and writes them in batches.
+
+    Items are queued without blocking the caller. A background task drains
+    the queue, collecting up to MAX_BATCH_SIZE items or waiting at most
+    ``max_delay`` seconds after the first item, then writes the batch in a
+    worker thread. Unprocessed items, and whole batches rejected by
+    throttling, are retried with exponential backoff and jitter. A batch
+    rejected for any other reason is written item by item, so one bad
+    record only fails itself. Errors are logged but never raised.
+
+    BatchWriteItem rejects a whole request that puts the same key twice, so
+    when ``key_attributes`` is set only the last item per key in a batch is
+    sent (the earlier ones would have been overwritten anyway).
+
+    Attributes:
+        table_name: Name of the DynamoDB table
+        key_attributes: Primary key attribute names used to dedupe a batch
+        max_delay: Maximum seconds to wait for a batch to fill
+        max_retries: Retry attempts for unprocessed items
+        written: Count of items written successfully
+        failed: Count of items that could not be written
+        dropped: Count of items rejected because the buffer was full
+    """
+
+    def __init__(
+        self,
+        client,
+        table_name: str,
+        max_delay: float = 0.05,
+        max_queue_size: int = 1000,
+        max_retries: int = 5,
+        key_attributes: Sequence[str] = (),
+    ):
+        """Initialize the batch writer.
+
+        Args:
+            client: boto3 DynamoDB client
+            table_name: DynamoDB table name
+            max_delay: Maximum seconds to wait for a batch to fill
+            max_queue_size: Items buffered before new items are dropped
+            max_retries: Retry attempts for unprocessed items
+            key_attributes: Primary key attribute names (empty to skip
+                deduplication)
+        """
+        self._client = client
+        self.table_name = table_name
+        self.key_attributes = tuple(key_attributes)
+        self.max_delay = max_delay
+        self.max_retries = max_retries
+        self._max_queue_size = max_queue_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # Items taken off the queue for the batch being collected; kept here
+        # so flush() can write them if the task is cancelled mid-collection
+        self._collecting: List[dict] = []
+        self.written = 0
+        self.failed = 0
+        self.dropped = 0
+
+    def enqueue(self, item: dict) -> bool:
+        """Queue an item for writing without blocking.
+
+        Starts the background flush task on first use.
+
+        Args:
+            item: DynamoDB item (attribute-value format)
+
+        Returns:
+            True if queued, False if the buffer is full and the item was dropped
+        """
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._max_queue_size)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning(
+                "Batch write buffer full, dropping item",
+                extra={"table_name": self.table_name},
+            )
+            return False
+
+    async def _run(self) -> None:
+        """Background loop: collect items into batches and write them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            self._collecting.append(await self._queue.get())
+            deadline = loop.time() + self.max_delay
+            while len(self._collecting) < MAX_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    self._collecting.append(
+                        await asyncio.wait_for(self._queue.get(), timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+            # Hand the batch off before writing; once in the worker thread
+            # it is written even if this task is cancelled
+            batch, self._collecting = self._collecting, []
+            await asyncio.to_thread(self._write_batch_sync, batch)
+
+    async def flush(self) -> None:
+        """Stop the background task and write any buffered items.
+
+        Called on application shutdown so queued records are not lost.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+        if self._queue is None:
+            return
+        # Start with any partial batch the cancelled task was collecting
+        pending, self._collecting = self._collecting, []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for start in range(0, len(pending), MAX_BATCH_SIZE):
+            await asyncio.to_thread(
+                self._write_batch_sync, pending[start:start + MAX_BATCH_SIZE]
+            )
+
+    def _write_batch_sync(self, items: List[dict]) -> None:
+        """Synchronous helper to write a batch, retrying unprocessed items.
+
+        Args:
+            items: Up to MAX_BATCH_SIZE DynamoDB items
+        """
+        if self.key_attributes:
+            items = self._dedupe(items)
+        requests = [{"PutRequest": {"Item": item}} for item in items]
+        try:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    response = self._client.batch_write_item(
+                        RequestItems={self.table_name: requests}
+                    )
+                except ClientError as e:
+                    # botocore has already retried a few times; keep backing
+                    # off on throttling since this runs off the request path
+                    code = e.response.get("Error", {}).get("Code")
+                    if code not in _THROTTLING_ERROR_CODES:
+                        # One bad item (e.g. over the 400 KB limit) fails the
+                        # whole request; put items one by one to isolate it
+                        self.written += len(items) - len(requests)
+                        self._put_items_sync(
+                            [request["PutRequest"]["Item"] for request in requests],
+                            e,
+                        )
+                        return
+                    if attempt == self.max_retries:
+                        raise
+                    time.sleep(random.uniform(0, 0.05 * (2 ** attempt)))
+                    continue
+                requests = response.get("UnprocessedItems", {}).get(self.table_name, [])
+                if not requests:
+                    self.written += len(items)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Stored batch",
+                            extra={"table_name": self.table_name, "count": len(items)},
+                        )
+                    return
+                if attempt < self.max_retries:
+                    # Exponential backoff with full jitter
+                    time.sleep(random.uniform(0, 0.05 * (2 ** attempt)))
+            self.written += len(items) - len(requests)
+            self.failed += len(requests)
+            logger.error(
+                "Failed to store batch (unprocessed items remain)",
+                extra={"table_name": self.table_name, "unprocessed": len(requests)},
+            )
+        except ClientError as e:
+            self.written += len(items) - len(requests)
+            self.failed += len(requests)
+            logger.error(
+                "Failed to store batch (DynamoDB error)",
+                extra={
+                    "table_name": self.table_name,
+                    "count": len(items),
+                    "error_code": e.response.get("Error", {}).get("Code"),
+                    "error_message": str(e),
+                },
+            )
+        except Exception as e:
+            self.written += len(items) - len(requests)
+            self.failed += len(requests)
+            logger.error(
+                "Failed to store batch (unexpected error)",
+                extra={
+                    "table_name": self.table_name,
+                    "count": len(items),
+                    "error": str(e),
+                },
+            )
+
+    def _put_items_sync(self, items: List[dict], batch_error: ClientError) -> None:
+        """Write items with individual PutItem calls after a batch is rejected.
+
+        Args:
+            items: DynamoDB items from the rejected batch
+            batch_error: The error BatchWriteItem raised (logged once)
+        """
+        logger.warning(
+            "Batch rejected, writing items individually",
+            extra={
+                "table_name": self.table_name,
+                "count": len(items),
+                "error_code": batch_error.response.get("Error", {}).get("Code"),
+            },
+        )
+        for item in items:
+            try:
+                self._client.put_item(TableName=self.table_name, Item=item)
+                self.written += 1
+            except ClientError as e:
+                self.failed += 1
+                logger.error(
+                    "Failed to store item (DynamoDB error)",
+                    extra={
+                        "table_name": self.table_name,
+                        "error_code": e.response.get("Error", {}).get("Code"),
+                        "error_message": str(e),
+                    },
+                )
+            except Exception as e:
+                self.failed += 1
+                logger.error(
+                    "Failed to store item (unexpected error)",
+                    extra={"table_name": self.table_name, "error": str(e)},
+                )
+
+    def _dedupe(self, items: List[dict]) -> List[dict]:
+        """Keep only the last item for each primary key, in arrival order.
+
+        Superseded items count as written, as separate puts would have been
+        overwritten by the later one.
+
+        Args:
+            items: DynamoDB items (attribute-value format)
+
+        Returns:
+            Items with unique primary keys
+        """
+        latest: Dict[tuple, dict] = {}
+        for item in items:
+            key = tuple(
+                tuple(item.get(name, {}).items()) for name in self.key_attributes
+            )
+            latest.pop(key, None)
+            latest[key] = item
+        if len(latest) < len(items):
+            self.written += len(items) - len(latest)
+            logger.debug(
+                "Dropped superseded items from batch",
+                extra={
+                    "table_name": self.table_name,
+                    "count": len(items) - len(latest),
+                },
+            )
+        return list(latest.values())
+
+
+def get_batch_writer(
+    client,
+    table_name: str,
+    key_attributes: Sequence[str] = (),
+) -> BatchWriter:
+    """Get the shared batch writer for a table, creating it if needed.
+
+    Args:
+        client: boto3 DynamoDB client (used only when creating the writer)
+        table_name: DynamoDB table name
+        key_attributes: Primary key attribute names (used only when
+            creating the writer)
+
+    Returns:
+        BatchWriter for the table
+    """
+    writer = _WRITERS.get(table_name)
+    if writer is None:
+        writer = BatchWriter(client, table_name, key_attributes=key_attributes)
+        _WRITERS[table_name] = writer
+    return writer
+
+
+async def flush_all() -> None:
+    """Flush every batch writer (call on application shutdown)."""
+    for writer in list(_WRITERS.values()):
+        await writer.flush()
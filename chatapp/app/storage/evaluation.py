@@ -9,16 +9,22 @@ import asyncio
 import logging
 import os
 from datetime import datetime
+from itertools import chain
 from typing import List, Optional
 
-import boto3
-from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from app.models.evaluation import EvaluationRecord
+from app.storage._client import default_region, get_ddb_client
 
 logger = logging.getLogger(__name__)
 
+# Expression fragments shared by every query (built once, not per call)
+_TS_NAMES = {"#ts": "timestamp"}
+_USER_RANGE_KCE = "user_id = :uid AND #ts BETWEEN :start AND :end"
+_SESSION_KCE = "session_id = :sid"
+_TS_RANGE_FILTER = "#ts BETWEEN :start AND :end"
+
 
 class EvaluationStorageService:
     """Async service for storing evaluation records in DynamoDB.
@@ -35,19 +41,15 @@ class EvaluationStorageService:
         self.table_name = table_name or os.environ.get(
             "EVALUATIONS_TABLE_NAME", "agentcore-evaluations"
         )
-        self.region = region or os.environ.get("AWS_REGION", "us-east-1")
+        self.region = region or default_region()
 
-        boto_config = Config(
-            region_name=self.region,
-            retries={"max_attempts": 3, "mode": "adaptive"},
-        )
-        self._client = boto3.client("dynamodb", config=boto_config)
+        # Shared client (one connection pool per region)
+        self._client = get_ddb_client(self.region)
 
     async def store_evaluation(self, record: EvaluationRecord) -> None:
         """Store a single evaluation record without blocking."""
         try:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self._put_item, record)
+            await asyncio.to_thread(self._put_item, record)
             logger.debug(
                 "Stored evaluation record",
                 extra={
@@ -69,8 +71,7 @@ class EvaluationStorageService:
     async def store_evaluations_batch(self, records: List[EvaluationRecord]) -> None:
         """Store multiple evaluation records using batch write."""
         try:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self._batch_write, records)
+            await asyncio.to_thread(self._batch_write, records)
             logger.info(
                 "Stored evaluation batch",
                 extra={"count": len(records)},
@@ -103,9 +104,8 @@ class EvaluationStorageService:
     async def query_by_session(self, session_id: str) -> List[EvaluationRecord]:
         """Query all evaluation records for a session."""
         try:
-            loop = asyncio.get_event_loop()
-            items = await loop.run_in_executor(
-                None, self._query_by_session_sync, session_id
+            items = await asyncio.to_thread(
+                self._query_by_session_sync, session_id
             )
             return [EvaluationRecord.from_dynamodb_item(item) for item in items]
         except Exception as e:
@@ -117,15 +117,13 @@ class EvaluationStorageService:
 
     def _query_by_session_sync(self, session_id: str) -> List[dict]:
         """Synchronous helper to query by session."""
-        items = []
         paginator = self._client.get_paginator("query")
-        for page in paginator.paginate(
+        pages = paginator.paginate(
             TableName=self.table_name,
-            KeyConditionExpression="session_id = :sid",
+            KeyConditionExpression=_SESSION_KCE,
             ExpressionAttributeValues={":sid": {"S": session_id}},
-        ):
-            items.extend(page.get("Items", []))
-        return items
+        )
+        return list(chain.from_iterable(page.get("Items", []) for page in pages))
 
     async def query_by_user(
         self,
@@ -135,9 +133,7 @@ class EvaluationStorageService:
     ) -> List[EvaluationRecord]:
         """Query evaluation records for a user within a time range using GSI."""
         try:
-            loop = asyncio.get_event_loop()
-            items = await loop.run_in_executor(
-                None,
+            items = await asyncio.to_thread(
                 self._query_by_user_sync,
                 user_id,
                 start_time.isoformat(),
@@ -155,21 +151,19 @@ class EvaluationStorageService:
         self, user_id: str, start_iso: str, end_iso: str
     ) -> List[dict]:
         """Synchronous helper to query by user using GSI."""
-        items = []
         paginator = self._client.get_paginator("query")
-        for page in paginator.paginate(
+        pages = paginator.paginate(
             TableName=self.table_name,
             IndexName="user-index",
-            KeyConditionExpression="user_id = :uid AND #ts BETWEEN :start AND :end",
-            ExpressionAttributeNames={"#ts": "timestamp"},
+            KeyConditionExpression=_USER_RANGE_KCE,
+            ExpressionAttributeNames=_TS_NAMES,
             ExpressionAttributeValues={
                 ":uid": {"S": user_id},
                 ":start": {"S": start_iso},
                 ":end": {"S": end_iso},
             },
-        ):
-            items.extend(page.get("Items", []))
-        return items
+        )
+        return list(chain.from_iterable(page.get("Items", []) for page in pages))
 
     async def scan_by_time_range(
         self,
@@ -183,9 +177,8 @@ class EvaluationStorageService:
         For production, consider a GSI on a date partition key.
         """
         try:
-            loop = asyncio.get_event_loop()
-            items = await loop.run_in_executor(
-                None, self._scan_by_time_sync, start_time, end_time, limit
+            items = await asyncio.to_thread(
+                self._scan_by_time_sync, start_time, end_time, limit
             )
             return [EvaluationRecord.from_dynamodb_item(item) for item in items]
         except Exception as e:
@@ -199,19 +192,15 @@ class EvaluationStorageService:
         self, start_time: str, end_time: str, limit: int
     ) -> List[dict]:
         """Synchronous helper to scan by time range."""
-        items = []
         paginator = self._client.get_paginator("scan")
-        for page in paginator.paginate(
+        pages = paginator.paginate(
             TableName=self.table_name,
-            FilterExpression="#ts BETWEEN :start AND :end",
-            ExpressionAttributeNames={"#ts": "timestamp"},
+            FilterExpression=_TS_RANGE_FILTER,
+            ExpressionAttributeNames=_TS_NAMES,
             ExpressionAttributeValues={
                 ":start": {"S": start_time},
                 ":end": {"S": end_time},
             },
             PaginationConfig={"MaxItems": limit},
-        ):
-            items.extend(page.get("Items", []))
-            if len(items) >= limit:
-                break
-        return items[:limit]
+        )
+        return list(chain.from_iterable(page.get("Items", []) for page in pages))
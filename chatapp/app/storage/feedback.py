@@ -9,16 +9,25 @@ import asyncio
 import logging
 import os
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence
 
-import boto3
-from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from app.models.feedback import FeedbackRecord
+from app.storage._client import (
+    aiter_items,
+    default_region,
+    get_ddb_client,
+    projection_kwargs,
+)
 
 logger = logging.getLogger(__name__)
 
+# Expression fragments shared by every query (built once, not per call)
+_TS_NAMES = {"#ts": "timestamp"}
+_USER_RANGE_KCE = "user_id = :uid AND #ts BETWEEN :start AND :end"
+_SESSION_KCE = "session_id = :sid"
+
 
 class FeedbackStorageService:
     """Async service for storing feedback records in DynamoDB.
@@ -41,40 +50,30 @@ class FeedbackStorageService:
         
         Args:
             table_name: DynamoDB table name (defaults to FEEDBACK_TABLE_NAME env var)
-            region: AWS region (defaults to AWS_REGION env var)
+            region: AWS region (defaults to default_region())
         """
         self.table_name = table_name or os.environ.get(
             "FEEDBACK_TABLE_NAME", "agentcore-feedback"
         )
-        self.region = region or os.environ.get("AWS_REGION", "us-east-1")
-        
-        # Configure boto3 client with retry settings
-        boto_config = Config(
-            region_name=self.region,
-            retries={"max_attempts": 3, "mode": "adaptive"},
-        )
+        self.region = region or default_region()
         
-        self._client = boto3.client("dynamodb", config=boto_config)
+        # Shared client (one connection pool per region)
+        self._client = get_ddb_client(self.region)
 
 
     async def store_feedback(self, record: FeedbackRecord) -> None:
-        """Store a feedback record without blocking.
+        """Store a feedback record.
         
-        This method performs the storage operation asynchronously using
-        fire-and-forget pattern. Errors are logged but never raised to
-        ensure chat responses are not impacted.
+        Written with a direct PutItem before returning (not batched):
+        feedback is user-initiated and low-volume, and the record must be
+        stored before the route reports success, since a Lambda sandbox can
+        freeze once the response is sent. Errors are logged but never raised.
         
         Args:
             record: The feedback record to store
         """
         try:
-            # Run the synchronous boto3 call in a thread pool
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                self._put_item,
-                record,
-            )
+            await asyncio.to_thread(self._put_item_sync, record)
             logger.info(
                 "Stored feedback record",
                 extra={
@@ -103,8 +102,8 @@ class FeedbackStorageService:
                     "error": str(e),
                 },
             )
-    
-    def _put_item(self, record: FeedbackRecord) -> None:
+
+    def _put_item_sync(self, record: FeedbackRecord) -> None:
         """Synchronous helper to put item in DynamoDB.
         
         Args:
@@ -120,27 +119,28 @@ class FeedbackStorageService:
         user_id: str,
         start_time: datetime,
         end_time: datetime,
-    ) -> List[FeedbackRecord]:
-        """Query feedback records for a user within a time range.
+        attributes: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[FeedbackRecord]:
+        """Stream feedback records for a user within a time range.
         
         Args:
             user_id: The user ID to query
             start_time: Start of the time range (inclusive)
             end_time: End of the time range (inclusive)
+            attributes: Attributes to return (ProjectionExpression), or None for all
             
-        Returns:
-            List of feedback records for the user within the time range
+        Yields:
+            Feedback records for the user within the time range
         """
+        pages = self._query_by_user_pages(
+            user_id,
+            start_time.isoformat(),
+            end_time.isoformat(),
+            attributes,
+        )
         try:
-            loop = asyncio.get_event_loop()
-            items = await loop.run_in_executor(
-                None,
-                self._query_by_user_sync,
-                user_id,
-                start_time.isoformat(),
-                end_time.isoformat(),
-            )
-            return [FeedbackRecord.from_dynamodb_item(item) for item in items]
+            async for item in aiter_items(pages):
+                yield FeedbackRecord.from_dynamodb_item(item)
         except ClientError as e:
             logger.error(
                 "Failed to query feedback records by user",
@@ -150,7 +150,6 @@ class FeedbackStorageService:
                     "error_message": str(e),
                 },
             )
-            return []
         except Exception as e:
             logger.error(
                 "Failed to query feedback records by user (unexpected error)",
@@ -159,60 +158,98 @@ class FeedbackStorageService:
                     "error": str(e),
                 },
             )
-            return []
     
-    def _query_by_user_sync(
+    async def query_columns_by_user(
+        self,
+        user_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        attributes: Sequence[str],
+    ) -> Dict[str, List[Any]]:
+        """Fetch selected attributes for a user's feedback as column lists.
+        
+        Projects the query to ``attributes`` and decodes them straight into
+        parallel lists (see FeedbackRecord.columns_from_dynamodb_items),
+        skipping per-row record construction for aggregation.
+        
+        Args:
+            user_id: The user ID to query
+            start_time: Start of the time range (inclusive)
+            end_time: End of the time range (inclusive)
+            attributes: Attributes to fetch and decode
+            
+        Returns:
+            Dictionary mapping each attribute to a list of values (empty
+            lists on error)
+        """
+        pages = self._query_by_user_pages(
+            user_id,
+            start_time.isoformat(),
+            end_time.isoformat(),
+            attributes,
+        )
+        items = []
+        try:
+            async for item in aiter_items(pages):
+                items.append(item)
+        except Exception as e:
+            logger.error(
+                "Failed to query feedback columns by user",
+                extra={"user_id": user_id, "error": str(e)},
+            )
+            items = []
+        return FeedbackRecord.columns_from_dynamodb_items(items, attributes)
+    
+    def _query_by_user_pages(
         self,
         user_id: str,
         start_time_iso: str,
         end_time_iso: str,
-    ) -> List[dict]:
-        """Synchronous helper to query by user.
+        attributes: Optional[Sequence[str]] = None,
+    ) -> Iterable[dict]:
+        """Build the lazy page iterator for a user query.
         
         Args:
             user_id: The user ID to query
             start_time_iso: Start time in ISO format
             end_time_iso: End time in ISO format
+            attributes: Attributes to return (ProjectionExpression), or None for all
             
         Returns:
-            List of DynamoDB items
+            Page iterator (no request is made until it is iterated)
         """
-        items = []
         paginator = self._client.get_paginator("query")
-        
-        for page in paginator.paginate(
+        return paginator.paginate(
             TableName=self.table_name,
-            KeyConditionExpression="user_id = :uid AND #ts BETWEEN :start AND :end",
-            ExpressionAttributeNames={"#ts": "timestamp"},
+            KeyConditionExpression=_USER_RANGE_KCE,
+            **projection_kwargs(attributes, _TS_NAMES),
             ExpressionAttributeValues={
                 ":uid": {"S": user_id},
                 ":start": {"S": start_time_iso},
                 ":end": {"S": end_time_iso},
             },
-        ):
-            items.extend(page.get("Items", []))
-        
-        return items
+        )
 
-    async def query_by_session(self, session_id: str) -> List[FeedbackRecord]:
-        """Query all feedback records for a session.
+    async def query_by_session(
+        self,
+        session_id: str,
+        attributes: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[FeedbackRecord]:
+        """Stream all feedback records for a session.
         
         Uses the GSI on session_id for efficient lookups.
         
         Args:
             session_id: The session ID to query
+            attributes: Attributes to return (ProjectionExpression), or None for all
             
-        Returns:
-            List of feedback records for the session
+        Yields:
+            Feedback records for the session
         """
+        pages = self._query_by_session_pages(session_id, attributes)
         try:
-            loop = asyncio.get_event_loop()
-            items = await loop.run_in_executor(
-                None,
-                self._query_by_session_sync,
-                session_id,
-            )
-            return [FeedbackRecord.from_dynamodb_item(item) for item in items]
+            async for item in aiter_items(pages):
+                yield FeedbackRecord.from_dynamodb_item(item)
         except ClientError as e:
             logger.error(
                 "Failed to query feedback records by session",
@@ -222,7 +259,6 @@ class FeedbackStorageService:
                     "error_message": str(e),
                 },
             )
-            return []
         except Exception as e:
             logger.error(
                 "Failed to query feedback records by session (unexpected error)",
@@ -231,28 +267,28 @@ class FeedbackStorageService:
                     "error": str(e),
                 },
             )
-            return []
     
-    def _query_by_session_sync(self, session_id: str) -> List[dict]:
-        """Synchronous helper to query by session using GSI.
+    def _query_by_session_pages(
+        self,
+        session_id: str,
+        attributes: Optional[Sequence[str]] = None,
+    ) -> Iterable[dict]:
+        """Build the lazy page iterator for a session query (GSI).
         
         Args:
             session_id: The session ID to query
+            attributes: Attributes to return (ProjectionExpression), or None for all
             
         Returns:
-            List of DynamoDB items
+            Page iterator (no request is made until it is iterated)
         """
-        items = []
         paginator = self._client.get_paginator("query")
-        
-        for page in paginator.paginate(
+        return paginator.paginate(
             TableName=self.table_name,
             IndexName="session-index",
-            KeyConditionExpression="session_id = :sid",
+            KeyConditionExpression=_SESSION_KCE,
+            **projection_kwargs(attributes),
             ExpressionAttributeValues={
                 ":sid": {"S": session_id},
             },
-        ):
-            items.extend(page.get("Items", []))
-        
-        return items
+        )
@@ -5,20 +5,34 @@ and querying guardrail violation records. Storage operations are fire-and-forget
 to avoid blocking chat responses.
 """
 
-import asyncio
 import logging
 import os
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Sequence
 
-import boto3
-from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from app.models.guardrail import GuardrailRecord
+from app.storage._client import (
+    aiter_items,
+    default_region,
+    get_ddb_client,
+    projection_kwargs,
+)
+from app.storage.batch_writer import get_batch_writer
 
 logger = logging.getLogger(__name__)
 
+# Table primary key (batched writes are deduped on it)
+_KEY_ATTRIBUTES = ("user_id", "timestamp")
+
+# Expression fragments shared by every query (built once, not per call)
+_TS_NAMES = {"#ts": "timestamp"}
+_USER_RANGE_KCE = "user_id = :uid AND #ts BETWEEN :start AND :end"
+_SESSION_KCE = "session_id = :sid"
+_DATE_RANGE_KCE = "date_partition = :d AND #ts BETWEEN :start AND :end"
+_TS_RANGE_FILTER = "#ts BETWEEN :start AND :end"
+
 
 class GuardrailStorageService:
     """Async service for storing guardrail records in DynamoDB.
@@ -41,59 +55,42 @@ class GuardrailStorageService:
         
         Args:
             table_name: DynamoDB table name (defaults to GUARDRAIL_TABLE_NAME env var)
-            region: AWS region (defaults to AWS_REGION env var)
+            region: AWS region (defaults to default_region())
         """
         self.table_name = table_name or os.environ.get(
             "GUARDRAIL_TABLE_NAME", "agentcore-guardrail-violations"
         )
-        self.region = region or os.environ.get("AWS_REGION", "us-east-1")
-        
-        # Configure boto3 client with retry settings
-        boto_config = Config(
-            region_name=self.region,
-            retries={"max_attempts": 3, "mode": "adaptive"},
-        )
+        self.region = region or default_region()
         
-        self._client = boto3.client("dynamodb", config=boto_config)
+        # Shared client (one connection pool per region)
+        self._client = get_ddb_client(self.region)
 
 
     async def store_violation(self, record: GuardrailRecord) -> None:
         """Store a guardrail violation record without blocking.
         
-        This method performs the storage operation asynchronously using
-        fire-and-forget pattern. Errors are logged but never raised to
-        ensure chat responses are not impacted.
+        The item is queued on the table's shared BatchWriter and written
+        with BatchWriteItem together with other pending records, so this
+        returns immediately. Errors are logged but never raised to ensure
+        chat responses are not impacted.
         
         Args:
             record: The guardrail record to store
         """
         try:
-            # Run the synchronous boto3 call in a thread pool
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                self._put_item,
-                record,
-            )
-            logger.info(
-                "Stored guardrail violation record",
-                extra={
-                    "user_id": record.user_id,
-                    "session_id": record.session_id,
-                    "source": record.source,
-                    "action": record.action,
-                },
-            )
-        except ClientError as e:
-            logger.error(
-                "Failed to store guardrail record (DynamoDB error)",
-                extra={
-                    "user_id": record.user_id,
-                    "session_id": record.session_id,
-                    "error_code": e.response.get("Error", {}).get("Code"),
-                    "error_message": str(e),
-                },
+            queued = get_batch_writer(
+                self._client, self.table_name, key_attributes=_KEY_ATTRIBUTES
+            ).enqueue(
+                record.to_dynamodb_item()
             )
+            if not queued:
+                logger.error(
+                    "Failed to store guardrail record (buffer full)",
+                    extra={
+                        "user_id": record.user_id,
+                        "session_id": record.session_id,
+                    },
+                )
         except Exception as e:
             logger.error(
                 "Failed to store guardrail record (unexpected error)",
@@ -103,48 +100,32 @@ class GuardrailStorageService:
                     "error": str(e),
                 },
             )
-    
-    def _put_item(self, record: GuardrailRecord) -> None:
-        """Synchronous helper to put item in DynamoDB.
-        
-        Args:
-            record: The guardrail record to store
-        """
-        self._client.put_item(
-            TableName=self.table_name,
-            Item=record.to_dynamodb_item(),
-        )
 
     async def query_violations(
         self,
         start_time: datetime,
         end_time: datetime,
         limit: int = 100,
-    ) -> List[GuardrailRecord]:
-        """Query violations within time range.
+        attributes: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[GuardrailRecord]:
+        """Stream violations within time range.
         
-        This method scans the table for violations within the specified
-        time range. For production use with large datasets, consider
-        adding a GSI on timestamp.
+        Queries the `date-index` GSI one UTC day at a time, falling back to
+        a scan for legacy records without a `date_partition` attribute.
         
         Args:
             start_time: Start of the time range (inclusive)
             end_time: End of the time range (inclusive)
             limit: Maximum number of records to return
+            attributes: Attributes to return (ProjectionExpression), or None for all
             
-        Returns:
-            List of guardrail records within the time range
+        Yields:
+            Guardrail records within the time range
         """
+        pages = self._time_range_pages(start_time, end_time, limit, attributes)
         try:
-            loop = asyncio.get_event_loop()
-            items = await loop.run_in_executor(
-                None,
-                self._scan_by_time_range_sync,
-                start_time.isoformat(),
-                end_time.isoformat(),
-                limit,
-            )
-            return [GuardrailRecord.from_dynamodb_item(item) for item in items]
+            async for item in aiter_items(pages):
+                yield GuardrailRecord.from_dynamodb_item(item)
         except ClientError as e:
             logger.error(
                 "Failed to query guardrail records",
@@ -153,7 +134,6 @@ class GuardrailStorageService:
                     "error_message": str(e),
                 },
             )
-            return []
         except Exception as e:
             logger.error(
                 "Failed to query guardrail records (unexpected error)",
@@ -161,84 +141,148 @@ class GuardrailStorageService:
                     "error": str(e),
                 },
             )
-            return []
     
-    def _scan_by_time_range_sync(
+    async def query_violation_columns(
         self,
-        start_time_iso: str,
-        end_time_iso: str,
-        limit: int,
-    ) -> List[dict]:
-        """Synchronous helper to scan by time range.
+        start_time: datetime,
+        end_time: datetime,
+        attributes: Sequence[str],
+        limit: int = 100,
+    ) -> Dict[str, List[Any]]:
+        """Fetch selected attributes of violations in a range as column lists.
+        
+        Projects the reads to ``attributes`` and decodes them straight into
+        parallel lists (see GuardrailRecord.columns_from_dynamodb_items),
+        skipping per-row record construction for aggregation.
         
         Args:
-            start_time_iso: Start time in ISO format
-            end_time_iso: End time in ISO format
-            limit: Maximum number of items to return
+            start_time: Start of the time range (inclusive)
+            end_time: End of the time range (inclusive)
+            attributes: Attributes to fetch and decode
+            limit: Maximum number of records to return
             
         Returns:
-            List of DynamoDB items
+            Dictionary mapping each attribute to a list of values (empty
+            lists on error)
         """
+        pages = self._time_range_pages(start_time, end_time, limit, attributes)
         items = []
+        try:
+            async for item in aiter_items(pages):
+                items.append(item)
+        except Exception as e:
+            logger.error(
+                "Failed to query guardrail columns",
+                extra={"error": str(e)},
+            )
+            items = []
+        return GuardrailRecord.columns_from_dynamodb_items(items, attributes)
+    
+    def _time_range_pages(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        limit: int,
+        attributes: Optional[Sequence[str]] = None,
+    ) -> Iterator[dict]:
+        """Generate result pages for a time-range query, up to ``limit`` items.
         
-        # Use scan with filter expression for time range
-        # Note: For production with large datasets, consider adding a GSI
-        response = self._client.scan(
-            TableName=self.table_name,
-            FilterExpression="#ts BETWEEN :start AND :end",
-            ExpressionAttributeNames={"#ts": "timestamp"},
-            ExpressionAttributeValues={
-                ":start": {"S": start_time_iso},
-                ":end": {"S": end_time_iso},
-            },
-            Limit=limit,
-        )
+        Each UTC day partition in the range is queried on the `date-index`
+        GSI with a timestamp BETWEEN key condition, so only matching items
+        are read. If the index returns nothing (or does not exist yet) this
+        falls back to a filtered scan. Requests are made lazily as pages are
+        consumed.
         
-        items.extend(response.get("Items", []))
+        Records written before `date_partition` existed are not in the
+        index, and the scan only runs when the index has no match at all.
+        So a range holding both kinds of record returns only the indexed
+        ones. Run scripts/backfill_date_partition.py once after upgrading to
+        add the attribute to legacy records.
         
-        # Handle pagination if needed (up to limit)
-        while "LastEvaluatedKey" in response and len(items) < limit:
-            response = self._client.scan(
-                TableName=self.table_name,
-                FilterExpression="#ts BETWEEN :start AND :end",
-                ExpressionAttributeNames={"#ts": "timestamp"},
-                ExpressionAttributeValues={
-                    ":start": {"S": start_time_iso},
-                    ":end": {"S": end_time_iso},
-                },
-                Limit=limit - len(items),
-                ExclusiveStartKey=response["LastEvaluatedKey"],
+        Args:
+            start_time: Start of the time range (inclusive)
+            end_time: End of the time range (inclusive)
+            limit: Maximum number of items to return
+            attributes: Attributes to return (ProjectionExpression), or None for all
+            
+        Yields:
+            Response pages (dicts with an "Items" list)
+        """
+        # Range bounds are shared by every per-day query and the fallback scan
+        range_values = {
+            ":start": {"S": start_time.isoformat()},
+            ":end": {"S": end_time.isoformat()},
+        }
+        remaining = limit
+        
+        try:
+            paginator = self._client.get_paginator("query")
+            cursor = start_time.date()
+            end_date = end_time.date()
+            while cursor <= end_date and remaining > 0:
+                for page in paginator.paginate(
+                    TableName=self.table_name,
+                    IndexName="date-index",
+                    KeyConditionExpression=_DATE_RANGE_KCE,
+                    **projection_kwargs(attributes, _TS_NAMES),
+                    ExpressionAttributeValues={
+                        ":d": {"S": cursor.isoformat()},
+                        **range_values,
+                    },
+                    PaginationConfig={"MaxItems": remaining},
+                ):
+                    remaining -= len(page.get("Items", []))
+                    yield page
+                cursor += timedelta(days=1)
+        except ClientError as e:
+            if remaining < limit:
+                raise
+            # The index may not exist until the CDK stack is redeployed
+            logger.warning(
+                "date-index query failed; falling back to scan",
+                extra={"error_code": e.response.get("Error", {}).get("Code")},
             )
-            items.extend(response.get("Items", []))
         
-        return items[:limit]
+        if remaining < limit:
+            return
+        
+        paginator = self._client.get_paginator("scan")
+        for page in paginator.paginate(
+            TableName=self.table_name,
+            FilterExpression=_TS_RANGE_FILTER,
+            **projection_kwargs(attributes, _TS_NAMES),
+            ExpressionAttributeValues=range_values,
+            PaginationConfig={"MaxItems": remaining},
+        ):
+            yield page
 
     async def query_by_user(
         self,
         user_id: str,
         start_time: datetime,
         end_time: datetime,
-    ) -> List[GuardrailRecord]:
-        """Query guardrail records for a user within a time range.
+        attributes: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[GuardrailRecord]:
+        """Stream guardrail records for a user within a time range.
         
         Args:
             user_id: The user ID to query
             start_time: Start of the time range (inclusive)
             end_time: End of the time range (inclusive)
+            attributes: Attributes to return (ProjectionExpression), or None for all
             
-        Returns:
-            List of guardrail records for the user within the time range
+        Yields:
+            Guardrail records for the user within the time range
         """
+        pages = self._query_by_user_pages(
+            user_id,
+            start_time.isoformat(),
+            end_time.isoformat(),
+            attributes,
+        )
         try:
-            loop = asyncio.get_event_loop()
-            items = await loop.run_in_executor(
-                None,
-                self._query_by_user_sync,
-                user_id,
-                start_time.isoformat(),
-                end_time.isoformat(),
-            )
-            return [GuardrailRecord.from_dynamodb_item(item) for item in items]
+            async for item in aiter_items(pages):
+                yield GuardrailRecord.from_dynamodb_item(item)
         except ClientError as e:
             logger.error(
                 "Failed to query guardrail records by user",
@@ -248,7 +292,6 @@ class GuardrailStorageService:
                     "error_message": str(e),
                 },
             )
-            return []
         except Exception as e:
             logger.error(
                 "Failed to query guardrail records by user (unexpected error)",
@@ -257,60 +300,57 @@ class GuardrailStorageService:
                     "error": str(e),
                 },
             )
-            return []
     
-    def _query_by_user_sync(
+    def _query_by_user_pages(
         self,
         user_id: str,
         start_time_iso: str,
         end_time_iso: str,
-    ) -> List[dict]:
-        """Synchronous helper to query by user.
+        attributes: Optional[Sequence[str]] = None,
+    ) -> Iterable[dict]:
+        """Build the lazy page iterator for a user query.
         
         Args:
             user_id: The user ID to query
             start_time_iso: Start time in ISO format
             end_time_iso: End time in ISO format
+            attributes: Attributes to return (ProjectionExpression), or None for all
             
         Returns:
-            List of DynamoDB items
+            Page iterator (no request is made until it is iterated)
         """
-        items = []
         paginator = self._client.get_paginator("query")
-        
-        for page in paginator.paginate(
+        return paginator.paginate(
             TableName=self.table_name,
-            KeyConditionExpression="user_id = :uid AND #ts BETWEEN :start AND :end",
-            ExpressionAttributeNames={"#ts": "timestamp"},
+            KeyConditionExpression=_USER_RANGE_KCE,
+            **projection_kwargs(attributes, _TS_NAMES),
             ExpressionAttributeValues={
                 ":uid": {"S": user_id},
                 ":start": {"S": start_time_iso},
                 ":end": {"S": end_time_iso},
             },
-        ):
-            items.extend(page.get("Items", []))
-        
-        return items
+        )
 
-    async def query_by_session(self, session_id: str) -> List[GuardrailRecord]:
-        """Query all guardrail records for a session.
+    async def query_by_session(
+        self,
+        session_id: str,
+        attributes: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[GuardrailRecord]:
+        """Stream all guardrail records for a session.
         
         Uses the GSI on session_id for efficient lookups.
         
         Args:
             session_id: The session ID to query
+            attributes: Attributes to return (ProjectionExpression), or None for all
             
-        Returns:
-            List of guardrail records for the session
+        Yields:
+            Guardrail records for the session
         """
+        pages = self._query_by_session_pages(session_id, attributes)
         try:
-            loop = asyncio.get_event_loop()
-            items = await loop.run_in_executor(
-                None,
-                self._query_by_session_sync,
-                session_id,
-            )
-            return [GuardrailRecord.from_dynamodb_item(item) for item in items]
+            async for item in aiter_items(pages):
+                yield GuardrailRecord.from_dynamodb_item(item)
         except ClientError as e:
             logger.error(
                 "Failed to query guardrail records by session",
@@ -320,7 +360,6 @@ class GuardrailStorageService:
                     "error_message": str(e),
                 },
             )
-            return []
         except Exception as e:
             logger.error(
                 "Failed to query guardrail records by session (unexpected error)",
@@ -329,28 +368,28 @@ class GuardrailStorageService:
                     "error": str(e),
                 },
             )
-            return []
     
-    def _query_by_session_sync(self, session_id: str) -> List[dict]:
-        """Synchronous helper to query by session using GSI.
+    def _query_by_session_pages(
+        self,
+        session_id: str,
+        attributes: Optional[Sequence[str]] = None,
+    ) -> Iterable[dict]:
+        """Build the lazy page iterator for a session query (GSI).
         
         Args:
             session_id: The session ID to query
+            attributes: Attributes to return (ProjectionExpression), or None for all
             
         Returns:
-            List of DynamoDB items
+            Page iterator (no request is made until it is iterated)
         """
-        items = []
         paginator = self._client.get_paginator("query")
-        
-        for page in paginator.paginate(
+        return paginator.paginate(
             TableName=self.table_name,
             IndexName="session-index",
-            KeyConditionExpression="session_id = :sid",
+            KeyConditionExpression=_SESSION_KCE,
+            **projection_kwargs(attributes),
             ExpressionAttributeValues={
                 ":sid": {"S": session_id},
             },
-        ):
-            items.extend(page.get("Items", []))
-        
-        return items
+        )
@@ -123,8 +123,7 @@ async def list_documents() -> dict[str, Any]:
         return {"documents": [], "error": "Knowledge Base source bucket is not configured."}
 
     try:
-        loop = asyncio.get_event_loop()
-        docs = await loop.run_in_executor(None, _list_objects_sync, bucket, _DOC_PREFIX)
+        docs = await asyncio.to_thread(_list_objects_sync, bucket, _DOC_PREFIX)
     except Exception as e:  # noqa: BLE001
         logger.warning("KB list failed: %s", e)
         return {"documents": [], "error": "Could not list documents. Check the server logs for details."}
@@ -164,8 +163,7 @@ async def get_document(key: str) -> dict[str, Any]:
         }
 
     try:
-        loop = asyncio.get_event_loop()
-        content = await loop.run_in_executor(None, _get_object_text_sync, bucket, key)
+        content = await asyncio.to_thread(_get_object_text_sync, bucket, key)
     except Exception as e:  # noqa: BLE001
         logger.warning("KB get_object failed (%s): %s", key, e)
         return {"error": "Could not read document. Check the server logs for details."}
@@ -197,9 +195,8 @@ async def search(query: str, n: int = 5) -> dict[str, Any]:
     if not kb_id:
         return {"results": [], "error": "Knowledge Base is not configured."}
     try:
-        loop = asyncio.get_event_loop()
-        results = await loop.run_in_executor(
-            None, _retrieve_sync, kb_id, query.strip(), max(1, min(int(n), 10))
+        results = await asyncio.to_thread(
+            _retrieve_sync, kb_id, query.strip(), max(1, min(int(n), 10))
         )
     except Exception as e:  # noqa: BLE001
         logger.warning("KB retrieve failed: %s", e)
@@ -255,10 +252,9 @@ async def upload_document(filename: str, data: bytes, content_type: str = "") ->
         return {"error": f"Unsupported file type. Allowed: {allowed}"}
 
     key = f"{_UPLOAD_PREFIX}{safe}"
-    loop = asyncio.get_event_loop()
     try:
-        await loop.run_in_executor(
-            None, _put_object_sync, bucket, key, data, content_type or "application/octet-stream"
+        await asyncio.to_thread(
+            _put_object_sync, bucket, key, data, content_type or "application/octet-stream"
         )
     except Exception as e:  # noqa: BLE001
         logger.warning("KB upload put_object failed (%s): %s", key, e)
@@ -268,7 +264,7 @@ async def upload_document(filename: str, data: bytes, content_type: str = "") ->
     job_id: Optional[str] = None
     ingestion_error: Optional[str] = None
     try:
-        job_id = await loop.run_in_executor(None, _start_ingestion_sync, kb_id)
+        job_id = await asyncio.to_thread(_start_ingestion_sync, kb_id)
     except Exception as e:  # noqa: BLE001
         logger.warning("KB start_ingestion_job failed: %s", e)
         ingestion_error = "Ingestion could not be started. Check the server logs for details."
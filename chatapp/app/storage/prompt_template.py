@@ -7,18 +7,47 @@ storing and querying prompt templates.
 import asyncio
 import logging
 import os
+import random
+import time
 import uuid
-from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 
-import boto3
-from botocore.config import Config
 from botocore.exceptions import ClientError
 
-from app.models.prompt_template import PromptTemplate
+from app.models.prompt_template import PromptTemplate, PromptTemplateSummary
+from app.storage._client import (
+    MAX_SCAN_SEGMENTS,
+    aiter_items,
+    default_region,
+    get_ddb_client,
+    projection_kwargs,
+    scan_items,
+    utc_now_iso,
+)
 
 logger = logging.getLogger(__name__)
 
+# DynamoDB BatchGetItem accepts at most 100 keys per call
+MAX_BATCH_GET_KEYS = 100
+
+# In-place update of the editable template fields (names aliased so they
+# can never collide with DynamoDB reserved words)
+_UPDATE_TEMPLATE_EXPRESSION = (
+    "SET #title = :title, #description = :description, "
+    "#prompt_detail = :prompt_detail, #updated_at = :updated_at"
+)
+_UPDATE_TEMPLATE_NAMES = {
+    "#title": "title",
+    "#description": "description",
+    "#prompt_detail": "prompt_detail",
+    "#updated_at": "updated_at",
+}
+
+
+def _template_key(template_id: str) -> Dict[str, Dict[str, str]]:
+    """Build the primary key for a template item."""
+    return {"template_id": {"S": template_id}}
+
 
 class PromptTemplateStorageService:
     """Async service for storing prompt templates in DynamoDB.
@@ -26,6 +55,7 @@ class PromptTemplateStorageService:
     Attributes:
         table_name: Name of the DynamoDB table
         region: AWS region for DynamoDB
+        scan_segments: Parallel scan segments (PROMPT_TEMPLATES_SCAN_SEGMENTS env var)
     """
     
     def __init__(
@@ -37,31 +67,50 @@ class PromptTemplateStorageService:
         
         Args:
             table_name: DynamoDB table name (defaults to PROMPT_TEMPLATES_TABLE_NAME env var)
-            region: AWS region (defaults to AWS_REGION env var)
+            region: AWS region (defaults to default_region())
         """
         self.table_name = table_name or os.environ.get(
             "PROMPT_TEMPLATES_TABLE_NAME", "agentcore-prompt-templates"
         )
-        self.region = region or os.environ.get("AWS_REGION", "us-east-1")
-        
-        # Configure boto3 client with retry settings
-        boto_config = Config(
-            region_name=self.region,
-            retries={"max_attempts": 3, "mode": "adaptive"},
+        self.region = region or default_region()
+        # Parallel scan segments for get_all_templates (templates are few,
+        # so a serial scan is the default)
+        self.scan_segments = min(
+            MAX_SCAN_SEGMENTS,
+            max(1, int(os.environ.get("PROMPT_TEMPLATES_SCAN_SEGMENTS", "1"))),
         )
         
-        self._client = boto3.client("dynamodb", config=boto_config)
+        # Shared client (one connection pool per region)
+        self._client = get_ddb_client(self.region)
 
-    async def get_all_templates(self) -> List[PromptTemplate]:
+    async def get_all_templates(
+        self,
+        parallelism: Optional[int] = None,
+    ) -> Optional[List[PromptTemplate]]:
         """Get all prompt templates.
         
+        Args:
+            parallelism: Parallel scan segments for this call (defaults to
+                scan_segments)
+        
         Returns:
-            List of all prompt templates
+            List of all prompt templates, or None on error (so callers can
+            tell a failed scan from an empty table and avoid caching it)
         """
         try:
-            loop = asyncio.get_event_loop()
-            items = await loop.run_in_executor(None, self._scan_all_sync)
-            return [PromptTemplate.from_dynamodb_item(item) for item in items]
+            total_segments = parallelism or self.scan_segments
+            if total_segments > 1:
+                items = await asyncio.to_thread(self._scan_all_sync, total_segments)
+                return [PromptTemplate.from_dynamodb_item(item) for item in items]
+            
+            # Serial scan: decode each page while the next one is in flight
+            pages = self._client.get_paginator("scan").paginate(
+                TableName=self.table_name
+            )
+            return [
+                PromptTemplate.from_dynamodb_item(item)
+                async for item in aiter_items(pages, prefetch=True)
+            ]
         except ClientError as e:
             logger.error(
                 "Failed to get all templates (DynamoDB error)",
@@ -70,27 +119,100 @@ class PromptTemplateStorageService:
                     "error_message": str(e),
                 },
             )
-            return []
+            return None
         except Exception as e:
             logger.error(
                 "Failed to get all templates (unexpected error)",
                 extra={"error": str(e)},
             )
-            return []
+            return None
 
-    def _scan_all_sync(self) -> List[dict]:
+    def _scan_all_sync(self, total_segments: int = 1) -> List[dict]:
         """Synchronous helper to scan all items.
         
+        Args:
+            total_segments: Parallel scan segments (1 for a serial scan)
+        
         Returns:
             List of DynamoDB items
         """
-        items = []
-        paginator = self._client.get_paginator("scan")
+        return scan_items(
+            self._client, {"TableName": self.table_name}, total_segments
+        )
+
+    async def list_templates_summary(self) -> List[PromptTemplateSummary]:
+        """Get all templates without their prompt text.
         
-        for page in paginator.paginate(TableName=self.table_name):
-            items.extend(page.get("Items", []))
+        The scan projects PromptTemplateSummary.ATTRIBUTES, so the (possibly
+        large) prompt_detail is never transferred. Load a full template
+        with get_template_by_id when it is needed.
         
-        return items
+        Returns:
+            List of template summaries (empty list on error)
+        """
+        try:
+            items = await asyncio.to_thread(
+                scan_items,
+                self._client,
+                {
+                    "TableName": self.table_name,
+                    **projection_kwargs(PromptTemplateSummary.ATTRIBUTES),
+                },
+                self.scan_segments,
+            )
+            return [PromptTemplateSummary.from_dynamodb_item(item) for item in items]
+        except ClientError as e:
+            logger.error(
+                "Failed to list template summaries (DynamoDB error)",
+                extra={
+                    "error_code": e.response.get("Error", {}).get("Code"),
+                    "error_message": str(e),
+                },
+            )
+            return []
+        except Exception as e:
+            logger.error(
+                "Failed to list template summaries (unexpected error)",
+                extra={"error": str(e)},
+            )
+            return []
+
+    async def next_sort_order(self) -> Optional[int]:
+        """Return the sort_order that places a new template after the others.
+        
+        Reads the table fresh (projecting only sort_order) rather than from
+        any per-worker cache, so back-to-back creates on different workers
+        don't get the same position.
+        
+        Returns:
+            max(sort_order) + 1 (0 for an empty table), or None on error
+        """
+        try:
+            items = await asyncio.to_thread(
+                scan_items,
+                self._client,
+                {"TableName": self.table_name, **projection_kwargs(["sort_order"])},
+                self.scan_segments,
+            )
+            return max(
+                (int(item.get("sort_order", {}).get("N", "0")) for item in items),
+                default=-1,
+            ) + 1
+        except ClientError as e:
+            logger.error(
+                "Failed to read template sort order (DynamoDB error)",
+                extra={
+                    "error_code": e.response.get("Error", {}).get("Code"),
+                    "error_message": str(e),
+                },
+            )
+            return None
+        except Exception as e:
+            logger.error(
+                "Failed to read template sort order (unexpected error)",
+                extra={"error": str(e)},
+            )
+            return None
 
     async def get_template_by_id(self, template_id: str) -> Optional[PromptTemplate]:
         """Get a prompt template by ID.
@@ -102,9 +224,8 @@ class PromptTemplateStorageService:
             PromptTemplate if found, None otherwise
         """
         try:
-            loop = asyncio.get_event_loop()
-            item = await loop.run_in_executor(
-                None, self._get_item_sync, template_id
+            item = await asyncio.to_thread(
+                self._get_item_sync, template_id
             )
             if item:
                 return PromptTemplate.from_dynamodb_item(item)
@@ -137,16 +258,107 @@ class PromptTemplateStorageService:
         """
         response = self._client.get_item(
             TableName=self.table_name,
-            Key={"template_id": {"S": template_id}},
+            Key=_template_key(template_id),
         )
         return response.get("Item")
 
+    async def get_templates_by_ids(
+        self,
+        template_ids: Sequence[str],
+    ) -> List[PromptTemplate]:
+        """Get several prompt templates in as few round trips as possible.
+        
+        IDs are fetched with BatchGetItem in chunks of MAX_BATCH_GET_KEYS,
+        and the chunks run concurrently.
+        
+        Args:
+            template_ids: Template IDs to retrieve (duplicates are ignored)
+            
+        Returns:
+            Templates found, in the order their IDs were given (missing IDs
+            are skipped; empty list on error)
+        """
+        unique_ids = list(dict.fromkeys(template_ids))
+        if not unique_ids:
+            return []
+        chunks = [
+            unique_ids[start:start + MAX_BATCH_GET_KEYS]
+            for start in range(0, len(unique_ids), MAX_BATCH_GET_KEYS)
+        ]
+        try:
+            results = await asyncio.gather(
+                *[asyncio.to_thread(self._batch_get_sync, chunk) for chunk in chunks]
+            )
+        except ClientError as e:
+            logger.error(
+                "Failed to get templates by IDs (DynamoDB error)",
+                extra={
+                    "count": len(unique_ids),
+                    "error_code": e.response.get("Error", {}).get("Code"),
+                    "error_message": str(e),
+                },
+            )
+            return []
+        except Exception as e:
+            logger.error(
+                "Failed to get templates by IDs (unexpected error)",
+                extra={"count": len(unique_ids), "error": str(e)},
+            )
+            return []
+        
+        by_id: Dict[str, PromptTemplate] = {}
+        for items in results:
+            for item in items:
+                template = PromptTemplate.from_dynamodb_item(item)
+                by_id[template.template_id] = template
+        return [by_id[tid] for tid in unique_ids if tid in by_id]
+
+    def _batch_get_sync(
+        self,
+        template_ids: List[str],
+        max_retries: int = 5,
+    ) -> List[dict]:
+        """Synchronous helper to fetch up to MAX_BATCH_GET_KEYS items.
+        
+        Unprocessed keys are retried with exponential backoff and jitter.
+        
+        Args:
+            template_ids: Template IDs to retrieve
+            max_retries: Retry attempts for unprocessed keys
+            
+        Returns:
+            List of DynamoDB items
+        """
+        request = {
+            self.table_name: {
+                "Keys": [_template_key(tid) for tid in template_ids]
+            }
+        }
+        items: List[dict] = []
+        for attempt in range(max_retries + 1):
+            response = self._client.batch_get_item(RequestItems=request)
+            items.extend(response.get("Responses", {}).get(self.table_name, []))
+            request = response.get("UnprocessedKeys") or {}
+            if not request:
+                return items
+            if attempt < max_retries:
+                # Exponential backoff with full jitter
+                time.sleep(random.uniform(0, 0.05 * (2 ** attempt)))
+        logger.warning(
+            "Unprocessed keys remain after retries",
+            extra={
+                "table_name": self.table_name,
+                "unprocessed": len(request.get(self.table_name, {}).get("Keys", [])),
+            },
+        )
+        return items
 
     async def create_template(
         self,
         title: str,
         description: str,
         prompt_detail: str,
+        sort_order: Optional[int] = None,
     ) -> Optional[PromptTemplate]:
         """Create a new prompt template.
         
@@ -154,17 +366,21 @@ class PromptTemplateStorageService:
             title: Display title for the template
             description: Brief description
             prompt_detail: The actual prompt text
+            sort_order: Display position; when omitted the template is
+                placed after the last one (see next_sort_order)
             
         Returns:
             Created PromptTemplate if successful, None otherwise
         """
         try:
             template_id = str(uuid.uuid4())
-            now = datetime.utcnow().isoformat()
+            now = utc_now_iso()
             
-            # Assign sort_order to max + 1 so new templates appear at the end
-            existing = await self.get_all_templates()
-            max_order = max((t.sort_order for t in existing), default=-1)
+            if sort_order is None:
+                sort_order = await self.next_sort_order()
+                if sort_order is None:
+                    # Error already logged; don't guess a position
+                    return None
             
             template = PromptTemplate(
                 template_id=template_id,
@@ -173,11 +389,10 @@ class PromptTemplateStorageService:
                 prompt_detail=prompt_detail,
                 created_at=now,
                 updated_at=now,
-                sort_order=max_order + 1,
+                sort_order=sort_order,
             )
             
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self._put_item_sync, template)
+            await asyncio.to_thread(self._put_item_sync, template)
             
             logger.info(
                 "Created prompt template",
@@ -236,7 +451,7 @@ class PromptTemplateStorageService:
             Created PromptTemplate if successful, None otherwise
         """
         try:
-            now = datetime.utcnow().isoformat()
+            now = utc_now_iso()
             template = PromptTemplate(
                 template_id=template_id,
                 title=title,
@@ -246,8 +461,7 @@ class PromptTemplateStorageService:
                 updated_at=now,
                 sort_order=sort_order,
             )
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self._put_item_sync, template)
+            await asyncio.to_thread(self._put_item_sync, template)
             logger.info(
                 "Created prompt template (with id)",
                 extra={"template_id": template_id, "title": title},
@@ -279,35 +493,26 @@ class PromptTemplateStorageService:
             Updated PromptTemplate if successful, None otherwise
         """
         try:
-            # First check if template exists
-            existing = await self.get_template_by_id(template_id)
-            if not existing:
+            item = await asyncio.to_thread(
+                self._update_item_sync,
+                template_id,
+                title,
+                description,
+                prompt_detail,
+                utc_now_iso(),
+            )
+            if item is None:
                 logger.warning(
                     "Template not found for update",
                     extra={"template_id": template_id},
                 )
                 return None
             
-            now = datetime.utcnow().isoformat()
-            
-            template = PromptTemplate(
-                template_id=template_id,
-                title=title,
-                description=description,
-                prompt_detail=prompt_detail,
-                created_at=existing.created_at,
-                updated_at=now,
-                sort_order=existing.sort_order,
-            )
-            
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self._put_item_sync, template)
-            
             logger.info(
                 "Updated prompt template",
                 extra={"template_id": template_id, "title": title},
             )
-            return template
+            return PromptTemplate.from_dynamodb_item(item)
         except ClientError as e:
             logger.error(
                 "Failed to update template (DynamoDB error)",
@@ -325,6 +530,50 @@ class PromptTemplateStorageService:
             )
             return None
 
+    def _update_item_sync(
+        self,
+        template_id: str,
+        title: str,
+        description: str,
+        prompt_detail: str,
+        updated_at: str,
+    ) -> Optional[dict]:
+        """Synchronous helper to update an existing template in one call.
+        
+        The condition on template_id replaces a separate existence check,
+        and created_at/sort_order are left untouched.
+        
+        Args:
+            template_id: The template ID to update
+            title: New display title
+            description: New description
+            prompt_detail: New prompt text
+            updated_at: ISO 8601 update timestamp
+            
+        Returns:
+            Updated DynamoDB item, or None if the template does not exist
+        """
+        try:
+            response = self._client.update_item(
+                TableName=self.table_name,
+                Key=_template_key(template_id),
+                UpdateExpression=_UPDATE_TEMPLATE_EXPRESSION,
+                ConditionExpression="attribute_exists(template_id)",
+                ExpressionAttributeNames=_UPDATE_TEMPLATE_NAMES,
+                ExpressionAttributeValues={
+                    ":title": {"S": title},
+                    ":description": {"S": description},
+                    ":prompt_detail": {"S": prompt_detail},
+                    ":updated_at": {"S": updated_at},
+                },
+                ReturnValues="ALL_NEW",
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+                return None
+            raise
+        return response.get("Attributes")
+
     async def delete_template(self, template_id: str) -> bool:
         """Delete a prompt template.
         
@@ -335,9 +584,8 @@ class PromptTemplateStorageService:
             True if deleted successfully, False otherwise
         """
         try:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None, self._delete_item_sync, template_id
+            await asyncio.to_thread(
+                self._delete_item_sync, template_id
             )
             
             logger.info(
@@ -370,7 +618,7 @@ class PromptTemplateStorageService:
         """
         self._client.delete_item(
             TableName=self.table_name,
-            Key={"template_id": {"S": template_id}},
+            Key=_template_key(template_id),
         )
 
     async def update_sort_order(self, template_id: str, sort_order: int) -> None:
@@ -381,9 +629,8 @@ class PromptTemplateStorageService:
             sort_order: New sort order value
         """
         try:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None, self._update_sort_order_sync, template_id, sort_order
+            await asyncio.to_thread(
+                self._update_sort_order_sync, template_id, sort_order
             )
         except Exception as e:
             logger.error(
@@ -400,7 +647,7 @@ class PromptTemplateStorageService:
         """
         self._client.update_item(
             TableName=self.table_name,
-            Key={"template_id": {"S": template_id}},
+            Key=_template_key(template_id),
             UpdateExpression="SET sort_order = :so",
             ExpressionAttributeValues={":so": {"N": str(sort_order)}},
         )
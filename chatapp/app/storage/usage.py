@@ -9,16 +9,25 @@ import asyncio
 import logging
 import os
 from datetime import datetime
+from itertools import chain
 from typing import List, Optional
 
-import boto3
-from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from app.models.usage import UsageRecord
+from app.storage._client import default_region, get_ddb_client
+from app.storage.batch_writer import get_batch_writer
 
 logger = logging.getLogger(__name__)
 
+# Table primary key (batched writes are deduped on it)
+_KEY_ATTRIBUTES = ("user_id", "timestamp")
+
+# Expression fragments shared by every query (built once, not per call)
+_TS_NAMES = {"#ts": "timestamp"}
+_USER_RANGE_KCE = "user_id = :uid AND #ts BETWEEN :start AND :end"
+_SESSION_KCE = "session_id = :sid"
+
 
 class UsageStorageService:
     """Async service for storing usage records in DynamoDB.
@@ -41,57 +50,41 @@ class UsageStorageService:
         
         Args:
             table_name: DynamoDB table name (defaults to USAGE_TABLE_NAME env var)
-            region: AWS region (defaults to AWS_REGION env var)
+            region: AWS region (defaults to default_region())
         """
         self.table_name = table_name or os.environ.get(
             "USAGE_TABLE_NAME", "agentcore-usage-records"
         )
-        self.region = region or os.environ.get("AWS_REGION", "us-east-1")
-        
-        # Configure boto3 client with retry settings
-        boto_config = Config(
-            region_name=self.region,
-            retries={"max_attempts": 3, "mode": "adaptive"},
-        )
+        self.region = region or default_region()
         
-        self._client = boto3.client("dynamodb", config=boto_config)
+        # Shared client (one connection pool per region)
+        self._client = get_ddb_client(self.region)
 
     async def store_usage(self, record: UsageRecord) -> None:
         """Store a usage record without blocking.
         
-        This method performs the storage operation asynchronously using
-        fire-and-forget pattern. Errors are logged but never raised to
-        ensure chat responses are not impacted.
+        The item is queued on the table's shared BatchWriter and written
+        with BatchWriteItem together with other pending records, so this
+        returns immediately. Errors are logged but never raised to ensure
+        chat responses are not impacted.
         
         Args:
             record: The usage record to store
         """
         try:
-            # Run the synchronous boto3 call in a thread pool
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                self._put_item,
-                record,
-            )
-            logger.info(
-                "Stored usage record",
-                extra={
-                    "user_id": record.user_id,
-                    "session_id": record.session_id,
-                    "total_tokens": record.total_tokens,
-                },
-            )
-        except ClientError as e:
-            logger.error(
-                "Failed to store usage record (DynamoDB error)",
-                extra={
-                    "user_id": record.user_id,
-                    "session_id": record.session_id,
-                    "error_code": e.response.get("Error", {}).get("Code"),
-                    "error_message": str(e),
-                },
+            queued = get_batch_writer(
+                self._client, self.table_name, key_attributes=_KEY_ATTRIBUTES
+            ).enqueue(
+                record.to_dynamodb_item()
             )
+            if not queued:
+                logger.error(
+                    "Failed to store usage record (buffer full)",
+                    extra={
+                        "user_id": record.user_id,
+                        "session_id": record.session_id,
+                    },
+                )
         except Exception as e:
             logger.error(
                 "Failed to store usage record (unexpected error)",
@@ -101,17 +94,6 @@ class UsageStorageService:
                     "error": str(e),
                 },
             )
-    
-    def _put_item(self, record: UsageRecord) -> None:
-        """Synchronous helper to put item in DynamoDB.
-        
-        Args:
-            record: The usage record to store
-        """
-        self._client.put_item(
-            TableName=self.table_name,
-            Item=record.to_dynamodb_item(),
-        )
 
     async def query_by_user(
         self,
@@ -130,9 +112,7 @@ class UsageStorageService:
             List of usage records for the user within the time range
         """
         try:
-            loop = asyncio.get_event_loop()
-            items = await loop.run_in_executor(
-                None,
+            items = await asyncio.to_thread(
                 self._query_by_user_sync,
                 user_id,
                 start_time.isoformat(),
@@ -175,22 +155,18 @@ class UsageStorageService:
         Returns:
             List of DynamoDB items
         """
-        items = []
         paginator = self._client.get_paginator("query")
-        
-        for page in paginator.paginate(
+        pages = paginator.paginate(
             TableName=self.table_name,
-            KeyConditionExpression="user_id = :uid AND #ts BETWEEN :start AND :end",
-            ExpressionAttributeNames={"#ts": "timestamp"},
+            KeyConditionExpression=_USER_RANGE_KCE,
+            ExpressionAttributeNames=_TS_NAMES,
             ExpressionAttributeValues={
                 ":uid": {"S": user_id},
                 ":start": {"S": start_time_iso},
                 ":end": {"S": end_time_iso},
             },
-        ):
-            items.extend(page.get("Items", []))
-        
-        return items
+        )
+        return list(chain.from_iterable(page.get("Items", []) for page in pages))
 
     async def query_by_session(self, session_id: str) -> List[UsageRecord]:
         """Query all usage records for a session.
@@ -204,9 +180,7 @@ class UsageStorageService:
             List of usage records for the session
         """
         try:
-            loop = asyncio.get_event_loop()
-            items = await loop.run_in_executor(
-                None,
+            items = await asyncio.to_thread(
                 self._query_by_session_sync,
                 session_id,
             )
@@ -240,17 +214,13 @@ class UsageStorageService:
         Returns:
             List of DynamoDB items
         """
-        items = []
         paginator = self._client.get_paginator("query")
-        
-        for page in paginator.paginate(
+        pages = paginator.paginate(
             TableName=self.table_name,
             IndexName="session-index",
-            KeyConditionExpression="session_id = :sid",
+            KeyConditionExpression=_SESSION_KCE,
             ExpressionAttributeValues={
                 ":sid": {"S": session_id},
             },
-        ):
-            items.extend(page.get("Items", []))
-        
-        return items
+        )
+        return list(chain.from_iterable(page.get("Items", []) for page in pages))
@@ -8,6 +8,10 @@ from pathlib import Path
 from fastapi.templating import Jinja2Templates
 
 from app.helpers.settings import (
+    DEFAULT_APP_SUBTITLE,
+    DEFAULT_APP_TITLE,
+    DEFAULT_CHAT_LOGO_URL,
+    DEFAULT_LOGO_URL,
     DEFAULT_PRIMARY_COLOR,
     DEFAULT_SECONDARY_COLOR,
     hex_to_rgb,
@@ -49,11 +53,28 @@ def _asset_version() -> str:
 templates.env.globals["asset_version"] = _asset_version
 
 
+# Fallback globals used when app settings can't be loaded (computed once)
+_DEFAULT_PALETTE = generate_color_palette(DEFAULT_PRIMARY_COLOR)
+_DEFAULT_GLOBALS = {
+    "app_title": DEFAULT_APP_TITLE,
+    "app_subtitle": DEFAULT_APP_SUBTITLE,
+    "logo_url": DEFAULT_LOGO_URL,
+    "chat_logo_url": DEFAULT_CHAT_LOGO_URL,
+    "primary_color": DEFAULT_PRIMARY_COLOR,
+    "secondary_color": DEFAULT_SECONDARY_COLOR,
+    "primary_rgb": hex_to_rgb(DEFAULT_PRIMARY_COLOR),
+    "secondary_rgb": hex_to_rgb(DEFAULT_SECONDARY_COLOR),
+    "primary_palette": _DEFAULT_PALETTE,
+    "secondary_palette": _DEFAULT_PALETTE,
+    "color_presets": {},
+}
+
+
 async def init_template_globals():
     """Initialize template global variables with app settings.
     
-    This should be called once at application startup to load settings
-    into the Jinja2 environment globals.
+    Called at application startup, and again after settings are saved
+    to refresh the globals (so it is deliberately not memoized).
     """
     from app.helpers import get_app_settings
     from app.helpers.model_catalog import load_catalog
@@ -69,18 +90,4 @@ async def init_template_globals():
         print(f"✓ Loaded app settings into templates: {settings.get('app_title')}, primary_color: {settings.get('primary_color')}")
     except Exception as e:
         print(f"Warning: Could not load app settings: {e}")
-        # Set defaults using centralized functions
-        default_palette = generate_color_palette(DEFAULT_PRIMARY_COLOR)
-        templates.env.globals.update({
-            "app_title": "Chat Agent",
-            "app_subtitle": "Bedrock Mantle | AgentCore | Strands",
-            "logo_url": "/static/favicon.svg",
-            "chat_logo_url": "/static/chat-placeholder.svg",
-            "primary_color": DEFAULT_PRIMARY_COLOR,
-            "secondary_color": DEFAULT_SECONDARY_COLOR,
-            "primary_rgb": hex_to_rgb(DEFAULT_PRIMARY_COLOR),
-            "secondary_rgb": hex_to_rgb(DEFAULT_SECONDARY_COLOR),
-            "primary_palette": default_palette,
-            "secondary_palette": default_palette,
-            "color_presets": {},
-        })
+        templates.env.globals.update(_DEFAULT_GLOBALS)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Backfill `date_partition` on usage-record and guardrail-violation items.
+
+Time-range reads query the `date-index` GSI, keyed on `date_partition`
+(the UTC date of `timestamp`). Records written before that attribute
+existed are not in the index, so once a range has any indexed records the
+older ones in it are no longer returned. This sets `date_partition` on
+every item that lacks it, so all records become visible to the index.
+
+SAFETY:
+  - Dry run by default: prints how many items WOULD be updated, writes nothing.
+  - Updates are conditional on `date_partition` still being absent, so
+    re-running (or running while the app writes new records) is harmless.
+  - Key schema is read from the live table (no hardcoded keys).
+
+Usage:
+  # Dry run (safe) - just counts items missing date_partition
+  python backfill_date_partition.py --region us-west-2 --profile <your-profile>
+
+  # Actually update
+  python backfill_date_partition.py --region us-west-2 --profile <your-profile> --execute
+
+  # Target specific tables (defaults to both)
+  python backfill_date_partition.py --tables htmx-chatapp-guardrail-violations --execute
+"""
+
+import argparse
+import sys
+
+import boto3
+from botocore.exceptions import ClientError
+
+DEFAULT_TABLES = [
+    "htmx-chatapp-usage-records",
+    "htmx-chatapp-guardrail-violations",
+]
+
+
+def get_key_names(client, table_name):
+    """Return the list of primary key attribute names for a table."""
+    desc = client.describe_table(TableName=table_name)
+    return [k["AttributeName"] for k in desc["Table"]["KeySchema"]]
+
+
+def iter_unpartitioned(client, table_name, key_names):
+    """Yield key + timestamp of every item without a date_partition."""
+    attributes = list(dict.fromkeys([*key_names, "timestamp"]))
+    names = {f"#{i}": a for i, a in enumerate(attributes)}
+    names["#dp"] = "date_partition"
+    paginator = client.get_paginator("scan")
+    for page in paginator.paginate(
+        TableName=table_name,
+        FilterExpression="attribute_not_exists(#dp)",
+        ProjectionExpression=", ".join(n for n in names if n != "#dp"),
+        ExpressionAttributeNames=names,
+    ):
+        yield from page.get("Items", [])
+
+
+def backfill(client, table_name, key_names, execute):
+    """Set date_partition on items missing it. Returns (found, updated)."""
+    found = updated = 0
+    for item in iter_unpartitioned(client, table_name, key_names):
+        found += 1
+        timestamp = item.get("timestamp", {}).get("S", "")
+        if not execute or not timestamp:
+            continue
+        try:
+            client.update_item(
+                TableName=table_name,
+                Key={k: item[k] for k in key_names},
+                UpdateExpression="SET #dp = :d",
+                ConditionExpression="attribute_not_exists(#dp)",
+                ExpressionAttributeNames={"#dp": "date_partition"},
+                ExpressionAttributeValues={":d": {"S": timestamp[:10]}},
+            )
+            updated += 1
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise
+    return found, updated
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Set date_partition on legacy records (dry run by default)."
+    )
+    parser.add_argument("--region", default="us-west-2", help="AWS region (default: us-west-2)")
+    parser.add_argument("--profile", default=None, help="AWS named profile to use")
+    parser.add_argument(
+        "--tables",
+        nargs="+",
+        default=DEFAULT_TABLES,
+        help=f"Tables to backfill (default: {' '.join(DEFAULT_TABLES)})",
+    )
+    parser.add_argument(
+        "--execute",
+        action="store_true",
+        help="Actually update items. Without this flag, runs a dry run (counts only).",
+    )
+    args = parser.parse_args()
+
+    session = boto3.Session(profile_name=args.profile, region_name=args.region)
+    client = session.client("dynamodb")
+
+    print(f"Region: {args.region} | Profile: {args.profile or '(default)'}\n")
+
+    for name in args.tables:
+        try:
+            key_names = get_key_names(client, name)
+            found, updated = backfill(client, name, key_names, args.execute)
+        except ClientError as e:
+            print(f"ERROR accessing table '{name}': {e.response['Error']['Message']}")
+            sys.exit(1)
+        if args.execute:
+            print(f"  - {name}: updated {updated} of {found} item(s)")
+        else:
+            print(f"  - {name}: {found} item(s) missing date_partition")
+
+    if not args.execute:
+        print("\nDRY RUN complete. No items were updated.")
+        print("Re-run with --execute to backfill the items above.")
+        return
+
+    print("\nDone.")
+
+
+if __name__ == "__main__":
+    main()
@@ -42,21 +42,12 @@ def get_key_names(client, table_name):
 
 
 def count_items(resource, table_name):
-    """Return an approximate item count via a projection-only scan."""
-    table = resource.Table(table_name)
-    key_names = get_key_names(table.meta.client, table_name)
-    proj = ", ".join(f"#{i}" for i in range(len(key_names)))
-    names = {f"#{i}": k for i, k in enumerate(key_names)}
-
-    count = 0
-    kwargs = {"ProjectionExpression": proj, "ExpressionAttributeNames": names}
-    while True:
-        resp = table.scan(**kwargs)
-        count += len(resp.get("Items", []))
-        if "LastEvaluatedKey" not in resp:
-            break
-        kwargs["ExclusiveStartKey"] = resp["LastEvaluatedKey"]
-    return count
+    """Return the item count via a paginated COUNT scan (no items returned)."""
+    paginator = resource.meta.client.get_paginator("scan")
+    return sum(
+        page.get("Count", 0)
+        for page in paginator.paginate(TableName=table_name, Select="COUNT")
+    )
 
 
 def delete_all_items(resource, table_name):
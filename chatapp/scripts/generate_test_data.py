@@ -3,7 +3,9 @@
 
 This script creates usage records, feedback, and guardrail violations.
 
-Configure as needed to determine the size of the test data set:
+The size of the test data set defaults to the constants below and can be
+changed per run with --num-users, --days-back, --conversations-per-day,
+--min-turns and --max-turns:
     NUM_USERS = 5
     DAYS_BACK = 7
     CONVERSATIONS_PER_DAY = 2
@@ -23,13 +25,17 @@ Environment variables (or use .env file):
 """
 
 import argparse
+import functools
 import json
 import os
+import queue
 import random
 import sys
-import uuid
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import Any, Dict, List, Optional
 
 import boto3
 from botocore.config import Config
@@ -38,15 +44,18 @@ from dotenv import load_dotenv
 # Load .env file if present
 load_dotenv()
 
-# Configuration
+# Default configuration (overridable from the command line)
 NUM_USERS = 5
 DAYS_BACK = 7
 CONVERSATIONS_PER_DAY = 2
 MIN_TURNS = 4
 MAX_TURNS = 10
 
+# Banner line for the run summary
+_SEPARATOR = "=" * 60
+
 # Possible model IDs
-MODELS = [
+MODELS = (
     "global.amazon.nova-2-lite-v1:0",
     "us.amazon.nova-pro-v1:0",
     "global.anthropic.claude-haiku-4-5-20251001-v1:0",
@@ -54,18 +63,18 @@ MODELS = [
     "global.anthropic.claude-sonnet-4-6",
     "global.anthropic.claude-opus-4-5-20251101-v1:0",
     "global.anthropic.claude-opus-4-6-v1",
-]
+)
 
 # Available tools (from agent/tools/)
-TOOLS = [
+TOOLS = (
     "knowledge_base_search",
     "fetch_url",
     "get_weather",
     "web_search",
-]
+)
 
 # Realistic conversation topics
-CONVERSATION_TOPICS = [
+CONVERSATION_TOPICS = (
     "weather forecast",
     "product documentation",
     "code review",
@@ -78,10 +87,10 @@ CONVERSATION_TOPICS = [
     "performance tuning",
     "error troubleshooting",
     "feature planning",
-]
+)
 
 # Sample user messages
-USER_MESSAGES = [
+USER_MESSAGES = (
     "What's the weather like in Seattle today?",
     "Can you help me understand how to use the API?",
     "I'm getting an error when deploying my application",
@@ -92,10 +101,10 @@ USER_MESSAGES = [
     "Help me debug this Python code",
     "What are the latest features in Bedrock?",
     "How do I set up CI/CD for my project?",
-]
+)
 
 # Sample assistant responses (truncated for storage)
-ASSISTANT_RESPONSES = [
+ASSISTANT_RESPONSES = (
     "Based on my search, here's what I found about your question...",
     "I've analyzed the documentation and can help you with that...",
     "Looking at the error message, it seems like the issue is...",
@@ -104,10 +113,10 @@ ASSISTANT_RESPONSES = [
     "Let me break down the solution step by step...",
     "According to the AWS documentation, you should...",
     "I've identified a few potential solutions for this problem...",
-]
+)
 
 # Guardrail violation types
-GUARDRAIL_FILTERS = [
+GUARDRAIL_FILTERS = (
     {"policy": "content", "type": "INSULTS"},
     {"policy": "content", "type": "HATE"},
     {"policy": "content", "type": "SEXUAL"},
@@ -115,41 +124,71 @@ GUARDRAIL_FILTERS = [
     {"policy": "topic", "type": "FINANCIAL_ADVICE"},
     {"policy": "sensitive_information", "type": "EMAIL"},
     {"policy": "sensitive_information", "type": "PHONE"},
-]
+)
 
 # Feedback comments
-POSITIVE_COMMENTS = [
+POSITIVE_COMMENTS = (
     "Very helpful response!",
     "Exactly what I needed",
     "Great explanation",
     "This solved my problem",
     None,  # No comment
     None,
-]
+)
 
-NEGATIVE_COMMENTS = [
+NEGATIVE_COMMENTS = (
     "Response was too vague",
     "Didn't answer my question",
     "Information seems outdated",
     "Could be more detailed",
     None,
     None,
-]
+)
+
+
+# Typed attribute values for the fixed vocabularies above, built once and
+# shared by every generated item (botocore serializes without mutating them)
+_MODEL_ATTRS = tuple({"S": model} for model in MODELS)
+_USER_MESSAGE_ATTRS = tuple({"S": message} for message in USER_MESSAGES)
+_ASSISTANT_RESPONSE_ATTRS = tuple({"S": response} for response in ASSISTANT_RESPONSES)
+_SENTIMENT_ATTRS = {
+    "positive": {"S": "positive"},
+    "negative": {"S": "negative"},
+}
+_SOURCE_ATTRS = ({"S": "INPUT"}, {"S": "OUTPUT"})
+_GUARDRAIL_ACTION_ATTR = {"S": "GUARDRAIL_INTERVENED"}
+_CONTENT_PREVIEW_ATTR = {"S": "User attempted to discuss restricted topic..."[:100]}
+
+# Compact JSON for embedded attributes, matching what the app writes (one
+# shared encoder; json.dumps would build a new one per call for these
+# separators)
+_dumps = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _random_uuid() -> str:
+    """Format 16 random bytes as a version 4 UUID string.
+    
+    Same output shape as str(uuid.uuid4()) at about a third of the cost,
+    since no UUID object is built.
+    """
+    h = os.urandom(16).hex()
+    variant = "89ab"[int(h[16], 16) & 3]
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{variant}{h[17:20]}-{h[20:]}"
 
 
 def generate_user_id() -> str:
     """Generate a UUID for user ID (simulates Cognito sub)."""
-    return str(uuid.uuid4())
+    return _random_uuid()
 
 
 def generate_session_id() -> str:
     """Generate a UUID for session ID."""
-    return str(uuid.uuid4())
+    return _random_uuid()
 
 
 def generate_message_id() -> str:
     """Generate a UUID for message ID."""
-    return str(uuid.uuid4())
+    return _random_uuid()
 
 
 def generate_email(index: int) -> str:
@@ -191,9 +230,10 @@ def generate_usage_record(
     user_email: str,
     session_id: str,
     timestamp: datetime,
+    tool_usage: Optional[Dict[str, Dict[str, int]]] = None,
 ) -> Dict[str, Any]:
-    """Generate a single usage record."""
-    model = random.choice(MODELS)
+    """Generate a single usage record (tool usage is generated if not given)."""
+    ts = timestamp.isoformat()
     
     # Realistic token counts
     input_tokens = random.randint(100, 2000)
@@ -203,19 +243,22 @@ def generate_usage_record(
     # Realistic latency (500ms to 15s)
     latency_ms = random.randint(500, 15000)
     
-    tool_usage = generate_tool_usage()
+    if tool_usage is None:
+        tool_usage = generate_tool_usage()
     
     return {
         "user_id": {"S": user_id},
-        "timestamp": {"S": timestamp.isoformat()},
+        "timestamp": {"S": ts},
         "session_id": {"S": session_id},
-        "model_id": {"S": model},
+        "model_id": random.choice(_MODEL_ATTRS),
         "input_tokens": {"N": str(input_tokens)},
         "output_tokens": {"N": str(output_tokens)},
         "total_tokens": {"N": str(total_tokens)},
         "latency_ms": {"N": str(latency_ms)},
-        "tool_usage": {"S": json.dumps(tool_usage)},
+        "tool_usage": {"S": _dumps(tool_usage)},
         "user_email": {"S": user_email},
+        # Partition key for the `date-index` GSI (UTC day, as the app writes it)
+        "date_partition": {"S": ts[:10]},
     }
 
 
@@ -226,7 +269,7 @@ def generate_feedback_record(
     tools_used: List[str],
 ) -> Dict[str, Any]:
     """Generate a feedback record."""
-    sentiment = random.choice(["positive", "negative"])
+    sentiment = random.choice(("positive", "negative"))
     
     if sentiment == "positive":
         comment = random.choice(POSITIVE_COMMENTS)
@@ -238,10 +281,10 @@ def generate_feedback_record(
         "timestamp": {"S": timestamp.isoformat()},
         "session_id": {"S": session_id},
         "message_id": {"S": generate_message_id()},
-        "user_message": {"S": random.choice(USER_MESSAGES)},
-        "assistant_response": {"S": random.choice(ASSISTANT_RESPONSES)},
-        "tools_used": {"S": json.dumps(tools_used)},
-        "sentiment": {"S": sentiment},
+        "user_message": random.choice(_USER_MESSAGE_ATTRS),
+        "assistant_response": random.choice(_ASSISTANT_RESPONSE_ATTRS),
+        "tools_used": {"S": _dumps(tools_used)},
+        "sentiment": _SENTIMENT_ATTRS[sentiment],
     }
     
     if comment:
@@ -250,80 +293,155 @@ def generate_feedback_record(
     return item
 
 
-def generate_guardrail_record(
-    user_id: str,
-    session_id: str,
-    timestamp: datetime,
-) -> Dict[str, Any]:
-    """Generate a guardrail violation record."""
-    source = random.choice(["INPUT", "OUTPUT"])
-    filter_info = random.choice(GUARDRAIL_FILTERS)
-    
-    # Build assessment structure
+@functools.lru_cache(maxsize=None)
+def _assessments_json(policy: str, filter_type: str, confidence: str, strength: str) -> str:
+    """Serialized assessments for a violation (a few dozen distinct shapes)."""
     assessment = {}
-    if filter_info["policy"] == "content":
+    if policy == "content":
         assessment["contentPolicy"] = {
             "filters": [{
-                "type": filter_info["type"],
-                "confidence": random.choice(["HIGH", "MEDIUM", "LOW"]),
-                "filterStrength": random.choice(["HIGH", "MEDIUM", "LOW"]),
+                "type": filter_type,
+                "confidence": confidence,
+                "filterStrength": strength,
                 "action": "BLOCKED",
             }]
         }
-    elif filter_info["policy"] == "topic":
+    elif policy == "topic":
         assessment["topicPolicy"] = {
             "topics": [{
-                "name": filter_info["type"],
+                "name": filter_type,
                 "type": "DENY",
                 "action": "BLOCKED",
             }]
         }
-    elif filter_info["policy"] == "sensitive_information":
+    elif policy == "sensitive_information":
         assessment["sensitiveInformationPolicy"] = {
             "piiEntities": [{
-                "type": filter_info["type"],
+                "type": filter_type,
                 "match": "[REDACTED]",
                 "action": "BLOCKED",
             }]
         }
+    return _dumps([assessment])
+
+
+def generate_guardrail_record(
+    user_id: str,
+    session_id: str,
+    timestamp: datetime,
+) -> Dict[str, Any]:
+    """Generate a guardrail violation record."""
+    ts = timestamp.isoformat()
+    filter_info = random.choice(GUARDRAIL_FILTERS)
     
-    content_preview = "User attempted to discuss restricted topic..."[:100]
+    confidence = strength = ""
+    if filter_info["policy"] == "content":
+        confidence = random.choice(("HIGH", "MEDIUM", "LOW"))
+        strength = random.choice(("HIGH", "MEDIUM", "LOW"))
+    assessments = _assessments_json(
+        filter_info["policy"], filter_info["type"], confidence, strength
+    )
     
     return {
         "user_id": {"S": user_id},
-        "timestamp": {"S": timestamp.isoformat()},
+        "timestamp": {"S": ts},
         "session_id": {"S": session_id},
-        "source": {"S": source},
-        "action": {"S": "GUARDRAIL_INTERVENED"},
-        "assessments": {"S": json.dumps([assessment])},
-        "content_preview": {"S": content_preview},
+        "source": random.choice(_SOURCE_ATTRS),
+        "action": _GUARDRAIL_ACTION_ATTR,
+        "assessments": {"S": assessments},
+        "content_preview": _CONTENT_PREVIEW_ATTR,
+        # Partition key for the `date-index` GSI
+        "date_partition": {"S": ts[:10]},
     }
 
 
-def batch_write_items(client, table_name: str, items: List[Dict[str, Any]]) -> int:
-    """Write items to DynamoDB in batches of 25."""
-    written = 0
+def _write_one_batch(client, table_name: str, batch: List[Dict[str, Any]]) -> int:
+    """Write one batch of up to 25 items, retrying unprocessed items."""
+    request_items = {
+        table_name: [{"PutRequest": {"Item": item}} for item in batch]
+    }
     
-    for i in range(0, len(items), 25):
-        batch = items[i:i + 25]
-        request_items = {
-            table_name: [{"PutRequest": {"Item": item}} for item in batch]
-        }
-        
-        response = client.batch_write_item(RequestItems=request_items)
-        written += len(batch)
-        
-        # Handle unprocessed items
+    response = client.batch_write_item(RequestItems=request_items)
+    
+    # Handle unprocessed items, backing off (full jitter, capped at 20 s)
+    # so throttled retries land after capacity recovers
+    unprocessed = response.get("UnprocessedItems", {})
+    attempt = 0
+    while unprocessed:
+        time.sleep(random.uniform(0, min(20.0, 0.05 * (2 ** attempt))))
+        attempt += 1
+        response = client.batch_write_item(RequestItems=unprocessed)
         unprocessed = response.get("UnprocessedItems", {})
-        while unprocessed:
-            response = client.batch_write_item(RequestItems=unprocessed)
-            unprocessed = response.get("UnprocessedItems", {})
-        
-        # Progress indicator
-        if written % 100 == 0:
-            print(f"  Written {written} items...")
     
-    return written
+    if attempt:
+        print(f"  Batch for {table_name} needed {attempt} retries (throttled)")
+    
+    return len(batch)
+
+
+class TableStreamWriter:
+    """Writes one table's items to DynamoDB while they are being generated.
+    
+    add() puts items on a bounded queue, blocking once ``max_pending`` items
+    are waiting, so generation never runs far ahead of the writes. A
+    consumer thread groups queued items into batches of 25 and submits them
+    to the shared executor; at most ``max_pending // 25`` batches are in
+    flight per table. Without a client (dry run) items are only counted.
+    """
+    
+    _DONE = object()
+    
+    def __init__(self, client, table_name: str, executor=None, max_pending: int = 1000):
+        self.table_name = table_name
+        self.generated = 0
+        self._client = client
+        self._executor = executor
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._slots = threading.BoundedSemaphore(max(1, max_pending // 25))
+        self._futures = []
+        self._thread = None
+        if client is not None:
+            self._thread = threading.Thread(target=self._consume, daemon=True)
+            self._thread.start()
+    
+    def add(self, item: Dict[str, Any]) -> None:
+        """Queue an item for writing (blocks while the queue is full)."""
+        self.generated += 1
+        if self._thread is not None:
+            self._queue.put(item)
+    
+    def _consume(self) -> None:
+        """Consumer thread: batch queued items and submit the batches."""
+        batch = []
+        while True:
+            item = self._queue.get()
+            if item is self._DONE:
+                break
+            batch.append(item)
+            if len(batch) == 25:
+                self._submit(batch)
+                batch = []
+        if batch:
+            self._submit(batch)
+    
+    def _submit(self, batch: List[Dict[str, Any]]) -> None:
+        """Hand a batch to the executor once an in-flight slot is free."""
+        self._slots.acquire()
+        future = self._executor.submit(_write_one_batch, self._client, self.table_name, batch)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append(future)
+    
+    def close(self) -> int:
+        """Flush the remaining items and wait for every batch to finish.
+        
+        Returns:
+            Number of items written (0 on a dry run)
+        """
+        if self._thread is None:
+            return 0
+        self._queue.put(self._DONE)
+        self._thread.join()
+        return sum(future.result() for future in self._futures)
 
 
 def generate_all_data(
@@ -333,17 +451,23 @@ def generate_all_data(
     guardrail_table: str,
     evaluations_table: str = "agentcore-evaluations",
     dry_run: bool = False,
+    workers: int = 32,
+    num_users: int = NUM_USERS,
+    days_back: int = DAYS_BACK,
+    conversations_per_day: int = CONVERSATIONS_PER_DAY,
+    min_turns: int = MIN_TURNS,
+    max_turns: int = MAX_TURNS,
 ):
     """Generate and write all test data."""
-    print(f"\n{'=' * 60}")
+    print(f"\n{_SEPARATOR}")
     print("Test Data Generator for Admin Dashboard")
-    print(f"{'=' * 60}")
+    print(_SEPARATOR)
     print(f"\nConfiguration:")
     print(f"  Region: {region}")
-    print(f"  Users: {NUM_USERS}")
-    print(f"  Days: {DAYS_BACK}")
-    print(f"  Conversations/day/user: {CONVERSATIONS_PER_DAY}")
-    print(f"  Turns per conversation: {MIN_TURNS}-{MAX_TURNS}")
+    print(f"  Users: {num_users}")
+    print(f"  Days: {days_back}")
+    print(f"  Conversations/day/user: {conversations_per_day}")
+    print(f"  Turns per conversation: {min_turns}-{max_turns}")
     print(f"\nTables:")
     print(f"  Usage: {usage_table}")
     print(f"  Feedback: {feedback_table}")
@@ -353,16 +477,9 @@ def generate_all_data(
     if dry_run:
         print(f"\n[DRY RUN] No data will be written")
     
-    # Initialize DynamoDB client
-    boto_config = Config(
-        region_name=region,
-        retries={"max_attempts": 3, "mode": "adaptive"},
-    )
-    client = boto3.client("dynamodb", config=boto_config)
-    
     # Generate user data
     users = []
-    for i in range(NUM_USERS):
+    for i in range(num_users):
         users.append({
             "user_id": generate_user_id(),
             "email": generate_email(i),
@@ -371,13 +488,32 @@ def generate_all_data(
     print(f"\nGenerated {len(users)} test users:")
     for u in users[:5]:
         print(f"  - {u['email']} ({u['user_id'][:8]}...)")
-    print(f"  ... and {len(users) - 5} more")
+    if len(users) > 5:
+        print(f"  ... and {len(users) - 5} more")
+    
+    # Records are streamed to DynamoDB as they are generated, so only a
+    # bounded number are held in memory at once
+    client = None
+    executor = None
+    if not dry_run:
+        # Initialize DynamoDB client only when writing; building it takes
+        # longer than generating the whole data set
+        boto_config = Config(
+            region_name=region,
+            # Bulk loads into on-demand tables get throttled while the
+            # table scales up, so retry harder than the app does
+            retries={"max_attempts": 10, "mode": "adaptive"},
+            # One pooled, kept-alive connection per concurrent batch writer
+            max_pool_connections=max(10, workers),
+            tcp_keepalive=True,
+        )
+        client = boto3.client("dynamodb", config=boto_config)
+        executor = ThreadPoolExecutor(max_workers=max(1, workers))
     
-    # Generate records
-    usage_records = []
-    feedback_records = []
-    guardrail_records = []
-    evaluation_records = []
+    usage_writer = TableStreamWriter(client, usage_table, executor)
+    feedback_writer = TableStreamWriter(client, feedback_table, executor)
+    guardrail_writer = TableStreamWriter(client, guardrail_table, executor)
+    evaluation_writer = TableStreamWriter(client, evaluations_table, executor)
     
     # Evaluator definitions for test data (binary pass/fail judges + programmatic)
     EVALUATORS = [
@@ -388,16 +524,16 @@ def generate_all_data(
     
     now = datetime.utcnow()
     
-    print(f"\nGenerating data for {DAYS_BACK} days...")
+    print(f"\nGenerating data for {days_back} days...")
     
-    for day_offset in range(DAYS_BACK, 0, -1):
+    for day_offset in range(days_back, 0, -1):
         day = now - timedelta(days=day_offset)
         
         for user in users:
             # Generate conversations for this user on this day
-            for conv_num in range(CONVERSATIONS_PER_DAY):
+            for conv_num in range(conversations_per_day):
                 session_id = generate_session_id()
-                num_turns = random.randint(MIN_TURNS, MAX_TURNS)
+                num_turns = random.randint(min_turns, max_turns)
                 
                 # Spread conversations throughout the day
                 hour = random.randint(8, 22)
@@ -410,18 +546,22 @@ def generate_all_data(
                     # Each turn is 30s to 5min apart, plus random microseconds for uniqueness
                     turn_offset = timedelta(
                         seconds=random.randint(30, 300) * turn,
-                        microseconds=random.randint(0, 999999)
+                        microseconds=random.randrange(1_000_000)
                     )
                     timestamp = conv_start + turn_offset
                     
                     # Generate usage record
+                    tool_usage = generate_tool_usage()
                     usage = generate_usage_record(
                         user["user_id"],
                         user["email"],
                         session_id,
                         timestamp,
+                        tool_usage,
                     )
-                    usage_records.append(usage)
+                    usage_writer.add(usage)
+                    # Reuse the record's ISO timestamp rather than formatting again
+                    ts = usage["timestamp"]["S"]
                     
                     # Generate evaluation records for this turn (one per evaluator)
                     turn_question = random.choice(USER_MESSAGES)
@@ -456,7 +596,7 @@ def generate_all_data(
                             label = random.choice(evaluator["labels"])
                         latency = random.randint(1, 50) if evaluator["type"] == "programmatic" else random.randint(500, 3000)
                         
-                        eval_ts = timestamp.isoformat() + f"#{evaluator['name']}"
+                        eval_ts = f"{ts}#{evaluator['name']}"
                         eval_record = {
                             "session_id": {"S": session_id},
                             "timestamp": {"S": eval_ts},
@@ -468,24 +608,23 @@ def generate_all_data(
                             "reason": {"S": f"Test data: {label} ({score:.3f})"},
                             "eval_type": {"S": evaluator["type"]},
                             "latency_ms": {"N": str(latency)},
-                            "model_id": {"S": random.choice(MODELS)},
+                            "model_id": random.choice(_MODEL_ATTRS),
                             "user_input": {"S": turn_question},
                             "judge_model_id": {"S": judge_model_id},
                             "input_tokens": {"N": str(input_tokens)},
                             "output_tokens": {"N": str(output_tokens)},
                             "cost": {"N": str(cost)},
                         }
-                        evaluation_records.append(eval_record)
+                        evaluation_writer.add(eval_record)
                     
                     # Track tools used
-                    tool_usage = json.loads(usage["tool_usage"]["S"])
-                    tools_used_in_session.update(tool_usage.keys())
+                    tools_used_in_session.update(tool_usage)
                 
                 # 30% chance of feedback per conversation
                 if random.random() < 0.3:
                     feedback_time = conv_start + timedelta(
                         minutes=random.randint(5, 30),
-                        microseconds=random.randint(0, 999999)
+                        microseconds=random.randrange(1_000_000)
                     )
                     feedback = generate_feedback_record(
                         user["user_id"],
@@ -493,53 +632,51 @@ def generate_all_data(
                         feedback_time,
                         list(tools_used_in_session),
                     )
-                    feedback_records.append(feedback)
+                    feedback_writer.add(feedback)
                 
                 # 5% chance of guardrail violation per conversation
                 if random.random() < 0.05:
                     violation_time = conv_start + timedelta(
                         minutes=random.randint(1, 10),
-                        microseconds=random.randint(0, 999999)
+                        microseconds=random.randrange(1_000_000)
                     )
                     violation = generate_guardrail_record(
                         user["user_id"],
                         session_id,
                         violation_time,
                     )
-                    guardrail_records.append(violation)
+                    guardrail_writer.add(violation)
     
     print(f"\nGenerated records:")
-    print(f"  Usage records: {len(usage_records)}")
-    print(f"  Feedback records: {len(feedback_records)}")
-    print(f"  Guardrail violations: {len(guardrail_records)}")
-    print(f"  Evaluation records: {len(evaluation_records)}")
+    print(f"  Usage records: {usage_writer.generated}")
+    print(f"  Feedback records: {feedback_writer.generated}")
+    print(f"  Guardrail violations: {guardrail_writer.generated}")
+    print(f"  Evaluation records: {evaluation_writer.generated}")
     
     if dry_run:
         print(f"\n[DRY RUN] Skipping database writes")
         return
     
-    # Write to DynamoDB
-    print(f"\nWriting to DynamoDB...")
+    # Wait for the remaining writes
+    print(f"\nFinishing writes to DynamoDB...")
     
-    print(f"\n  Writing usage records to {usage_table}...")
-    usage_written = batch_write_items(client, usage_table, usage_records)
-    print(f"  ✓ Wrote {usage_written} usage records")
+    usage_written = usage_writer.close()
+    print(f"  ✓ Wrote {usage_written} usage records to {usage_table}")
     
-    print(f"\n  Writing feedback records to {feedback_table}...")
-    feedback_written = batch_write_items(client, feedback_table, feedback_records)
-    print(f"  ✓ Wrote {feedback_written} feedback records")
+    feedback_written = feedback_writer.close()
+    print(f"  ✓ Wrote {feedback_written} feedback records to {feedback_table}")
     
-    print(f"\n  Writing guardrail records to {guardrail_table}...")
-    guardrail_written = batch_write_items(client, guardrail_table, guardrail_records)
-    print(f"  ✓ Wrote {guardrail_written} guardrail records")
+    guardrail_written = guardrail_writer.close()
+    print(f"  ✓ Wrote {guardrail_written} guardrail records to {guardrail_table}")
     
-    print(f"\n  Writing evaluation records to {evaluations_table}...")
-    eval_written = batch_write_items(client, evaluations_table, evaluation_records)
-    print(f"  ✓ Wrote {eval_written} evaluation records")
+    eval_written = evaluation_writer.close()
+    print(f"  ✓ Wrote {eval_written} evaluation records to {evaluations_table}")
     
-    print(f"\n{'=' * 60}")
+    executor.shutdown()
+    
+    print(f"\n{_SEPARATOR}")
     print("Data generation complete!")
-    print(f"{'=' * 60}")
+    print(_SEPARATOR)
     print(f"\nTotal records written: {usage_written + feedback_written + guardrail_written + eval_written}")
     print(f"\nTest users created (all @example.com):")
     for u in users:
@@ -575,6 +712,42 @@ def main():
         default=os.environ.get("EVALUATIONS_TABLE_NAME", "agentcore-evaluations"),
         help="Evaluations table name",
     )
+    parser.add_argument(
+        "--num-users",
+        type=int,
+        default=NUM_USERS,
+        help=f"Number of test users (default: {NUM_USERS})",
+    )
+    parser.add_argument(
+        "--days-back",
+        type=int,
+        default=DAYS_BACK,
+        help=f"Days of history to generate (default: {DAYS_BACK})",
+    )
+    parser.add_argument(
+        "--conversations-per-day",
+        type=int,
+        default=CONVERSATIONS_PER_DAY,
+        help=f"Conversations per user per day (default: {CONVERSATIONS_PER_DAY})",
+    )
+    parser.add_argument(
+        "--min-turns",
+        type=int,
+        default=MIN_TURNS,
+        help=f"Minimum turns per conversation (default: {MIN_TURNS})",
+    )
+    parser.add_argument(
+        "--max-turns",
+        type=int,
+        default=MAX_TURNS,
+        help=f"Maximum turns per conversation (default: {MAX_TURNS})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=32,
+        help="Concurrent BatchWriteItem calls (default: 32)",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -582,6 +755,8 @@ def main():
     )
     
     args = parser.parse_args()
+    if args.min_turns > args.max_turns:
+        parser.error("--min-turns must not exceed --max-turns")
     
     try:
         generate_all_data(
@@ -591,6 +766,12 @@ def main():
             guardrail_table=args.guardrail_table,
             evaluations_table=args.evaluations_table,
             dry_run=args.dry_run,
+            workers=args.workers,
+            num_users=args.num_users,
+            days_back=args.days_back,
+            conversations_per_day=args.conversations_per_day,
+            min_turns=args.min_turns,
+            max_turns=args.max_turns,
         )
     except Exception as e:
         print(f"\nError: {e}", file=sys.stderr)
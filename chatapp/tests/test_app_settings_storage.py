@@ -0,0 +1,165 @@
+"""Unit tests for the app settings storage read cache."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+import app.storage.app_settings as app_settings
+from app.models.app_settings import AppSetting
+from app.storage.app_settings import AppSettingsStorageService
+
+
+def _item(key, value):
+    """DynamoDB item for a text setting."""
+    return AppSetting(key, value, "text", "", "2024-01-01T00:00:00Z").to_dynamodb_item()
+
+
+class _FakeSettingsTable:
+    """Stand-in DynamoDB client for one settings table.
+
+    Writes land in ``items`` at once but only reach ``replica`` (what an
+    eventually consistent read sees) when sync() is called. Scans block on
+    ``release`` and set ``scanning`` once they have read the table.
+    """
+
+    def __init__(self, items):
+        self.items = {i["setting_key"]["S"]: i for i in items}
+        self.replica = dict(self.items)
+        self.scan_consistency = []
+        self.scanning = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def sync(self):
+        self.replica = dict(self.items)
+
+    def get_paginator(self, name):
+        return self
+
+    def paginate(self, **params):
+        self.scan_consistency.append(params["ConsistentRead"])
+        source = self.items if params["ConsistentRead"] else self.replica
+        items = list(source.values())
+        self.scanning.set()
+        self.release.wait(5)
+        return [{"Items": items}]
+
+    def put_item(self, TableName, Item):
+        self.items[Item["setting_key"]["S"]] = Item
+
+
+@pytest.fixture(autouse=True)
+def _reset_settings_cache():
+    """Each test starts with an empty module-level cache."""
+    yield
+    app_settings._SETTINGS_READ_CACHE.clear()
+    app_settings._REFRESH_TASKS.clear()
+    app_settings._SETTINGS_GENERATION.clear()
+    app_settings._CONSISTENT_REFRESH.clear()
+
+
+def _service(table):
+    with patch("app.storage.app_settings.get_ddb_client", return_value=table):
+        return AppSettingsStorageService(table_name="test-settings")
+
+
+class TestUpdateSettingReadYourWrites:
+    """Tests that this worker reads its own settings writes."""
+
+    async def test_cached_all_settings_include_update(self):
+        """Test that a warm get_all_settings cache reflects update_setting."""
+        table = _FakeSettingsTable([_item("app_name", "Old")])
+        service = _service(table)
+        await service.get_all_settings()
+
+        await service.update_setting("app_name", "New")
+        settings = await service.get_all_settings()
+
+        assert settings["app_name"].setting_value == "New"
+
+    async def test_first_scan_after_update_is_consistent(self):
+        """Test that the next full scan after a write can't miss it."""
+        table = _FakeSettingsTable([_item("app_name", "Old")])
+        service = _service(table)
+
+        await service.update_setting("app_name", "New")
+        settings = await service.get_all_settings()
+
+        assert settings["app_name"].setting_value == "New"
+        assert table.scan_consistency == [True]
+
+    async def test_later_scans_are_eventually_consistent(self):
+        """Test that ConsistentRead is only used for the first scan."""
+        table = _FakeSettingsTable([_item("app_name", "Old")])
+        service = _service(table)
+        await service.update_setting("app_name", "New")
+        await service.get_all_settings()
+        app_settings._SETTINGS_READ_CACHE.clear()
+
+        await service.get_all_settings()
+
+        assert table.scan_consistency == [True, False]
+
+
+async def _wait_for(event):
+    """Wait for a threading.Event without blocking the event loop."""
+    assert await asyncio.to_thread(event.wait, 5)
+
+
+class TestGetAllSettingsSingleFlight:
+    """Tests for the shared refresh behind get_all_settings."""
+
+    async def test_concurrent_cold_readers_share_one_scan(self):
+        """Test that concurrent readers of a cold cache trigger one scan."""
+        table = _FakeSettingsTable([_item("app_name", "Old")])
+        service = _service(table)
+
+        results = await asyncio.gather(
+            *(service.get_all_settings() for _ in range(10))
+        )
+
+        assert len(table.scan_consistency) == 1
+        assert all(r["app_name"].setting_value == "Old" for r in results)
+
+    async def test_expired_entry_served_stale_while_revalidating(self):
+        """Test that an expired entry is returned at once and refreshed once."""
+        table = _FakeSettingsTable([_item("app_name", "Old")])
+        service = _service(table)
+        await service.get_all_settings()
+        key = (service.table_name, app_settings._ALL_SETTINGS_KEY)
+        expired = (time.monotonic() - 1, app_settings._SETTINGS_READ_CACHE[key][1])
+        app_settings._SETTINGS_READ_CACHE[key] = expired
+        table.items["app_name"] = _item("app_name", "New")
+        table.sync()
+        table.release.clear()
+
+        results = await asyncio.gather(
+            *(service.get_all_settings() for _ in range(10))
+        )
+
+        assert all(r["app_name"].setting_value == "Old" for r in results)
+        table.release.set()
+        await asyncio.gather(*app_settings._REFRESH_TASKS.values())
+        assert len(table.scan_consistency) == 2
+        settings = await service.get_all_settings()
+        assert settings["app_name"].setting_value == "New"
+
+    async def test_update_during_refresh_is_not_lost(self):
+        """Test that a scan overlapped by update_setting is not cached."""
+        table = _FakeSettingsTable([_item("app_name", "Old")])
+        service = _service(table)
+        table.release.clear()
+
+        reader = asyncio.create_task(service.get_all_settings())
+        await _wait_for(table.scanning)
+        await service.update_setting("app_name", "New")
+        table.release.set()
+        settings = await reader
+
+        assert settings["app_name"].setting_value == "New"
+        assert table.scan_consistency == [False, True]
+        cached = await service.get_all_settings()
+        assert cached["app_name"].setting_value == "New"
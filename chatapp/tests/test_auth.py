@@ -9,6 +9,28 @@ import time
 import base64
 from unittest.mock import patch, MagicMock
 
+# Complete Cognito/AgentCore configuration for tests that load AppConfig
+_COGNITO_ENV = {
+    'COGNITO_USER_POOL_ID': 'us-east-1_testpool',
+    'COGNITO_CLIENT_ID': 'test-client-id',
+    'COGNITO_CLIENT_SECRET': 'test-client-secret',
+    'AGENTCORE_RUNTIME_ARN': 'arn:aws:bedrock:us-east-1:123456789:agent/test',
+    'AWS_REGION': 'us-east-1',
+    'MEMORY_ID': 'test-memory-id',
+    'APP_URL': 'http://localhost:8080',
+}
+
+
+@pytest.fixture
+def cognito_env():
+    """Replace os.environ with _COGNITO_ENV and reset the cached config."""
+    from app.config import get_config
+    
+    with patch.dict('os.environ', _COGNITO_ENV, clear=True):
+        get_config.cache_clear()
+        yield
+
+
 # Test configuration module
 class TestConfiguration:
     """Tests for configuration module."""
@@ -50,20 +72,9 @@ class TestConfiguration:
             "MEMORY_ID",
         ]
 
-    @patch.dict('os.environ', {
-        'COGNITO_USER_POOL_ID': 'us-east-1_testpool',
-        'COGNITO_CLIENT_ID': 'test-client-id',
-        'COGNITO_CLIENT_SECRET': 'test-client-secret',
-        'AGENTCORE_RUNTIME_ARN': 'arn:aws:bedrock:us-east-1:123456789:agent/test',
-        'AWS_REGION': 'us-east-1',
-        'MEMORY_ID': 'test-memory-id',
-    }, clear=True)
-    def test_valid_config_loads_successfully(self):
+    def test_valid_config_loads_successfully(self, cognito_env):
         """Test that valid configuration loads without error."""
-        from app.config import AppConfig, get_config
-        
-        # Clear the cache
-        get_config.cache_clear()
+        from app.config import AppConfig
         
         config = AppConfig.from_env()
         
@@ -78,22 +89,10 @@ class TestConfiguration:
 class TestCognitoAuth:
     """Tests for Cognito direct API authentication client."""
 
-    @patch.dict('os.environ', {
-        'COGNITO_USER_POOL_ID': 'us-east-1_testpool',
-        'COGNITO_CLIENT_ID': 'test-client-id',
-        'COGNITO_CLIENT_SECRET': 'test-client-secret',
-        'AGENTCORE_RUNTIME_ARN': 'arn:aws:bedrock:us-east-1:123456789:agent/test',
-        'AWS_REGION': 'us-east-1',
-        'MEMORY_ID': 'test-memory-id',
-        'APP_URL': 'http://localhost:8080',
-    }, clear=True)
-    def test_cognito_auth_initializes_with_config(self):
+    def test_cognito_auth_initializes_with_config(self, cognito_env):
         """Test that CognitoAuth initializes with configuration values."""
-        from app.config import get_config
         from app.auth.cognito import CognitoAuth
         
-        get_config.cache_clear()
-        
         auth = CognitoAuth()
         
         assert auth.user_pool_id == 'us-east-1_testpool'
@@ -101,22 +100,10 @@ class TestCognitoAuth:
         assert auth.client_secret == 'test-client-secret'
         assert auth.region == 'us-east-1'
 
-    @patch.dict('os.environ', {
-        'COGNITO_USER_POOL_ID': 'us-east-1_testpool',
-        'COGNITO_CLIENT_ID': 'test-client-id',
-        'COGNITO_CLIENT_SECRET': 'test-client-secret',
-        'AGENTCORE_RUNTIME_ARN': 'arn:aws:bedrock:us-east-1:123456789:agent/test',
-        'AWS_REGION': 'us-east-1',
-        'MEMORY_ID': 'test-memory-id',
-        'APP_URL': 'http://localhost:8080',
-    }, clear=True)
-    def test_cognito_auth_generates_secret_hash(self):
+    def test_cognito_auth_generates_secret_hash(self, cognito_env):
         """Test that CognitoAuth generates correct secret hash."""
-        from app.config import get_config
         from app.auth.cognito import CognitoAuth
         
-        get_config.cache_clear()
-        
         auth = CognitoAuth()
         secret_hash = auth._get_secret_hash("test@example.com")
         
@@ -128,22 +115,10 @@ class TestCognitoAuth:
 class TestJWTExtraction:
     """Tests for JWT user ID extraction."""
 
-    @patch.dict('os.environ', {
-        'COGNITO_USER_POOL_ID': 'us-east-1_testpool',
-        'COGNITO_CLIENT_ID': 'test-client-id',
-        'COGNITO_CLIENT_SECRET': 'test-client-secret',
-        'AGENTCORE_RUNTIME_ARN': 'arn:aws:bedrock:us-east-1:123456789:agent/test',
-        'AWS_REGION': 'us-east-1',
-        'MEMORY_ID': 'test-memory-id',
-        'APP_URL': 'http://localhost:8080',
-    }, clear=True)
-    def test_extract_user_id_from_valid_token(self):
+    def test_extract_user_id_from_valid_token(self, cognito_env):
         """Test extracting user ID from a valid JWT token."""
-        from app.config import get_config
         from app.auth.cognito import CognitoAuth, UserInfo
         
-        get_config.cache_clear()
-        
         # Mock the validate_token method to return expected user info
         with patch.object(CognitoAuth, 'validate_token') as mock_validate:
             mock_validate.return_value = UserInfo(
@@ -160,22 +135,10 @@ class TestJWTExtraction:
             user_id = extract_user_id(token)
             assert user_id == "user-123-abc"
 
-    @patch.dict('os.environ', {
-        'COGNITO_USER_POOL_ID': 'us-east-1_testpool',
-        'COGNITO_CLIENT_ID': 'test-client-id',
-        'COGNITO_CLIENT_SECRET': 'test-client-secret',
-        'AGENTCORE_RUNTIME_ARN': 'arn:aws:bedrock:us-east-1:123456789:agent/test',
-        'AWS_REGION': 'us-east-1',
-        'MEMORY_ID': 'test-memory-id',
-        'APP_URL': 'http://localhost:8080',
-    }, clear=True)
-    def test_extract_user_id_missing_sub_raises_error(self):
+    def test_extract_user_id_missing_sub_raises_error(self, cognito_env):
         """Test that missing sub claim raises TokenValidationError."""
-        from app.config import get_config
         from app.auth.cognito import CognitoAuth, TokenValidationError
         
-        get_config.cache_clear()
-        
         # Mock validate_token to raise TokenValidationError for missing sub
         with patch.object(CognitoAuth, 'validate_token') as mock_validate:
             mock_validate.side_effect = TokenValidationError("Token missing 'sub' claim")
@@ -189,6 +152,32 @@ class TestJWTExtraction:
             
             assert "sub" in str(exc_info.value)
 
+    def test_extract_user_id_caches_until_expiry(self, cognito_env):
+        """Test that a verified token is not re-validated until it expires."""
+        from app.auth.cognito import CognitoAuth, UserInfo, _USER_ID_CACHE
+        
+        def _b64(data: dict) -> str:
+            raw = json.dumps(data).encode()
+            return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+        
+        token = ".".join([
+            _b64({"alg": "RS256", "kid": "test-key-id"}),
+            _b64({"sub": "user-789", "exp": int(time.time()) + 3600}),
+            _b64({"sig": "unused"}),
+        ])
+        
+        with patch.object(CognitoAuth, 'validate_token') as mock_validate:
+            mock_validate.return_value = UserInfo(user_id="user-789")
+            
+            from app.auth.cognito import extract_user_id
+            
+            try:
+                assert extract_user_id(token) == "user-789"
+                assert extract_user_id(token) == "user-789"
+                assert mock_validate.call_count == 1
+            finally:
+                _USER_ID_CACHE.pop(token, None)
+
     def test_extract_user_id_invalid_token_raises_error(self):
         """Test that invalid token raises TokenValidationError."""
         from app.auth.cognito import extract_user_id, TokenValidationError
@@ -200,22 +189,10 @@ class TestJWTExtraction:
 class TestValidateToken:
     """Tests for token validation."""
 
-    @patch.dict('os.environ', {
-        'COGNITO_USER_POOL_ID': 'us-east-1_testpool',
-        'COGNITO_CLIENT_ID': 'test-client-id',
-        'COGNITO_CLIENT_SECRET': 'test-client-secret',
-        'AGENTCORE_RUNTIME_ARN': 'arn:aws:bedrock:us-east-1:123456789:agent/test',
-        'AWS_REGION': 'us-east-1',
-        'MEMORY_ID': 'test-memory-id',
-        'APP_URL': 'http://localhost:8080',
-    }, clear=True)
-    def test_validate_token_extracts_user_info(self):
+    def test_validate_token_extracts_user_info(self, cognito_env):
         """Test that validate_token extracts user info correctly."""
-        from app.config import get_config
         from app.auth.cognito import CognitoAuth, UserInfo
         
-        get_config.cache_clear()
-        
         auth = CognitoAuth()
         
         # Mock the internal methods to bypass JWKS validation
@@ -237,23 +214,11 @@ class TestValidateToken:
                     
                     assert user_info.user_id == "user-456-def"
 
-    @patch.dict('os.environ', {
-        'COGNITO_USER_POOL_ID': 'us-east-1_testpool',
-        'COGNITO_CLIENT_ID': 'test-client-id',
-        'COGNITO_CLIENT_SECRET': 'test-client-secret',
-        'AGENTCORE_RUNTIME_ARN': 'arn:aws:bedrock:us-east-1:123456789:agent/test',
-        'AWS_REGION': 'us-east-1',
-        'MEMORY_ID': 'test-memory-id',
-        'APP_URL': 'http://localhost:8080',
-    }, clear=True)
-    def test_validate_token_expired_raises_error(self):
+    def test_validate_token_expired_raises_error(self, cognito_env):
         """Test that expired token raises TokenExpiredError."""
-        from app.config import get_config
         from app.auth.cognito import CognitoAuth, TokenExpiredError
         from jose.exceptions import ExpiredSignatureError
         
-        get_config.cache_clear()
-        
         auth = CognitoAuth()
         
         # Mock the internal methods to simulate expired token
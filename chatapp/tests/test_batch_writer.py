@@ -0,0 +1,94 @@
+"""Unit tests for the coalescing DynamoDB batch writer."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+from botocore.exceptions import ClientError
+
+from app.storage.batch_writer import BatchWriter
+
+
+def _written_items(client):
+    """All items sent to batch_write_item, in call order."""
+    return [
+        request["PutRequest"]["Item"]
+        for call in client.batch_write_item.call_args_list
+        for requests in call.kwargs["RequestItems"].values()
+        for request in requests
+    ]
+
+
+class TestBatchWriterFlush:
+    """Tests for BatchWriter.flush on shutdown."""
+
+    async def test_flush_writes_partially_collected_batch(self):
+        """Test that items already taken off the queue are written on flush."""
+        client = MagicMock()
+        client.batch_write_item.return_value = {}
+        # Long delay so the background task is still collecting at flush time
+        writer = BatchWriter(client, "test-table", max_delay=10)
+        items = [{"id": {"S": str(i)}} for i in range(3)]
+
+        for item in items:
+            writer.enqueue(item)
+        # Let the background task move the items into its batch
+        await asyncio.sleep(0.01)
+
+        await writer.flush()
+
+        assert _written_items(client) == items
+        assert writer.written == 3
+        assert writer.failed == 0
+
+
+class TestBatchWriterRejectedBatch:
+    """Tests for batches rejected with a non-throttling error."""
+
+    def test_bad_item_does_not_fail_the_batch(self):
+        """Test that a rejected batch is retried item by item."""
+        client = MagicMock()
+        client.batch_write_item.side_effect = ClientError(
+            {"Error": {"Code": "ValidationException", "Message": "Item too large"}},
+            "BatchWriteItem",
+        )
+        too_large = {"id": {"S": "big"}}
+
+        def put_item(TableName, Item):
+            if Item is too_large:
+                raise ClientError(
+                    {"Error": {"Code": "ValidationException", "Message": "Item too large"}},
+                    "PutItem",
+                )
+            return {}
+
+        client.put_item.side_effect = put_item
+        writer = BatchWriter(client, "test-table")
+        items = [{"id": {"S": "a"}}, too_large, {"id": {"S": "b"}}]
+
+        writer._write_batch_sync(items)
+
+        assert client.batch_write_item.call_count == 1
+        assert [c.kwargs["Item"] for c in client.put_item.call_args_list] == items
+        assert writer.written == 2
+        assert writer.failed == 1
+
+
+class TestBatchWriterDedupe:
+    """Tests for primary-key deduplication within a batch."""
+
+    def test_duplicate_keys_keep_last_item(self):
+        """Test that only the last item per key is sent in a batch."""
+        client = MagicMock()
+        client.batch_write_item.return_value = {}
+        writer = BatchWriter(
+            client, "test-table", key_attributes=("user_id", "timestamp")
+        )
+        first = {"user_id": {"S": "u1"}, "timestamp": {"S": "t1"}, "n": {"N": "1"}}
+        other = {"user_id": {"S": "u2"}, "timestamp": {"S": "t1"}, "n": {"N": "2"}}
+        last = {"user_id": {"S": "u1"}, "timestamp": {"S": "t1"}, "n": {"N": "3"}}
+
+        writer._write_batch_sync([first, other, last])
+
+        assert _written_items(client) == [other, last]
+        assert writer.written == 3
+        assert writer.failed == 0
@@ -0,0 +1,37 @@
+"""Micro-benchmarks for per-request helper functions.
+
+Requires pytest-benchmark (skipped otherwise). Run only the benchmarks with:
+
+    pytest tests/test_benchmarks.py --benchmark-only
+
+Save a baseline with --benchmark-save=baseline and compare later runs with
+--benchmark-compare --benchmark-compare-fail=mean:10%.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from app.admin.cost_calculator import CostCalculator
+from app.helpers.settings import generate_color_palette
+
+
+def test_bench_calculate_cost(benchmark):
+    """Benchmark cost calculation for a fully-qualified Bedrock model id."""
+    calc = CostCalculator()
+
+    cost = benchmark(
+        calc.calculate_cost,
+        1_000_000,
+        500_000,
+        "global.anthropic.claude-haiku-4-5-20251001-v1:0",
+    )
+
+    assert cost == pytest.approx(3.50)
+
+
+def test_bench_generate_color_palette(benchmark):
+    """Benchmark palette generation from a base color."""
+    palette = benchmark(generate_color_palette, "#3b82f6")
+
+    assert palette["600"] == "#3b82f6"
@@ -8,46 +8,36 @@ from app.admin.cost_calculator import (
 )
 
 
-class TestCostCalculator:
-    """Tests for CostCalculator class."""
+@pytest.fixture(scope="class")
+def calc():
+    """CostCalculator with the default pricing table (read-only, so shared)."""
+    return CostCalculator()
 
-    def test_calculate_cost_known_model(self):
-        """Test cost calculation for a known model."""
-        calc = CostCalculator()
-        
-        # 1M input tokens, 500K output tokens with Claude Haiku
-        cost = calc.calculate_cost(
-            input_tokens=1_000_000,
-            output_tokens=500_000,
-            model_id="global.anthropic.claude-haiku-4-5-20251001-v1:0",
-        )
-        
-        # Expected: (1M / 1M * $1.00) + (500K / 1M * $5.00) = $1.00 + $2.50 = $3.50
-        assert cost == pytest.approx(3.50)
 
-    def test_calculate_cost_unknown_model_returns_zero(self):
-        """Test that unknown models return zero cost."""
-        calc = CostCalculator()
-        
-        cost = calc.calculate_cost(
-            input_tokens=1_000_000,
-            output_tokens=1_000_000,
-            model_id="unknown-model-id",
-        )
-        
-        assert cost == 0.0
+class TestCostCalculator:
+    """Tests for CostCalculator class."""
 
-    def test_calculate_cost_zero_tokens(self):
-        """Test cost calculation with zero tokens."""
-        calc = CostCalculator()
-        
+    @pytest.mark.parametrize(
+        "input_tokens,output_tokens,model_id,expected",
+        [
+            # Claude Haiku: (1M / 1M * $1.00) + (500K / 1M * $5.00) = $3.50
+            (1_000_000, 500_000, "global.anthropic.claude-haiku-4-5-20251001-v1:0", 3.50),
+            # Unknown models cost nothing
+            (1_000_000, 1_000_000, "unknown-model-id", 0.0),
+            # Zero tokens
+            (0, 0, "global.anthropic.claude-sonnet-4-5-20250929-v1:0", 0.0),
+        ],
+        ids=["known_model", "unknown_model_returns_zero", "zero_tokens"],
+    )
+    def test_calculate_cost(self, calc, input_tokens, output_tokens, model_id, expected):
+        """Test cost calculation with the default pricing table."""
         cost = calc.calculate_cost(
-            input_tokens=0,
-            output_tokens=0,
-            model_id="global.anthropic.claude-sonnet-4-5-20250929-v1:0",
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            model_id=model_id,
         )
         
-        assert cost == 0.0
+        assert cost == pytest.approx(expected)
 
     def test_calculate_cost_custom_pricing(self):
         """Test cost calculation with custom pricing."""
@@ -65,10 +55,8 @@ class TestCostCalculator:
         # Expected: (500K / 1M * $2.00) + (250K / 1M * $4.00) = $1.00 + $1.00 = $2.00
         assert cost == pytest.approx(2.0)
 
-    def test_calculate_monthly_projection(self):
+    def test_calculate_monthly_projection(self, calc):
         """Test monthly cost projection calculation."""
-        calc = CostCalculator()
-        
         # $100 over 10 days -> $10/day -> $200/month (20 business days)
         projection = calc.calculate_monthly_projection(
             total_cost=100.0,
@@ -77,10 +65,8 @@ class TestCostCalculator:
         
         assert projection == pytest.approx(200.0)
 
-    def test_calculate_monthly_projection_zero_days(self):
+    def test_calculate_monthly_projection_zero_days(self, calc):
         """Test monthly projection with zero days returns zero."""
-        calc = CostCalculator()
-        
         projection = calc.calculate_monthly_projection(
             total_cost=100.0,
             days_in_period=0,
@@ -88,19 +74,15 @@ class TestCostCalculator:
         
         assert projection == 0.0
 
-    def test_get_model_rates_known_model(self):
+    def test_get_model_rates_known_model(self, calc):
         """Test getting rates for a known model."""
-        calc = CostCalculator()
-        
         rates = calc.get_model_rates("anthropic.claude-haiku-4-5")
         
         assert rates["input"] == 1.00
         assert rates["output"] == 5.00
 
-    def test_get_model_rates_unknown_model(self):
+    def test_get_model_rates_unknown_model(self, calc):
         """Test getting rates for unknown model returns defaults."""
-        calc = CostCalculator()
-        
         rates = calc.get_model_rates("unknown-model")
         
         assert rates == DEFAULT_PRICING
@@ -0,0 +1,72 @@
+"""Unit tests for guardrail storage time-range reads."""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+from botocore.exceptions import ClientError
+
+from app.storage.guardrail import GuardrailStorageService
+
+_START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_END = datetime(2024, 1, 2, 23, 59, tzinfo=timezone.utc)
+
+
+def _client(query_pages, scan_items):
+    """Mock client with separate query and scan paginators.
+
+    ``query_pages`` holds the pages for each per-day query in turn, or is an
+    exception raised by paginate.
+    """
+    query = MagicMock()
+    query.paginate.side_effect = query_pages
+    scan = MagicMock()
+    scan.paginate.return_value = [{"Items": scan_items}]
+    client = MagicMock()
+    client.get_paginator.side_effect = {"query": query, "scan": scan}.get
+    return client, query, scan
+
+
+def _items(client):
+    with patch("app.storage.guardrail.get_ddb_client", return_value=client):
+        service = GuardrailStorageService(table_name="test-guardrail")
+    pages = service._time_range_pages(_START, _END, limit=100)
+    return [item for page in pages for item in page["Items"]]
+
+
+class TestTimeRangePages:
+    """Tests for the date-index query and its scan fallback."""
+
+    def test_index_results_skip_the_scan(self):
+        """Test that indexed records are returned without a scan."""
+        indexed = {"timestamp": {"S": "2024-01-01T12:00:00+00:00"}}
+        client, query, scan = _client([[{"Items": [indexed]}], []], [])
+
+        assert _items(client) == [indexed]
+        assert query.paginate.call_count == 2  # one query per UTC day
+        scan.paginate.assert_not_called()
+
+    def test_index_error_falls_back_to_scan(self):
+        """Test that a missing date-index degrades to a filtered scan."""
+        legacy = {"timestamp": {"S": "2024-01-01T12:00:00+00:00"}}
+        client, query, scan = _client(
+            ClientError(
+                {"Error": {"Code": "ValidationException", "Message": "no index"}},
+                "Query",
+            ),
+            [legacy],
+        )
+
+        assert _items(client) == [legacy]
+        kwargs = scan.paginate.call_args.kwargs
+        assert kwargs["FilterExpression"] == "#ts BETWEEN :start AND :end"
+        assert kwargs["ExpressionAttributeValues"][":start"] == {
+            "S": _START.isoformat()
+        }
+
+    def test_empty_index_falls_back_to_scan(self):
+        """Test that legacy-only ranges are still found by the scan."""
+        legacy = {"timestamp": {"S": "2024-01-02T08:00:00+00:00"}}
+        client, query, scan = _client([[{"Items": []}], []], [legacy])
+
+        assert _items(client) == [legacy]
+        scan.paginate.assert_called_once()
@@ -0,0 +1,55 @@
+"""Property-based tests for data model serialization.
+
+Requires hypothesis (in the dev extras; skipped otherwise).
+"""
+
+from dataclasses import replace
+
+import pytest
+
+pytest.importorskip("hypothesis")
+
+from hypothesis import given, settings, strategies as st
+
+from app.models.usage import ToolUsageRecord, UsageRecord
+
+_COUNTS = st.integers(min_value=0, max_value=10**9)
+
+_TOOL_USAGE_RECORDS = st.builds(
+    ToolUsageRecord,
+    call_count=_COUNTS,
+    success_count=_COUNTS,
+    error_count=_COUNTS,
+)
+
+# user_email is omitted from the item when empty, so "" reads back as None
+_USAGE_RECORDS = st.builds(
+    UsageRecord,
+    user_id=st.text(min_size=1),
+    timestamp=st.text(min_size=1),
+    session_id=st.text(min_size=1),
+    model_id=st.text(min_size=1),
+    input_tokens=_COUNTS,
+    output_tokens=_COUNTS,
+    total_tokens=_COUNTS,
+    latency_ms=st.integers(min_value=0, max_value=10**6),
+    tool_usage=st.dictionaries(st.text(min_size=1), _TOOL_USAGE_RECORDS, max_size=4),
+    user_email=st.none() | st.text(min_size=1),
+)
+
+
+class TestUsageRecordProperties:
+    """Round-trip properties for UsageRecord."""
+
+    @settings(max_examples=25)
+    @given(_USAGE_RECORDS)
+    def test_dynamodb_roundtrip(self, record):
+        """Test that any record survives to_dynamodb_item/from_dynamodb_item."""
+        assert UsageRecord.from_dynamodb_item(record.to_dynamodb_item()) == record
+
+    # The plain-dict form does not carry user_email
+    @settings(max_examples=25)
+    @given(_USAGE_RECORDS.map(lambda r: replace(r, user_email=None)))
+    def test_dict_roundtrip(self, record):
+        """Test that any record survives to_dict/from_dict."""
+        assert UsageRecord.from_dict(record.to_dict()) == record
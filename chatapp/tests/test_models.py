@@ -6,6 +6,39 @@ from app.models.usage import (
     UsageRecord,
     AggregateStats,
 )
+from app.models.feedback import FeedbackRecord
+from app.models.prompt_template import PromptTemplate, PromptTemplateSummary
+
+
+def _make_usage_record(**overrides) -> UsageRecord:
+    """Build a UsageRecord with every required field set."""
+    fields = dict(
+        user_id="user-roundtrip",
+        timestamp="2025-01-03T15:30:00",
+        session_id="session-rt",
+        model_id="test-model",
+        input_tokens=1000,
+        output_tokens=2000,
+        total_tokens=3000,
+        latency_ms=1500,
+    )
+    fields.update(overrides)
+    return UsageRecord(**fields)
+
+
+# Full DynamoDB item expected for the record in test_to_dynamodb_item
+_EXPECTED_USAGE_ITEM = {
+    "user_id": {"S": "user-123"},
+    "timestamp": {"S": "2025-01-03T10:00:00"},
+    "session_id": {"S": "session-456"},
+    "model_id": {"S": "claude-3"},
+    "input_tokens": {"N": "100"},
+    "output_tokens": {"N": "200"},
+    "total_tokens": {"N": "300"},
+    "latency_ms": {"N": "500"},
+    "tool_usage": {"S": "{}"},
+    "date_partition": {"S": "2025-01-03"},
+}
 
 
 class TestToolUsageRecord:
@@ -54,12 +87,7 @@ class TestUsageRecord:
             latency_ms=500,
         )
         
-        item = record.to_dynamodb_item()
-        
-        assert item["user_id"] == {"S": "user-123"}
-        assert item["timestamp"] == {"S": "2025-01-03T10:00:00"}
-        assert item["input_tokens"] == {"N": "100"}
-        assert item["output_tokens"] == {"N": "200"}
+        assert record.to_dynamodb_item() == _EXPECTED_USAGE_ITEM
 
     def test_from_dynamodb_item(self):
         """Test creation from DynamoDB item format."""
@@ -84,45 +112,23 @@ class TestUsageRecord:
 
     def test_dynamodb_roundtrip(self):
         """Test that DynamoDB serialization round-trips correctly."""
-        original = UsageRecord(
-            user_id="user-roundtrip",
-            timestamp="2025-01-03T15:30:00",
-            session_id="session-rt",
-            model_id="test-model",
-            input_tokens=1000,
-            output_tokens=2000,
-            total_tokens=3000,
-            latency_ms=1500,
+        original = _make_usage_record(
             tool_usage={
                 "web_search": ToolUsageRecord(call_count=3, success_count=2, error_count=1)
             },
         )
         
-        item = original.to_dynamodb_item()
-        restored = UsageRecord.from_dynamodb_item(item)
+        restored = UsageRecord.from_dynamodb_item(original.to_dynamodb_item())
         
-        assert restored.user_id == original.user_id
-        assert restored.input_tokens == original.input_tokens
-        assert restored.tool_usage["web_search"].call_count == 3
+        assert restored == original
 
     def test_to_dict_and_from_dict_roundtrip(self):
         """Test plain dict serialization round-trips correctly."""
-        original = UsageRecord(
-            user_id="user-dict",
-            timestamp="2025-01-03T16:00:00",
-            session_id="session-dict",
-            model_id="model-dict",
-            input_tokens=500,
-            output_tokens=1000,
-            total_tokens=1500,
-            latency_ms=800,
-        )
+        original = _make_usage_record()
         
-        data = original.to_dict()
-        restored = UsageRecord.from_dict(data)
+        restored = UsageRecord.from_dict(original.to_dict())
         
-        assert restored.user_id == original.user_id
-        assert restored.total_tokens == original.total_tokens
+        assert restored == original
 
 
 class TestAggregateStats:
@@ -142,3 +148,79 @@ class TestAggregateStats:
         assert result["total_input_tokens"] == 10000
         assert result["total_cost"] == 5.50
         assert result["invocation_count"] == 100
+
+
+class TestFeedbackRecordColumns:
+    """Tests for FeedbackRecord.columns_from_dynamodb_items."""
+
+    def test_columns_match_row_decoding(self):
+        """Columnar decoding yields the same values as per-row decoding."""
+        records = [
+            FeedbackRecord(
+                user_id="user-1",
+                timestamp="2025-01-03T10:00:00",
+                session_id="sess-1",
+                message_id="msg-1",
+                user_message="hi",
+                assistant_response="hello",
+                tools_used=["search"],
+                sentiment="positive",
+                user_comment="great",
+            ),
+            FeedbackRecord(
+                user_id="user-2",
+                timestamp="2025-01-03T11:00:00",
+                session_id="sess-2",
+                message_id="msg-2",
+                user_message="q",
+                assistant_response="a",
+                tools_used=[],
+                sentiment="negative",
+            ),
+        ]
+        items = [record.to_dynamodb_item() for record in records]
+        
+        columns = FeedbackRecord.columns_from_dynamodb_items(
+            items, ["sentiment", "tools_used", "user_comment"]
+        )
+        
+        assert columns == {
+            "sentiment": ["positive", "negative"],
+            "tools_used": [["search"], []],
+            "user_comment": ["great", None],
+        }
+
+    def test_missing_attributes_use_defaults(self):
+        """Projected-away attributes decode to from_dynamodb_item defaults."""
+        columns = FeedbackRecord.columns_from_dynamodb_items(
+            [{"user_id": {"S": "user-1"}}], ["timestamp", "tools_used"]
+        )
+        
+        assert columns == {"timestamp": [""], "tools_used": [[]]}
+
+
+class TestPromptTemplateSummary:
+    """Tests for PromptTemplateSummary."""
+    
+    def test_from_full_item_drops_prompt_detail(self):
+        """Test that a full item decodes to the same summary fields."""
+        template = PromptTemplate(
+            template_id="tpl-1",
+            title="Title",
+            description="Desc",
+            prompt_detail="A long prompt",
+            created_at="2025-01-01T00:00:00+00:00",
+            updated_at="2025-01-02T00:00:00+00:00",
+            sort_order=4,
+        )
+        
+        summary = PromptTemplateSummary.from_dynamodb_item(template.to_dynamodb_item())
+        
+        expected = template.to_dict()
+        del expected["prompt_detail"]
+        assert summary.to_dict() == expected
+    
+    def test_attributes_exclude_prompt_detail(self):
+        """Test that the projected attributes never include the prompt text."""
+        assert "prompt_detail" not in PromptTemplateSummary.ATTRIBUTES
+        assert "template_id" in PromptTemplateSummary.ATTRIBUTES
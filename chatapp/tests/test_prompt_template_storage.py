@@ -0,0 +1,180 @@
+"""Unit tests for the prompt template storage service."""
+
+from unittest.mock import MagicMock, patch
+
+from botocore.exceptions import ClientError
+
+from app.models.prompt_template import PromptTemplate
+from app.storage.prompt_template import (
+    MAX_BATCH_GET_KEYS,
+    PromptTemplateStorageService,
+)
+
+
+def _service(client):
+    with patch("app.storage.prompt_template.get_ddb_client", return_value=client):
+        return PromptTemplateStorageService(table_name="test-templates")
+
+
+def _scan_client(items):
+    """Mock client whose scan paginator returns ``items`` in one page."""
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.return_value = [{"Items": items}]
+    return client
+
+
+def _template_item(template_id):
+    return PromptTemplate(
+        template_id=template_id,
+        title=f"Title {template_id}",
+        description="",
+        prompt_detail="",
+        created_at="2024-01-01T00:00:00Z",
+        updated_at="2024-01-01T00:00:00Z",
+    ).to_dynamodb_item()
+
+
+class _BatchGetTable:
+    """batch_get_item stand-in over a fixed set of template IDs.
+
+    The first ``unprocessed_calls`` calls return their last key unprocessed.
+    """
+
+    def __init__(self, template_ids, unprocessed_calls=0):
+        self.template_ids = set(template_ids)
+        self.unprocessed_calls = unprocessed_calls
+        self.requested = []
+
+    def batch_get_item(self, RequestItems):
+        ((table_name, request),) = RequestItems.items()
+        keys = [key["template_id"]["S"] for key in request["Keys"]]
+        self.requested.append(keys)
+        unprocessed = []
+        if self.unprocessed_calls:
+            self.unprocessed_calls -= 1
+            keys, unprocessed = keys[:-1], keys[-1:]
+        response = {
+            "Responses": {
+                table_name: [
+                    _template_item(tid) for tid in keys if tid in self.template_ids
+                ]
+            }
+        }
+        if unprocessed:
+            response["UnprocessedKeys"] = {
+                table_name: {"Keys": [{"template_id": {"S": tid}} for tid in unprocessed]}
+            }
+        return response
+
+
+class TestNextSortOrder:
+    """Tests for PromptTemplateStorageService.next_sort_order."""
+
+    async def test_places_after_highest_sort_order(self):
+        """Test that the next position is one past the current maximum."""
+        client = _scan_client(
+            [{"sort_order": {"N": "3"}}, {"sort_order": {"N": "7"}}, {}]
+        )
+
+        assert await _service(client).next_sort_order() == 8
+        params = client.get_paginator.return_value.paginate.call_args.kwargs
+        assert list(params["ExpressionAttributeNames"].values()) == ["sort_order"]
+
+    async def test_empty_table_starts_at_zero(self):
+        """Test that the first template gets sort_order 0."""
+        assert await _service(_scan_client([])).next_sort_order() == 0
+
+    async def test_returns_none_on_error(self):
+        """Test that a failed read returns None rather than a guess."""
+        client = MagicMock()
+        client.get_paginator.side_effect = RuntimeError("boom")
+
+        assert await _service(client).next_sort_order() is None
+
+
+class TestUpdateTemplate:
+    """Tests for PromptTemplateStorageService.update_template."""
+
+    async def test_returns_updated_template(self):
+        """Test that the ALL_NEW attributes are returned as a template."""
+        stored = PromptTemplate(
+            template_id="t1",
+            title="New title",
+            description="New description",
+            prompt_detail="New prompt",
+            created_at="2024-01-01T00:00:00Z",
+            updated_at="2024-02-01T00:00:00Z",
+            sort_order=4,
+        )
+        client = MagicMock()
+        client.update_item.return_value = {"Attributes": stored.to_dynamodb_item()}
+
+        template = await _service(client).update_template(
+            "t1", "New title", "New description", "New prompt"
+        )
+
+        assert template == stored
+        kwargs = client.update_item.call_args.kwargs
+        assert kwargs["Key"] == {"template_id": {"S": "t1"}}
+        assert kwargs["ConditionExpression"] == "attribute_exists(template_id)"
+        assert kwargs["ReturnValues"] == "ALL_NEW"
+        assert kwargs["ExpressionAttributeValues"][":title"] == {"S": "New title"}
+
+    async def test_missing_template_returns_none(self):
+        """Test that a failed existence condition means "not found"."""
+        client = MagicMock()
+        client.update_item.side_effect = ClientError(
+            {"Error": {"Code": "ConditionalCheckFailedException", "Message": ""}},
+            "UpdateItem",
+        )
+
+        template = await _service(client).update_template(
+            "missing", "Title", "Description", "Prompt"
+        )
+
+        assert template is None
+        client.put_item.assert_not_called()
+
+
+class TestGetTemplatesByIds:
+    """Tests for PromptTemplateStorageService.get_templates_by_ids."""
+
+    async def test_requests_are_chunked(self):
+        """Test that keys are sent in chunks of at most MAX_BATCH_GET_KEYS."""
+        ids = [f"t{i}" for i in range(MAX_BATCH_GET_KEYS * 2 + 5)]
+        table = _BatchGetTable(ids)
+
+        templates = await _service(table).get_templates_by_ids(ids)
+
+        assert sorted(len(keys) for keys in table.requested) == [
+            5, MAX_BATCH_GET_KEYS, MAX_BATCH_GET_KEYS
+        ]
+        assert [t.template_id for t in templates] == ids
+
+    async def test_unprocessed_keys_are_retried(self):
+        """Test that UnprocessedKeys are requested again."""
+        table = _BatchGetTable(["a", "b", "c"], unprocessed_calls=2)
+
+        with patch("app.storage.prompt_template.time.sleep"):
+            templates = await _service(table).get_templates_by_ids(["a", "b", "c"])
+
+        assert table.requested == [["a", "b", "c"], ["c"], ["c"]]
+        assert [t.template_id for t in templates] == ["a", "b", "c"]
+
+    async def test_duplicate_and_missing_ids_are_dropped(self):
+        """Test that duplicates are fetched once and missing IDs skipped."""
+        table = _BatchGetTable(["a", "b"])
+
+        templates = await _service(table).get_templates_by_ids(
+            ["b", "missing", "a", "b"]
+        )
+
+        assert table.requested == [["b", "missing", "a"]]
+        assert [t.template_id for t in templates] == ["b", "a"]
+
+    async def test_empty_ids_make_no_request(self):
+        """Test that no IDs means no BatchGetItem call."""
+        table = _BatchGetTable([])
+
+        assert await _service(table).get_templates_by_ids([]) == []
+        assert table.requested == []
@@ -1,121 +1,175 @@
 """Unit tests for FastAPI routes."""
 
 import pytest
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi.testclient import TestClient
 
+# Stand-in for AppConfig (consumers only read attributes)
+_CONFIG = SimpleNamespace(
+    cognito_user_pool_id="test-pool",
+    cognito_client_id="test-client",
+    cognito_client_secret="test-secret",
+    aws_region="us-east-1",
+    agentcore_runtime_arn="arn:aws:test",
+    memory_id="test-memory",
+    app_url="http://localhost:8080",
+    usage_table_name=None,
+    feedback_table_name=None,
+    guardrail_table_name=None,
+    prompt_template_table_name=None,
+    app_settings_table_name=None,
+    runtime_usage_table_name=None,
+    dev_mode=False,
+)
+
+
+@pytest.fixture(scope="module")
+def fastapi_app():
+    """Import the FastAPI app once with config mocked (avoids env var requirements)."""
+    with patch("app.config.get_config") as mock_config:
+        mock_config.return_value = _CONFIG
+        from app.main import app
+        yield app
+
+
+@pytest.fixture(scope="module")
+def client(fastapi_app):
+    """Test client shared by the module's tests.
+
+    Not entered as a context manager, so the app lifespan (thread pool
+    setup and the DynamoDB template warm-up) does not run.
+    """
+    return TestClient(fastapi_app)
+
 
 class TestHealthEndpoint:
     """Tests for health check endpoint."""
 
-    def test_health_returns_200(self):
+    def test_health_returns_200(self, client):
         """Test that health endpoint returns 200 OK."""
-        # Mock config to avoid env var requirements
-        with patch("app.config.get_config") as mock_config:
-            mock_config.return_value = MagicMock(
-                cognito_user_pool_id="test-pool",
-                cognito_client_id="test-client",
-                cognito_client_secret="test-secret",
-                aws_region="us-east-1",
-                agentcore_runtime_arn="arn:aws:test",
-                memory_id="test-memory",
-                app_url="http://localhost:8080",
-                usage_table_name=None,
-                feedback_table_name=None,
-                guardrail_table_name=None,
-                prompt_template_table_name=None,
-                app_settings_table_name=None,
-                runtime_usage_table_name=None,
-                dev_mode=False,
-            )
-            from app.main import app
-            client = TestClient(app)
-            
-            response = client.get("/health")
-            
-            assert response.status_code == 200
-
-    def test_health_returns_status_healthy(self):
+        response = client.get("/health")
+
+        assert response.status_code == 200
+
+    def test_health_returns_status_healthy(self, client):
         """Test that health endpoint returns healthy status."""
-        with patch("app.config.get_config") as mock_config:
-            mock_config.return_value = MagicMock(
-                cognito_user_pool_id="test-pool",
-                cognito_client_id="test-client",
-                cognito_client_secret="test-secret",
-                aws_region="us-east-1",
-                agentcore_runtime_arn="arn:aws:test",
-                memory_id="test-memory",
-                app_url="http://localhost:8080",
-                usage_table_name=None,
-                feedback_table_name=None,
-                guardrail_table_name=None,
-                prompt_template_table_name=None,
-                app_settings_table_name=None,
-                runtime_usage_table_name=None,
-                dev_mode=False,
-            )
-            from app.main import app
-            client = TestClient(app)
-            
-            response = client.get("/health")
-            data = response.json()
-            
-            assert data["status"] == "healthy"
-
-    def test_health_includes_version(self):
+        response = client.get("/health")
+        data = response.json()
+
+        assert data["status"] == "healthy"
+
+    def test_health_includes_version(self, client):
         """Test that health endpoint includes version."""
-        with patch("app.config.get_config") as mock_config:
-            mock_config.return_value = MagicMock(
-                cognito_user_pool_id="test-pool",
-                cognito_client_id="test-client",
-                cognito_client_secret="test-secret",
-                aws_region="us-east-1",
-                agentcore_runtime_arn="arn:aws:test",
-                memory_id="test-memory",
-                app_url="http://localhost:8080",
-                usage_table_name=None,
-                feedback_table_name=None,
-                guardrail_table_name=None,
-                prompt_template_table_name=None,
-                app_settings_table_name=None,
-                runtime_usage_table_name=None,
-                dev_mode=False,
-            )
-            from app.main import app
-            client = TestClient(app)
-            
-            response = client.get("/health")
-            data = response.json()
-            
-            assert "version" in data
+        response = client.get("/health")
+        data = response.json()
+
+        assert "version" in data
 
 
 class TestRootRedirect:
     """Tests for root endpoint redirect."""
 
-    def test_root_redirects_to_chat(self):
+    def test_root_redirects_to_chat(self, client):
         """Test that root endpoint redirects to /chat."""
-        with patch("app.config.get_config") as mock_config:
-            mock_config.return_value = MagicMock(
-                cognito_user_pool_id="test-pool",
-                cognito_client_id="test-client",
-                cognito_client_secret="test-secret",
-                aws_region="us-east-1",
-                agentcore_runtime_arn="arn:aws:test",
-                memory_id="test-memory",
-                app_url="http://localhost:8080",
-                usage_table_name=None,
-                feedback_table_name=None,
-                guardrail_table_name=None,
-                prompt_template_table_name=None,
-                app_settings_table_name=None,
-                runtime_usage_table_name=None,
-                dev_mode=False,
-            )
-            from app.main import app
-            client = TestClient(app, follow_redirects=False)
-            
-            response = client.get("/")
-            
-            assert response.status_code == 302
-            assert response.headers["location"] == "/chat"
+        response = client.get("/", follow_redirects=False)
+
+        assert response.status_code == 302
+        assert response.headers["location"] == "/chat"
+
+
+@pytest.fixture
+def memory_client():
+    """Signed-in user with a mocked AgentCore MemoryClient.
+
+    Dev mode lets requests past the auth middleware; the route's own user
+    lookup is patched directly.
+    """
+    client = MagicMock()
+    client.get_events = AsyncMock(return_value=[])
+    client.get_semantic = AsyncMock(return_value=[])
+    dev_config = SimpleNamespace(
+        **{**vars(_CONFIG), "dev_mode": True, "dev_user_id": "user-1"}
+    )
+    with patch("app.auth.middleware.get_config", return_value=dev_config), patch(
+        "app.routes.memory._get_user_id_from_session", return_value="user-1"
+    ), patch("app.routes.memory._memory_client", return_value=client):
+        yield client
+
+
+class TestEventMemoryEndpoint:
+    """Tests for the /api/memory/events polling route."""
+
+    def test_valid_session_id_returns_200(self, client, memory_client):
+        """Test that a valid session ID returns the session's messages."""
+        response = client.get("/api/memory/events", params={"session_id": "abc-123"})
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "messages": [],
+            "sessionId": "abc-123",
+            "totalCount": 0,
+        }
+        memory_client.get_events.assert_awaited_once_with(
+            session_id="abc-123", user_id="user-1"
+        )
+
+    def test_missing_session_id_returns_400(self, client, memory_client):
+        """Test that a request without session_id is rejected."""
+        response = client.get("/api/memory/events")
+
+        assert response.status_code == 400
+        memory_client.get_events.assert_not_awaited()
+
+    def test_malformed_session_id_returns_400(self, client, memory_client):
+        """Test that a session ID outside the allowed characters is rejected."""
+        response = client.get("/api/memory/events", params={"session_id": "../x"})
+
+        assert response.status_code == 400
+        memory_client.get_events.assert_not_awaited()
+
+    def test_options_returns_204(self, client, memory_client):
+        """Test that the CORS preflight returns 204."""
+        response = client.options("/api/memory/events")
+
+        assert response.status_code == 204
+
+
+class TestAllSemanticMemoryEndpoint:
+    """Tests for the combined /api/memory/semantic/all route."""
+
+    def test_returns_all_three_types(self, client, memory_client):
+        """Test that facts, summaries and preferences come back in one call."""
+        from app.agentcore.memory import SemanticFact
+
+        def get_semantic(session_id, user_id, memory_type):
+            return [SemanticFact(f"{memory_type}-1", memory_type, None, "2024-01-01")]
+
+        memory_client.get_semantic.side_effect = get_semantic
+
+        response = client.get(
+            "/api/memory/semantic/all", params={"session_id": "abc-123"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data) == {"facts", "summaries", "preferences", "sessionId"}
+        assert data["sessionId"] == "abc-123"
+        for memory_type in ("facts", "summaries", "preferences"):
+            assert [item["id"] for item in data[memory_type]] == [f"{memory_type}-1"]
+        assert sorted(
+            call.kwargs["memory_type"]
+            for call in memory_client.get_semantic.await_args_list
+        ) == ["facts", "preferences", "summaries"]
+        for call in memory_client.get_semantic.await_args_list:
+            assert call.kwargs["session_id"] == "abc-123"
+            assert call.kwargs["user_id"] == "user-1"
+
+    def test_malformed_session_id_returns_400(self, client, memory_client):
+        """Test that the session ID is validated before any AgentCore call."""
+        response = client.get(
+            "/api/memory/semantic/all", params={"session_id": "../x"}
+        )
+
+        assert response.status_code == 400
+        memory_client.get_semantic.assert_not_awaited()
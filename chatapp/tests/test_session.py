@@ -1,8 +1,9 @@
 """Unit tests for session management."""
 
-import json
+import uuid
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import Mock
+from fastapi import Request, Response
 from app.session.manager import (
     SessionManager,
     ChatSession,
@@ -41,84 +42,105 @@ class TestChatSession:
         assert session.created_at == "2025-01-03T12:00:00"
 
 
+@pytest.fixture(scope="module")
+def manager():
+    """Default SessionManager (stateless, so shared by the module's tests)."""
+    return SessionManager()
+
+
+@pytest.fixture
+def response():
+    """Spec'd stand-in for a FastAPI Response."""
+    return Mock(spec=Response)
+
+
+@pytest.fixture
+def http_request():
+    """Spec'd stand-in for a FastAPI Request (configure cookies.get per test)."""
+    return Mock(spec=Request)
+
+
 class TestSessionManager:
     """Tests for SessionManager class."""
 
-    def test_generate_session_id_is_uuid(self):
-        """Test that generated session IDs are valid UUIDs."""
-        manager = SessionManager()
-        
+    def test_generate_session_id_is_uuid(self, manager):
+        """Test that generated session IDs are valid hex UUIDs."""
         session_id = manager.generate_session_id()
         
-        # UUID format: 8-4-4-4-12 hex chars
-        parts = session_id.split("-")
-        assert len(parts) == 5
-        assert len(parts[0]) == 8
+        # Hex format: 32 hex chars, no hyphens
+        assert len(session_id) == 32
+        assert uuid.UUID(hex=session_id).hex == session_id
 
-    def test_generate_session_id_is_unique(self):
+    def test_generate_session_id_is_unique(self, manager):
         """Test that generated session IDs are unique."""
-        manager = SessionManager()
+        ids = {manager.generate_session_id() for _ in range(100)}
         
-        ids = [manager.generate_session_id() for _ in range(100)]
-        
-        assert len(set(ids)) == 100
+        assert len(ids) == 100
 
-    def test_create_session_sets_cookie(self):
+    def test_create_session_sets_cookie(self, manager, response):
         """Test that create_session sets the session cookie."""
-        manager = SessionManager()
-        response = MagicMock()
-        
         session = manager.create_session(response)
         
-        response.set_cookie.assert_called_once()
-        call_kwargs = response.set_cookie.call_args.kwargs
-        assert call_kwargs["key"] == CHAT_SESSION_COOKIE_NAME
-        assert call_kwargs["httponly"] is True
+        response.set_cookie.assert_called_once_with(
+            key=CHAT_SESSION_COOKIE_NAME,
+            value=manager.encode_cookie(session),
+            httponly=True,
+            secure=True,
+            samesite="lax",
+            max_age=86400 * 7,
+            path="/",
+        )
 
-    def test_get_session_returns_none_without_cookie(self):
+    def test_get_session_returns_none_without_cookie(self, manager, http_request):
         """Test that get_session returns None when no cookie exists."""
-        manager = SessionManager()
-        request = MagicMock()
-        request.cookies.get.return_value = None
+        http_request.cookies.get.return_value = None
         
-        session = manager.get_session(request)
+        session = manager.get_session(http_request)
         
         assert session is None
 
-    def test_get_session_parses_valid_cookie(self):
+    def test_get_session_parses_valid_cookie(self, manager, http_request):
         """Test that get_session parses a valid session cookie."""
-        manager = SessionManager()
-        request = MagicMock()
+        cookie_session = ChatSession(
+            session_id="sess-from-cookie",
+            created_at="2025-01-03T10:00:00+00:00",
+            last_activity="2025-01-03T11:00:00+00:00",
+        )
+        http_request.cookies.get.return_value = manager.encode_cookie(cookie_session)
         
-        cookie_data = {
-            "session_id": "sess-from-cookie",
-            "created_at": "2025-01-03T10:00:00",
-            "last_activity": "2025-01-03T11:00:00",
-        }
-        request.cookies.get.return_value = json.dumps(cookie_data)
+        session = manager.get_session(http_request)
+        
+        assert session == cookie_session
+
+    def test_get_session_returns_none_for_invalid_cookie(self, manager, http_request):
+        """Test that get_session returns None for a malformed cookie."""
+        http_request.cookies.get.return_value = "not-a-valid-cookie"
         
-        session = manager.get_session(request)
+        session = manager.get_session(http_request)
         
-        assert session is not None
-        assert session.session_id == "sess-from-cookie"
+        assert session is None
 
-    def test_get_session_returns_none_for_invalid_json(self):
-        """Test that get_session returns None for invalid JSON."""
-        manager = SessionManager()
-        request = MagicMock()
-        request.cookies.get.return_value = "not-valid-json"
+    def test_get_session_rejects_tampered_cookie(self, http_request):
+        """Test that get_session rejects a cookie signed with another key."""
+        manager = SessionManager(signing_key=b"server-key")
+        forger = SessionManager(signing_key=b"attacker-key")
+        http_request.cookies.get.return_value = forger.encode_cookie(
+            ChatSession(
+                session_id="sess-forged",
+                created_at="2025-01-03T10:00:00+00:00",
+                last_activity="2025-01-03T11:00:00+00:00",
+            )
+        )
         
-        session = manager.get_session(request)
+        session = manager.get_session(http_request)
         
         assert session is None
 
-    def test_clear_session_deletes_cookie(self):
+    def test_clear_session_deletes_cookie(self, manager, response):
         """Test that clear_session deletes the cookie."""
-        manager = SessionManager()
-        response = MagicMock()
-        
         manager.clear_session(response)
         
-        response.delete_cookie.assert_called_once()
-        call_kwargs = response.delete_cookie.call_args.kwargs
-        assert call_kwargs["key"] == CHAT_SESSION_COOKIE_NAME
+        response.delete_cookie.assert_called_once_with(
+            key=CHAT_SESSION_COOKIE_NAME,
+            path="/",
+        )